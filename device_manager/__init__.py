@@ -1,11 +1,15 @@
-from device_manager.connection.adb_connection_discovery import (
-    AdbConnectionDiscovery,
-)
-from device_manager.connection.adb_pairing import AdbPairing
-from device_manager.device_actions import DeviceActions
-from device_manager.device_info import DeviceInfo
-from device_manager.manager import DeviceManager
-from device_manager.manager_singleton import DeviceManagerSingleton
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from device_manager.connection.adb_connection_discovery import (
+        AdbConnectionDiscovery,
+    )
+    from device_manager.connection.adb_pairing import AdbPairing
+    from device_manager.device_actions import DeviceActions
+    from device_manager.device_info import DeviceInfo
+    from device_manager.manager import DeviceManager
+    from device_manager.manager_singleton import DeviceManagerSingleton
 
 __all__ = [
     'DeviceManager',
@@ -15,3 +19,30 @@ __all__ = [
     'AdbPairing',
     'AdbConnectionDiscovery',
 ]
+
+# Module of each public class. The modules are only imported when the class is
+# first accessed, so importing a submodule, e.g. `device_manager.adb_executor`,
+# does not import zeroconf and the rest of the package.
+_LAZY_IMPORTS = {
+    'DeviceManager': 'device_manager.manager',
+    'DeviceManagerSingleton': 'device_manager.manager_singleton',
+    'DeviceActions': 'device_manager.device_actions',
+    'DeviceInfo': 'device_manager.device_info',
+    'AdbPairing': 'device_manager.connection.adb_pairing',
+    'AdbConnectionDiscovery': (
+        'device_manager.connection.adb_connection_discovery'
+    ),
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,14 +1,62 @@
+import logging
+import re
+import shlex
+import shutil
+import tarfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Union
+from typing import BinaryIO, Callable, List, Optional, Union
 
-from device_manager.adb_executor import execute_adb_command
+from device_manager.adb_client import AdbClient
 from device_manager.connection.device_connection import DeviceConnection
 from device_manager.enumerations.adb_keyevents import ADBKeyEvent
 from device_manager.enumerations.camera import CameraIntents
-from device_manager.utils.util_functions import grep
+from device_manager.exceptions import AdbServerError
+
+CAMERA_PICTURES_DIR = '/sdcard/DCIM/Camera'
+CAMERA_OPEN_DELAY = 1.0
+CAMERA_CAPTURE_DELAY = 0.3
+
+# Maximum number of camera actions running in the background, across all the
+# devices. The pool is shared by every `CameraActions`, so its threads are
+# bounded no matter how many devices are created, and are only started when an
+# action is submitted.
+CAMERA_ACTIONS_WORKERS = 16
+
+_OPEN_CAMERA = f'am start -a {CameraIntents.ACTION_STILL_IMAGE_CAMERA}'
+_OPEN_VIDEO_CAMERA = f'am start -a {CameraIntents.ACTION_VIDEO_CAMERA}'
+_CLOSE_CAMERA = 'am force-stop com.android.camera'
+_RESOLVE_CAMERA_PACKAGE = (
+    'cmd package resolve-activity --brief -a '
+    f'{CameraIntents.ACTION_IMAGE_CAPTURE}'
+)
+_PACKAGE_PATTERN = re.compile(r'(com\.[^\s/]+)/')
+_TAKE_PICTURE = f'input keyevent {ADBKeyEvent.KEYCODE_ENTER.value}'
+_CLEAR_PICTURES = f'rm -rf {CAMERA_PICTURES_DIR}/*'
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(
+    max_workers=CAMERA_ACTIONS_WORKERS,
+    thread_name_prefix='camera-actions',
+)
 
 
 class CameraActions:
+    """Class responsible for interacting with the camera application of a
+    single device. The commands are sent straight to the adb server socket,
+    through an `AdbClient`, instead of spawning an `adb` process per call.
+
+    Args:
+        device_connection (DeviceConnection): the `DeviceConnection` object.
+        serial_number (str): the serial number associated with the device.
+        subprocess_check_flag (bool): if True, a failed adb request raises
+            an `AdbServerError`. Otherwise, the failure is only logged.
+        comm_uri (str): the communication URI of the device.
+        validate_connection_callback (Callable[[], bool], optional): callback
+            used to validate the device connection before each action.
+    """
+
     def __init__(
         self,
         device_connection: DeviceConnection,
@@ -22,30 +70,54 @@ class CameraActions:
         self.subprocess_check_flag = subprocess_check_flag
         self.comm_uri = comm_uri
         self.validate_connection_callback = validate_connection_callback
+        self._adb = AdbClient()
+        self._package_cache: Optional[str] = None
+
+    def _shell(self, command: str, capture_output: bool = True) -> str:
+        """Executes a shell command on the device through the adb server.
+
+        Args:
+            command (str): The shell command to execute.
+            capture_output (bool, optional): If False, the command output is
+                discarded as it arrives. Defaults to True.
+
+        Returns:
+            str: The command output. Empty if it was not captured, or if the
+                request failed and the `subprocess_check_flag` is not set.
+        """
+        try:
+            return self._adb.shell(
+                self.comm_uri,
+                command,
+                capture_output=capture_output,
+            ).decode()
+        except AdbServerError as e:
+            if self.subprocess_check_flag:
+                raise
+            logger.warning(f'adb request failed for {self.comm_uri}: {e}')
+            return ''
 
     def open(self) -> None:
         """Opens the camera application."""
         if self.validate_connection_callback():
-            execute_adb_command(
-                command=f'am start -a {CameraIntents.ACTION_STILL_IMAGE_CAMERA}',  # noqa: E501
-                comm_uris=[self.comm_uri],
-                shell=True,
-                subprocess_check_flag=self.subprocess_check_flag,
-            )
+            self._shell(_OPEN_CAMERA, capture_output=False)
         else:
             raise RuntimeError(
                 'Device connection is not valid. Cannot open camera.',
             )
 
+    def open_async(self) -> Future:
+        """Opens the camera application without blocking the caller.
+
+        Returns:
+            Future: The future of the `open` call.
+        """
+        return _executor.submit(self.open)
+
     def open_video(self) -> None:
         """Opens the camera application in video mode."""
         if self.validate_connection_callback():
-            execute_adb_command(
-                command=f'am start -a {CameraIntents.ACTION_VIDEO_CAMERA}',
-                comm_uris=[self.comm_uri],
-                shell=True,
-                subprocess_check_flag=self.subprocess_check_flag,
-            )
+            self._shell(_OPEN_VIDEO_CAMERA, capture_output=False)
         else:
             raise RuntimeError(
                 'Device connection is not valid. Cannot open camera.',
@@ -54,44 +126,70 @@ class CameraActions:
     def close(self) -> None:
         """Closes the camera application."""
         if self.validate_connection_callback():
-            execute_adb_command(
-                command='am force-stop com.android.camera',
-                comm_uris=[self.comm_uri],
-                shell=True,
-                subprocess_check_flag=self.subprocess_check_flag,
-            )
+            self._shell(_CLOSE_CAMERA, capture_output=False)
         else:
             raise RuntimeError(
                 'Device connection is not valid. Cannot close camera.',
             )
 
-    def package(self) -> str:
-        """Returns the package name of the camera application."""
+    def package(self) -> Optional[str]:
+        """Returns the package name of the camera application, or None if
+        the device did not resolve any camera activity. The package is
+        resolved once and reused, see `refresh_package`."""
+        if self._package_cache is not None:
+            return self._package_cache
         if self.validate_connection_callback():
-            result = execute_adb_command(
-                command=f'cmd package resolve-activity --brief -a {CameraIntents.ACTION_IMAGE_CAPTURE}',  # noqa: E501
-                comm_uris=[self.comm_uri],
-                shell=True,
-                subprocess_check_flag=self.subprocess_check_flag,
-                capture_output=True,
-            ).stdout
-            activity = grep(result, 'com.(.*)/')[0].strip()
-            package = activity.split('/')[0]
-            return package
+            result = self._shell(_RESOLVE_CAMERA_PACKAGE)
+            match = _PACKAGE_PATTERN.search(result)
+            self._package_cache = match.group(1) if match else None
+            return self._package_cache
         else:
             raise RuntimeError(
                 'Device connection is not valid. Cannot get camera package.',
             )
 
+    def refresh_package(self) -> Optional[str]:
+        """Discards the cached camera package and resolves it again, e.g.
+        after the default camera application is changed.
+
+        Returns:
+            Optional[str]: The package name of the camera application.
+        """
+        self._package_cache = None
+        return self.package()
+
     def take_picture(self) -> None:
         """Takes a picture using the camera."""
         if self.validate_connection_callback():
-            execute_adb_command(
-                command=f'input keyevent {ADBKeyEvent.KEYCODE_ENTER.value}',
-                comm_uris=[self.comm_uri],
-                shell=True,
-                subprocess_check_flag=self.subprocess_check_flag,
+            self._shell(_TAKE_PICTURE, capture_output=False)
+        else:
+            raise RuntimeError(
+                'Device connection is not valid. Cannot take picture.',
             )
+
+    def take_picture_async(self) -> Future:
+        """Takes a picture using the camera without blocking the caller.
+
+        Returns:
+            Future: The future of the `take_picture` call.
+        """
+        return _executor.submit(self.take_picture)
+
+    def open_and_capture(self, amount: int = 1) -> None:
+        """Opens the camera application and takes pictures, sending the
+        whole sequence to the device as a single shell script.
+
+        Args:
+            amount (int): The number of pictures to take. Default is 1.
+        """
+        if self.validate_connection_callback():
+            commands = [
+                _OPEN_CAMERA,
+                f'sleep {CAMERA_OPEN_DELAY}',
+                f'for i in $(seq {int(amount)}); do '
+                f'{_TAKE_PICTURE}; sleep {CAMERA_CAPTURE_DELAY}; done',
+            ]
+            self._shell('; '.join(commands), capture_output=False)
         else:
             raise RuntimeError(
                 'Device connection is not valid. Cannot take picture.',
@@ -100,12 +198,7 @@ class CameraActions:
     def clear_pictures(self) -> None:
         """Clears the pictures from the device."""
         if self.validate_connection_callback():
-            execute_adb_command(
-                command='rm -rf /sdcard/DCIM/Camera/*',
-                comm_uris=[self.comm_uri],
-                shell=True,
-                subprocess_check_flag=self.subprocess_check_flag,
-            )
+            self._shell(_CLEAR_PICTURES, capture_output=False)
         else:
             raise RuntimeError(
                 'Device connection is not valid. Cannot clear pictures.',
@@ -117,6 +210,10 @@ class CameraActions:
         amount: int = 1,
     ) -> None:
         """Pulls the last taken pictures from the device to the local machine.
+        The pictures are listed first, then packed into a tar stream on the
+        device and unpacked locally, so a single transfer is needed for all
+        of them. Nothing is pulled if the pictures folder is empty or does
+        not exist.
 
         Args:
             destination (Union[str, Path]): The destination path on the local
@@ -124,34 +221,32 @@ class CameraActions:
             amount (int): The number of pictures to pull. Default is 1.
         """
         try:
-            if isinstance(destination, str):
-                destination = Path(destination)
-            if not destination.exists():
-                destination.mkdir(parents=True, exist_ok=True)
-            if not destination.is_dir():
-                raise ValueError(
-                    'Destination must be a directory.',
-                )
+            destination = Path(destination)
+            destination.mkdir(parents=True, exist_ok=True)
+        except FileExistsError as e:
+            raise RuntimeError(
+                'Failed to create destination directory: '
+                'Destination must be a directory.',
+            ) from e
         except Exception as e:
             raise RuntimeError(
                 f'Failed to create destination directory: {e}',
             ) from e
         try:
             if self.validate_connection_callback():
-                result = execute_adb_command(
-                    command='ls -t /sdcard/DCIM/Camera',
-                    comm_uris=[self.comm_uri],
-                    shell=True,
-                    subprocess_check_flag=self.subprocess_check_flag,
-                    capture_output=True,
+                pictures = self.__list_pictures(amount)
+                if not pictures:
+                    return
+                command = (
+                    f'cd {CAMERA_PICTURES_DIR} && tar -cf - '
+                    f'{" ".join(shlex.quote(name) for name in pictures)}'
                 )
-                files = result.stdout.splitlines()
-                files = files[:amount]
-                for file in files:
-                    execute_adb_command(
-                        command=f'pull /sdcard/DCIM/Camera/{file} {destination.resolve()}',  # noqa: E501
-                        comm_uris=[self.comm_uri],
-                        subprocess_check_flag=self.subprocess_check_flag,
+                with self._adb.exec_out(self.comm_uri, command) as stream:
+                    pulled = self.__extract_pictures(stream, destination)
+                missing = sorted(set(pictures) - set(pulled))
+                if missing:
+                    raise RuntimeError(
+                        f'pictures not sent by the device: {missing}',
                     )
             else:
                 raise RuntimeError(
@@ -161,3 +256,73 @@ class CameraActions:
             raise RuntimeError(
                 f'Failed to pull pictures: {e}',
             ) from e
+
+    def pull_pictures_async(
+        self,
+        destination: Union[str, Path],
+        amount: int = 1,
+    ) -> Future:
+        """Pulls the last taken pictures from the device without blocking
+        the caller.
+
+        Args:
+            destination (Union[str, Path]): The destination path on the local
+                machine.
+            amount (int): The number of pictures to pull. Default is 1.
+
+        Returns:
+            Future: The future of the `pull_pictures` call.
+        """
+        return _executor.submit(self.pull_pictures, destination, amount)
+
+    def __list_pictures(self, amount: int) -> List[str]:
+        """Lists the names of the last taken pictures on the device.
+
+        Args:
+            amount (int): The maximum number of pictures to list.
+
+        Raises:
+            RuntimeError: If the listing command fails on the device.
+
+        Returns:
+            List[str]: The picture names, newest first. Empty if the
+                pictures folder is empty or does not exist.
+        """
+        command = (
+            f'if [ -d {CAMERA_PICTURES_DIR} ]; then '
+            f'cd {CAMERA_PICTURES_DIR} && ls -t | head -n {int(amount)}; '
+            'fi; echo $?'
+        )
+        output = self._adb.shell(self.comm_uri, command)
+        lines = output.decode(errors='replace').splitlines()
+        status = lines.pop().strip() if lines else 'unknown'
+        if status != '0':
+            raise RuntimeError(
+                f'listing exited with status {status}: {" ".join(lines)}',
+            )
+        return [line for line in lines if line]
+
+    @staticmethod
+    def __extract_pictures(stream: BinaryIO, destination: Path) -> List[str]:
+        """Extracts the regular files of a tar stream into the destination
+        directory. Only the file names are kept, so no member can be written
+        outside of the destination.
+
+        Args:
+            stream (BinaryIO): The tar stream.
+            destination (Path): The destination directory.
+
+        Returns:
+            List[str]: The names of the extracted files.
+        """
+        extracted = []
+        with tarfile.open(fileobj=stream, mode='r|') as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+                source = tar.extractfile(member)
+                name = Path(member.name).name
+                with source, (destination / name).open('wb') as file:
+                    shutil.copyfileobj(source, file)
+                extracted.append(name)
+        return extracted
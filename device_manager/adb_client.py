@@ -0,0 +1,414 @@
+import socket
+from contextlib import contextmanager
+from typing import (
+    BinaryIO,
+    Dict,
+    Generator,
+    Optional,
+)
+
+from device_manager.exceptions import (
+    AdbServerError,
+    AdbServerUnreachableError,
+)
+from device_manager.utils.util_functions import parse_adb_devices
+
+ADB_SERVER_HOST = '127.0.0.1'
+ADB_SERVER_PORT = 5037
+DEFAULT_SOCKET_TIMEOUT = 10.0
+PING_TIMEOUT = 0.2
+
+_OKAY = b'OKAY'
+_FAIL = b'FAIL'
+_RECV_CHUNK_SIZE = 64 * 1024
+
+
+class AdbClient:
+    """Client that talks directly to the adb server through its TCP socket,
+    using the adb smart-socket protocol, instead of spawning the `adb`
+    executable for each command.
+
+    Every request is framed as a 4 hexadecimal digits length prefix followed
+    by the request itself, and is answered with an `OKAY` or `FAIL` status.
+    The adb server closes the connection once the requested service is done,
+    so a new local connection is opened for each request. This still avoids
+    the fork/exec of the `adb` client and its own handshake with the server.
+
+    Args:
+        host (str, optional): The adb server host. Defaults to '127.0.0.1'.
+        port (int, optional): The adb server port. Defaults to 5037.
+        timeout (float, optional): The socket timeout, in seconds.
+            Defaults to 10.0.
+
+    Methods:
+        version: Returns the adb server internal version.
+        ping: Checks if the adb server is running and answering requests.
+        pair: Pairs with a device using its pairing code.
+        devices: Returns the state of the devices known by the adb server.
+        connect: Connects to a device over the network.
+        disconnect: Disconnects from a device connected over the network.
+        kill: Kills the adb server.
+        tcpip: Restarts the adb daemon of a device listening on a TCP port.
+        shell: Executes a shell command on a device.
+        exec_out: Context manager to stream the raw output of a command.
+    """
+
+    def __init__(
+        self,
+        host: str = ADB_SERVER_HOST,
+        port: int = ADB_SERVER_PORT,
+        timeout: float = DEFAULT_SOCKET_TIMEOUT,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+    @staticmethod
+    def encode_request(request: str) -> bytes:
+        """Encodes a request using the adb smart-socket framing.
+
+        Args:
+            request (str): The request to encode, e.g. `host:version`.
+
+        Returns:
+            bytes: The length prefixed request.
+        """
+        data = request.encode()
+        return b'%04x%s' % (len(data), data)
+
+    def _connect(self, timeout: Optional[float] = None) -> socket.socket:
+        """Opens a new connection to the adb server.
+
+        Args:
+            timeout (Optional[float], optional): The socket timeout, in
+                seconds. Defaults to the client timeout.
+
+        Raises:
+            AdbServerUnreachableError: If the adb server is not reachable.
+
+        Returns:
+            socket.socket: The connected socket.
+        """
+        try:
+            return socket.create_connection(
+                (self.host, self.port),
+                timeout=self.timeout if timeout is None else timeout,
+            )
+        except OSError as e:
+            raise AdbServerUnreachableError(
+                f'adb server not reachable at {self.host}:{self.port}',
+            ) from e
+
+    @contextmanager
+    def _server_errors(self) -> Generator[None, None, None]:
+        """Context manager that turns the socket errors raised while talking
+        to an already connected adb server, e.g. a timeout or a reset
+        connection, into `AdbServerError`.
+
+        Raises:
+            AdbServerError: If the connection to the adb server fails.
+        """
+        try:
+            yield
+        except AdbServerError:
+            raise
+        except OSError as e:
+            raise AdbServerError(
+                f'adb server at {self.host}:{self.port} failed: {e}',
+            ) from e
+
+    @staticmethod
+    def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+        """Reads exactly `size` bytes from the socket.
+
+        Raises:
+            AdbServerError: If the connection is closed before all the
+                bytes are read.
+        """
+        buffer = bytearray()
+        while len(buffer) < size:
+            chunk = sock.recv(size - len(buffer))
+            if not chunk:
+                raise AdbServerError('adb server closed the connection')
+            buffer.extend(chunk)
+        return bytes(buffer)
+
+    @classmethod
+    def _read_payload(cls, sock: socket.socket) -> bytes:
+        """Reads a length prefixed payload sent by the adb server."""
+        size = int(cls._recv_exactly(sock, 4), 16)
+        return cls._recv_exactly(sock, size)
+
+    @classmethod
+    def _read_status(cls, sock: socket.socket) -> None:
+        """Reads the status of the last request.
+
+        Raises:
+            AdbServerError: If the adb server answered with `FAIL`.
+        """
+        status = cls._recv_exactly(sock, 4)
+        if status == _OKAY:
+            return
+        if status == _FAIL:
+            message = cls._read_payload(sock).decode(errors='replace')
+            raise AdbServerError(message)
+        raise AdbServerError(f'Unexpected adb server status: {status!r}')
+
+    def _send_request(self, sock: socket.socket, request: str) -> None:
+        """Sends a request through the socket and checks its status."""
+        sock.sendall(self.encode_request(request))
+        self._read_status(sock)
+
+    def _start_service(self, sock: socket.socket, request: str) -> None:
+        """Starts a device service, e.g. `shell:<command>`, and lets the
+        socket wait for its output without a timeout. The command may run
+        silently for longer than the client timeout, and the service ends
+        when the device closes the connection."""
+        self._send_request(sock, request)
+        sock.settimeout(None)
+
+    def _host_request(
+        self,
+        request: str,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        """Sends a `host:` request and returns its payload.
+
+        Args:
+            request (str): The request, e.g. `host:version`.
+            timeout (Optional[float], optional): The socket timeout, in
+                seconds. Defaults to the client timeout.
+
+        Raises:
+            AdbServerUnreachableError: If the adb server is not reachable.
+            AdbServerError: If the adb server refuses the request, or does
+                not answer it in time.
+
+        Returns:
+            bytes: The payload answered by the adb server.
+        """
+        with self._connect(timeout) as sock, self._server_errors():
+            self._send_request(sock, request)
+            return self._read_payload(sock)
+
+    def version(self, timeout: Optional[float] = None) -> int:
+        """Returns the internal version of the adb server.
+
+        Args:
+            timeout (Optional[float], optional): The socket timeout, in
+                seconds. Defaults to the client timeout.
+
+        Raises:
+            AdbServerError: If the adb server is not reachable, or does not
+                answer in time.
+
+        Returns:
+            int: The adb server internal version.
+        """
+        return int(self._host_request('host:version', timeout), 16)
+
+    def ping(self, timeout: float = PING_TIMEOUT) -> bool:
+        """Checks if the adb server is running and answering requests.
+
+        Args:
+            timeout (float, optional): The socket timeout, in seconds.
+                Defaults to 0.2.
+
+        Returns:
+            bool: True if the adb server answered, False otherwise.
+        """
+        try:
+            self.version(timeout)
+        except (AdbServerError, OSError, ValueError):
+            return False
+        return True
+
+    def pair(self, comm_uri: str, password: str) -> str:
+        """Pairs with a device through the adb server, the same as
+        `adb pair <comm_uri> <password>`.
+
+        Args:
+            comm_uri (str): The communication URI of the pairing service.
+            password (str): The pairing code.
+
+        Raises:
+            AdbServerError: If the adb server is not reachable, or refuses
+                the request.
+
+        Returns:
+            str: The pairing result message, e.g. `Successfully paired to
+                <comm_uri> [guid=...]`.
+        """
+        return self._host_request(f'host:pair:{password}:{comm_uri}').decode(
+            errors='replace',
+        )
+
+    def devices(self) -> Dict[str, str]:
+        """Returns the state of the devices known by the adb server, the same
+        as `adb devices`.
+
+        Raises:
+            AdbServerError: If the adb server is not reachable.
+
+        Returns:
+            Dict[str, str]: The state of each device (e.g. `device`,
+                `offline`, `unauthorized`), indexed by its serial or
+                communication URI.
+        """
+        return parse_adb_devices(
+            self._host_request('host:devices').decode(errors='replace'),
+        )
+
+    def connect(self, comm_uri: str) -> str:
+        """Connects to a device over the network, the same as
+        `adb connect <comm_uri>`.
+
+        Args:
+            comm_uri (str): The communication URI of the device.
+
+        Raises:
+            AdbServerError: If the adb server is not reachable, or refuses
+                the request.
+
+        Returns:
+            str: The connection result message, e.g. `connected to
+                <comm_uri>` or `failed to connect to <comm_uri>`.
+        """
+        return self._host_request(f'host:connect:{comm_uri}').decode(
+            errors='replace',
+        )
+
+    def disconnect(self, comm_uri: str) -> str:
+        """Disconnects from a device connected over the network, the same as
+        `adb disconnect <comm_uri>`.
+
+        Args:
+            comm_uri (str): The communication URI of the device.
+
+        Raises:
+            AdbServerError: If the adb server is not reachable, or refuses
+                the request, e.g. if the device is not connected.
+
+        Returns:
+            str: The disconnection result message, e.g. `disconnected
+                <comm_uri>`.
+        """
+        return self._host_request(f'host:disconnect:{comm_uri}').decode(
+            errors='replace',
+        )
+
+    def kill(self) -> None:
+        """Kills the adb server, the same as `adb kill-server`.
+
+        Raises:
+            AdbServerUnreachableError: If the adb server is not running.
+        """
+        with self._connect() as sock, self._server_errors():
+            self._send_request(sock, 'host:kill')
+
+    def _transport(self, serial: str) -> socket.socket:
+        """Opens a connection already switched to the given device, so the
+        next request is handled by the device itself.
+
+        Args:
+            serial (str): The device serial, or its communication URI.
+
+        Raises:
+            AdbServerError: If the adb server is not reachable, or refuses
+                the transport, e.g. if the device is offline.
+
+        Returns:
+            socket.socket: The socket bound to the device transport.
+        """
+        sock = self._connect()
+        try:
+            with self._server_errors():
+                self._send_request(sock, f'host:transport:{serial}')
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    def shell(
+        self,
+        serial: str,
+        command: str,
+        capture_output: bool = True,
+    ) -> bytes:
+        """Executes a shell command on the device.
+
+        Args:
+            serial (str): The device serial, or its communication URI.
+            command (str): The shell command to execute.
+            capture_output (bool, optional): If False, the command output is
+                drained and discarded. Defaults to True.
+
+        Raises:
+            AdbServerError: If the adb server is not reachable, refuses the
+                command, or the connection fails while it runs.
+
+        Returns:
+            bytes: The command output, or an empty bytes object if the output
+                was not captured.
+        """
+        with self._transport(serial) as sock, self._server_errors():
+            self._start_service(sock, f'shell:{command}')
+            output = bytearray()
+            chunk = sock.recv(_RECV_CHUNK_SIZE)
+            while chunk:
+                if capture_output:
+                    output.extend(chunk)
+                chunk = sock.recv(_RECV_CHUNK_SIZE)
+        return bytes(output)
+
+    def tcpip(self, serial: str, port: int) -> str:
+        """Restarts the adb daemon of the device listening on a TCP port, the
+        same as `adb -s <serial> tcpip <port>`.
+
+        Args:
+            serial (str): The device serial, or its communication URI.
+            port (int): The TCP port the device should listen on.
+
+        Raises:
+            AdbServerError: If the adb server is not reachable, or refuses
+                the request.
+
+        Returns:
+            str: The device answer, e.g. `restarting in TCP mode port: 5555`.
+        """
+        with self._transport(serial) as sock, self._server_errors():
+            self._start_service(sock, f'tcpip:{port}')
+            output = bytearray()
+            chunk = sock.recv(_RECV_CHUNK_SIZE)
+            while chunk:
+                output.extend(chunk)
+                chunk = sock.recv(_RECV_CHUNK_SIZE)
+        return output.decode(errors='replace')
+
+    @contextmanager
+    def exec_out(
+        self,
+        serial: str,
+        command: str,
+    ) -> Generator[BinaryIO, None, None]:
+        """Context manager that executes a command on the device and yields
+        its raw output as a binary stream, the same as `adb exec-out`. The
+        output is read as it arrives, without being buffered in memory.
+
+        Args:
+            serial (str): The device serial, or its communication URI.
+            command (str): The command to execute.
+
+        Raises:
+            AdbServerError: If the adb server is not reachable, or refuses
+                the command. Errors while reading the stream are raised as
+                `OSError`.
+
+        Yields:
+            Generator[BinaryIO, None, None]: The command output stream.
+        """
+        with self._transport(serial) as sock:
+            with self._server_errors():
+                self._start_service(sock, f'exec:{command}')
+            with sock.makefile('rb') as stream:
+                yield stream
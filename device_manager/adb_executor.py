@@ -1,43 +1,48 @@
+import os
+import shlex
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import CompletedProcess
-from typing import List
+from typing import List, Union
 
 
-def build_command_list(
-    base_command: List[str],
-    comm_uri_list: List[str],
-    custom_command: str,
+def build_argv(
+    comm_uri: str,
+    command: Union[str, List[str]],
+    shell: bool = False,
     **kwargs,
 ) -> List[str]:
-    """Builds a list of commands to be executed on multiple devices.
-    This method is used to build a list of commands that will be executed
-    on multiple devices. The command is built using the base command
-    provided, the list of communication URIs, the custom command to be
-    executed, and any additional arguments that should be added to the
-    command.
+    """Builds the argument list of an adb command for a single device, so
+    the command can be executed without the host shell.
+    A string command is split following the shell quoting rules, while the
+    arguments of a list command are kept as they are.
 
     Args:
-        base_command (List[str]): The base command to be executed.
-        comm_uri_list (List[str]): The list of communication URIs for the
-            devices.
-        custom_command (str): The custom command to be executed.
+        comm_uri (str): The communication URI of the device.
+        command (Union[str, List[str]]): The adb command, or its arguments.
+        shell (bool, optional): A flag to indicate if the command should
+            be executed as adb shell. Defaults to False.
         **kwargs: Additional arguments to be added to the command.
+
+    Returns:
+        List[str]: The argument list, starting with `adb`.
     """
-    command = base_command.copy()
-    command_as_list = custom_command.split(' ')
-    for idx, uri in enumerate(comm_uri_list):
-        command.extend(['-s', uri])
-        command.extend(command_as_list)
-        if idx < len(comm_uri_list) - 1:
-            command.extend(['&&', 'adb'])
-    if kwargs:
-        for key, value in kwargs.items():
-            command.extend([key, value])
-    return command
+    if isinstance(command, str):
+        command = shlex.split(command, posix=os.name != 'nt')
+    else:
+        command = list(command)
+    if command and command[0] == 'adb':
+        command = command[1:]
+    if shell and (not command or command[0] != 'shell'):
+        command = ['shell', *command]
+    argv = ['adb', '-s', comm_uri, *command]
+    for key, value in kwargs.items():
+        argv.extend([key, value])
+    return argv
 
 
 def execute_adb_command(
-    command: str,
+    command: Union[str, List[str]],
     comm_uris: List[str],
     shell: bool = False,
     subprocess_check_flag: bool = False,
@@ -51,13 +56,23 @@ def execute_adb_command(
 
     Passing a command such as `pull remote local` will produce the
     following command: `adb pull remote local`, applied with the
-    `-s` flag for each device.
+    `-s` flag for each device. The command is split following the shell
+    quoting rules, but it is executed without the host shell, so host shell
+    features, such as redirections, are not available.
+
+    The command can also be given as a list of arguments, such as
+    `['pull', remote, local]`. In this case the arguments are passed to adb
+    as they are, which is preferred for arguments with spaces.
+
+    Each device runs its own adb process, and the processes for multiple
+    devices run concurrently. Their results are merged into a single
+    `CompletedProcess`, with the outputs concatenated in the devices order.
 
     You can execute a command on a set of specific devices by providing
     the serial numbers as additional arguments.
 
     Args:
-        command (str): The adb command to execute.
+        command (Union[str, List[str]]): The adb command to execute.
         comm_uris (List[str]): The serial numbers of the
             devices to execute the command on.
         shell (bool, optional): A flag to indicate if the command should
@@ -75,23 +90,79 @@ def execute_adb_command(
     """
     if not comm_uris:
         raise ValueError('No devices specified for command execution.')
-    base_command = ['adb']
-    if command.startswith('adb'):
-        command = command[3:]
-    if shell:
-        if not command.startswith('shell'):
-            command = f'shell {command}'
-    adb_command_list = build_command_list(
-        base_command=base_command,
-        comm_uri_list=comm_uris,
-        custom_command=command,
-        **kwargs,
+    commands = [build_argv(uri, command, shell, **kwargs) for uri in comm_uris]
+
+    def run(argv: List[str]) -> CompletedProcess:
+        return subprocess.run(
+            argv,
+            check=subprocess_check_flag,
+            capture_output=capture_output,
+            text=capture_output if capture_output else None,
+        )
+
+    if len(commands) == 1:
+        return run(commands[0])
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        results = list(executor.map(run, commands))
+    return _merge_results(results)
+
+
+def _merge_results(results: List[CompletedProcess]) -> CompletedProcess:
+    """Merges the results of the per device processes into a single one.
+    The outputs are concatenated in the devices order, and the return code
+    is the first non zero return code, if any.
+
+    Args:
+        results (List[CompletedProcess]): The results of each device.
+
+    Returns:
+        CompletedProcess: The merged result.
+    """
+    returncode = next(
+        (result.returncode for result in results if result.returncode),
+        0,
+    )
+    outputs = [result.stdout for result in results]
+    errors = [result.stderr for result in results]
+    return CompletedProcess(
+        args=[result.args for result in results],
+        returncode=returncode,
+        stdout=None if None in outputs else ''.join(outputs),
+        stderr=None if None in errors else ''.join(errors),
     )
-    adb_command = ' '.join(adb_command_list)
-    return subprocess.run(
-        adb_command,
-        shell=True,
-        check=subprocess_check_flag,
+
+
+def execute_adb_command_batch(
+    commands: List[str],
+    comm_uris: List[str],
+    subprocess_check_flag: bool = False,
+    capture_output: bool = False,
+) -> CompletedProcess:
+    """Executes a sequence of shell commands on all connected devices,
+    using a single `adb shell` call per device.
+
+    The commands are joined with `;` and passed as a single argument, so
+    they run one after another on the device, and not on the host.
+
+    Args:
+        commands (List[str]): The shell commands to execute, in order.
+        comm_uris (List[str]): The serial numbers of the
+            devices to execute the commands on.
+        subprocess_check_flag (bool, optional): A flag to check if the
+            subprocess execution was successful, passed to the subprocess
+            `check` argument. Defaults to False.
+        capture_output (bool, optional): A flag to capture the output of
+            the commands. Defaults to False.
+
+    Returns:
+        CompletedProcess: The result of the commands execution.
+    """
+    if not commands:
+        raise ValueError('No commands specified for batch execution.')
+    script = '; '.join(commands)
+    return execute_adb_command(
+        command=['shell', script],
+        comm_uris=comm_uris,
+        subprocess_check_flag=subprocess_check_flag,
         capture_output=capture_output,
-        text=capture_output if capture_output else None,
     )
@@ -1,20 +1,46 @@
 import asyncio
+import atexit
 import logging
 import subprocess
-from typing import Optional, Sequence, Tuple, Union
-from weakref import finalize
+from contextlib import asynccontextmanager
+from threading import Lock
+from time import monotonic
+from typing import (
+    AbstractSet,
+    AsyncGenerator,
+    ClassVar,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from weakref import finalize, ref
 
 from zeroconf import InterfaceChoice, IPVersion, ServiceBrowser
 
 from device_manager.asyncio.async_mdns_listener import AsyncMDnsListener
 from device_manager.asyncio.async_zeroconf import AsyncZeroconf
-from device_manager.connection.adb_pairing import AdbPairing
+from device_manager.connection.adb_pairing import (
+    DEVICE_TO_PAIRING_TIMEOUT,
+    PAIRING_RETRY_DELAY,
+    AdbPairing,
+)
+from device_manager.exceptions import AdbServerError
 
 InterfacesType = Union[
     Sequence[Union[str, int, Tuple[Tuple[str, int, int], int]]],
     InterfaceChoice,
 ]  # noqa
 
+# Time, in seconds, during which a successfully paired communication URI is not
+# paired again.
+PAIRED_CACHE_TTL = 300.0
+
+# Default maximum number of `adb pair` processes running at the same time. The
+# adb server handles the requests of its clients one at a time, so too many
+# concurrent pairings only increase the latency of each one.
+MAX_CONCURRENT_PAIRINGS = 8
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +49,55 @@ class AsyncAdbPairing(AdbPairing):
     """AsyncAdbPairing class to pair with devices found by the mDNS listener.
     This class inherits from the AdbPairing class and provides an asynchronous
     implementation to pair with devices found by the mDNS listener.
+
+    With the default configuration, a single AsyncZeroconf instance is shared
+    by all the pairing sessions, and kept open until the process exits. Only
+    the ServiceBrowser is created and cancelled on each session.
+
+    The communication URIs successfully paired are remembered during
+    `PAIRED_CACHE_TTL` seconds, so checking them again does not spawn any
+    `adb pair` process. The pairing requests are sent straight to the adb
+    server socket, and an `adb pair` process is only spawned if the server
+    can not handle them.
+
+    Args:
+        max_concurrent_pairings (int, optional): The maximum number of
+            devices paired at the same time. Defaults to 8.
+
+    The remaining arguments are passed to the AdbPairing constructor.
     """
 
+    _shared_zc: ClassVar[Optional[AsyncZeroconf]] = None
+    _shared_zc_lock: ClassVar[Lock] = Lock()
+    _device_found: Optional[asyncio.Event] = None
+
+    @classmethod
+    def _shared_zeroconf(cls) -> AsyncZeroconf:
+        """Returns the AsyncZeroconf instance shared by the pairing sessions
+        with the default configuration, creating it on the first use.
+
+        Returns:
+            AsyncZeroconf: The shared AsyncZeroconf instance.
+        """
+        with cls._shared_zc_lock:
+            if cls._shared_zc is None or cls._shared_zc.zeroconf.done:
+                cls._shared_zc = AsyncZeroconf(
+                    interfaces=InterfaceChoice.Default,
+                    apple_p2p=False,
+                )
+                atexit.register(cls._shared_zc.zeroconf.close)
+            return cls._shared_zc
+
+    def __init__(
+        self,
+        *args,
+        max_concurrent_pairings: int = MAX_CONCURRENT_PAIRINGS,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._paired_cache: Dict[str, float] = dict()
+        self._max_concurrent_pairings = max_concurrent_pairings
+
     def _new_zeroconf_instance(
         self,
         interfaces: InterfacesType = InterfaceChoice.Default,
@@ -33,7 +106,8 @@ class AsyncAdbPairing(AdbPairing):
     ):
         """Instantiates a new AsyncZeroconf instance with the given arguments.
         It uses the base class Zeroconf instance to create the new
-        asynchronous Zeroconf instance.
+        asynchronous Zeroconf instance. With the default arguments, the
+        shared instance is used instead.
 
         Args:
             interfaces (InterfacesType, optional): The interfaces to listen to.
@@ -43,6 +117,13 @@ class AsyncAdbPairing(AdbPairing):
             ip_version (Optional[IPVersion], optional): The IP version to use.
                 Defaults to None.
         """
+        if (
+            interfaces == InterfaceChoice.Default
+            and not unicast
+            and ip_version is None
+        ):
+            self._zeroconf = self._shared_zeroconf()
+            return
         super()._new_zeroconf_instance(interfaces, unicast, ip_version)
         old_instance = self._zeroconf
         self._zeroconf = AsyncZeroconf(
@@ -78,10 +159,11 @@ class AsyncAdbPairing(AdbPairing):
         """
         if not self._started:
             self._new_zeroconf_instance(
-                interfaces=interfaces,
+                interfaces=self._resolve_interfaces(interfaces),
                 unicast=unicast,
                 ip_version=ip_version,
             )
+            self._device_found = asyncio.Event()
             try:
                 self._browser = ServiceBrowser(
                     self._zeroconf,
@@ -90,6 +172,8 @@ class AsyncAdbPairing(AdbPairing):
                         self._context,
                         self._service_re_filter,
                         self._service_type,
+                        found_event=self._device_found,
+                        loop=asyncio.get_running_loop(),
                     ),
                 )
             except RuntimeError as e:
@@ -97,22 +181,122 @@ class AsyncAdbPairing(AdbPairing):
                     'Maximum number of Zeroconf instances reached.'
                 ) from e
 
-            def atexit() -> None:
-                logger.debug('Finalizing Zeroconf instance.')
-                self._browser = None
-                self._started = False
-
-            self._finalize = finalize(self._zeroconf, atexit)
+            self._finalize = finalize(
+                self._zeroconf,
+                self._zeroconf_finalized,
+                ref(self),
+            )
             self._started = True
             self._browser._async_start()
-            asyncio.sleep(5)
+
+    async def wait_for_device_to_pairing(
+        self,
+        timeout: float = DEVICE_TO_PAIRING_TIMEOUT,
+    ) -> bool:
+        """Waits until the mDNS listener finds a device to pair, without
+        polling. It returns as soon as the first device shows up.
+
+        Args:
+            timeout (float, optional): The maximum time to wait, in seconds.
+                Defaults to 5.0.
+
+        Returns:
+            bool: True if there is a device to pair, False otherwise.
+        """
+        if self.has_device_to_pairing():
+            return True
+        if self._device_found is None:
+            return False
+        try:
+            await asyncio.wait_for(self._device_found.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
 
     async def stop_pair_listener(self) -> None:
-        """Stop the ServiceBrowser and close the Zerconf instance."""
-        await self._zeroconf._async_close()
+        """Stop the ServiceBrowser. The Zeroconf instance is closed, unless
+        it is the shared one. It does nothing if the ServiceBrowser was not
+        started, or was already stopped. The replaced Zeroconf instances
+        are closed as well."""
+        while self._zeroconf_zombies:
+            await self._zeroconf_zombies.popleft()._async_close()
+        if not self._started:
+            return
+        if self._finalize is not None:
+            self._finalize.detach()
+        if self._browser is not None:
+            self._browser.cancel()
+        if self._zeroconf is not self._shared_zc:
+            await self._zeroconf._async_close()
+            self._zeroconf = None
         self._browser = None
         self._started = False
 
+    async def _pair(self, comm_uri: str) -> bool:
+        """Pairs with a single device. The request is sent to the adb server
+        socket, in the default executor, falling back to an `adb pair`
+        process if the adb server fails to handle it. Nothing is done if the
+        device was paired in the last `PAIRED_CACHE_TTL` seconds.
+
+        Args:
+            comm_uri (str): The communication URI of the pairing service.
+
+        Raises:
+            subprocess.CalledProcessError: If the pairing fails and the
+                `subprocess_check_flag` is set.
+
+        Returns:
+            bool: True if the pairing was successful, False otherwise.
+        """
+        paired_at = self._paired_cache.get(comm_uri)
+        if paired_at is not None and (
+            monotonic() - paired_at < PAIRED_CACHE_TTL
+        ):
+            return True
+        try:
+            output = await asyncio.get_running_loop().run_in_executor(
+                None,
+                self._adb.pair,
+                comm_uri,
+                self._passwd,
+            )
+        except AdbServerError as e:
+            logger.debug(f'adb server pairing failed, spawning adb: {e}')
+            output = await self._pair_process(comm_uri)
+        paired = self._check_paired(comm_uri, output)
+        if paired:
+            self._paired_cache[comm_uri] = monotonic()
+        return paired
+
+    async def _pair_process(self, comm_uri: str) -> str:
+        """Pairs with a single device, using an `adb pair` process.
+
+        Args:
+            comm_uri (str): The communication URI of the pairing service.
+
+        Raises:
+            subprocess.CalledProcessError: If the process fails and the
+                `subprocess_check_flag` is set.
+
+        Returns:
+            str: The process output.
+        """
+        args = ['adb', 'pair', comm_uri, self._passwd]
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        if self._subprocess_check_flag and process.returncode != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode,
+                args,
+                stdout,
+                stderr,
+            )
+        return stdout.decode()
+
     async def pair_devices(self) -> bool:
         """Attempts to pair with the devices found by the mDNS listener.
         This method uses the adb command to pair with the devices. The
@@ -120,20 +304,79 @@ class AsyncAdbPairing(AdbPairing):
         mDNS listener. That being said, it is necessary that the mDNS listener
         has been started before calling this method.
 
+        The devices are paired concurrently, up to `max_concurrent_pairings`
+        at the same time, so the total time is bound by the slowest devices
+        instead of the sum of all of them.
+
         Returns:
             bool: True if the pairing was successful, False otherwise.
         """
-        online_services = self._context.get_online_service().items()
-        all_ops = [False] * len(online_services)
-        for idx, elem in enumerate(online_services):
-            comm_uri = f'{elem[1].ip}:{elem[1].port}'
-            result = subprocess.run(
-                ['adb', 'pair', comm_uri, self._passwd],
-                capture_output=True,
-                text=True,
-                check=self._subprocess_check_flag,
-            )
-            if f'Successfully paired to {comm_uri}' in result.stdout:
-                all_ops[idx] = True
+        results = await self.pair_online_devices()
+        return all(results.values())
 
-        return all(all_ops)
+    async def pair_online_devices(
+        self,
+        skip: AbstractSet[str] = frozenset(),
+    ) -> Dict[str, bool]:
+        """Attempts to pair with the devices found by the mDNS listener, the
+        same as `pair_devices`, and returns the result of each device.
+
+        Args:
+            skip (AbstractSet[str], optional): The communication URIs already
+                paired. They are reported as paired, without being paired
+                again. Defaults to an empty set.
+
+        Returns:
+            Dict[str, bool]: The pairing result of each online device, by
+                its communication URI.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrent_pairings)
+
+        async def pair_one(comm_uri: str) -> bool:
+            async with semaphore:
+                return await self._pair(comm_uri)
+
+        comm_uris = [info.comm_uri for info in self._context.iter_online()]
+        results = dict.fromkeys(comm_uris, True)
+        pending = [comm_uri for comm_uri in comm_uris if comm_uri not in skip]
+        paired = await asyncio.gather(*map(pair_one, pending))
+        results.update(zip(pending, paired))
+        return results
+
+    @asynccontextmanager
+    async def pair(self, max_attempts: int = 3) -> AsyncGenerator[str, None]:
+        """Pair the devices using the mDNS listener, without blocking the
+        event loop. This method is an asynchronous context manager that
+        starts the mDNS listener and yields the qrcode string. Once the block
+        is executed, it tries to pair the devices found, concurrently, and
+        stops the mDNS listener, even if the pairing is cancelled. The devices
+        already paired are not paired again on the retries.
+
+        Args:
+            max_attempts (int, optional): The max number of retry attempts to
+                detect the pair proccess. Defaults to 3.
+
+        Yields:
+            AsyncGenerator[str, None]: The qrcode string.
+        """
+        try:
+            await self.start()
+            yield self.qrcode_string
+        finally:
+            try:
+                paired = set()
+                for attempt in range(max_attempts):
+                    if attempt > 0:
+                        await asyncio.sleep(
+                            PAIRING_RETRY_DELAY * 2 ** (attempt - 1),
+                        )
+                    results = await self.pair_online_devices(
+                        skip=frozenset(paired),
+                    )
+                    paired.update(
+                        comm_uri for comm_uri, ok in results.items() if ok
+                    )
+                    if results and len(paired) == len(results):
+                        break
+            finally:
+                await self.stop_pair_listener()
@@ -1,69 +1,136 @@
-from device_manager.asyncio.async_zeroconf import AsyncZeroconf
-from device_manager.connection.utils.mdns_listener import MDnsListener
+import asyncio
+import logging
+from threading import Lock
+from typing import Dict, Optional
+
+from zeroconf import Zeroconf
+
+from device_manager.connection.utils.mdns_context import MDnsContext
+from device_manager.connection.utils.mdns_listener import (
+    CONNECT_SERVICE_TYPE,
+    MDnsListener,
+)
+
+# Time, in seconds, during which the services announced by the ServiceBrowser
+# are collected, before their information is requested all at once.
+SERVICE_INFO_BATCH_WINDOW = 0.05
+
+logger = logging.getLogger(__name__)
 
 
 class AsyncMDnsListener(MDnsListener):
-    """Asynchronous implementation of the MDnsListener."""
+    """Asynchronous implementation of the MDnsListener.
+    The ServiceBrowser calls the listener from its own thread. Instead of
+    blocking it while each service information is requested, the added and
+    updated services are collected during `SERVICE_INFO_BATCH_WINDOW`
+    seconds, and their information is requested concurrently, in the
+    Zeroconf event loop. The `found_event` is set, in its own event loop,
+    once there is an online service in the context.
 
-    async def update_service(
+    Args:
+        service_context (MDnsContext): The service context to update with the
+            service information found by the Zeroconf instance.
+        re_filter (Optional[str], optional): A regular expression filter to
+            extract the serial number from the service name. Defaults to None.
+        service_type (str, optional): The service type to filter the services
+            found by the mDNS listener. Defaults to
+                "_adb-tls-connect._tcp.local.".
+        found_event (Optional[asyncio.Event], optional): The event set when a
+            service is online. Defaults to None.
+        loop (Optional[asyncio.AbstractEventLoop], optional): The event loop
+            that owns the `found_event`. Defaults to None.
+    """
+
+    def __init__(
         self,
-        zc: AsyncZeroconf,
-        type_: str,
-        name: str,
+        service_context: MDnsContext,
+        re_filter: Optional[str] = None,
+        service_type: str = CONNECT_SERVICE_TYPE,
+        found_event: Optional[asyncio.Event] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
     ) -> None:
-        """Updates the service information in the service context.
+        super().__init__(service_context, re_filter, service_type)
+        self._service_context = service_context
+        self._found_event = found_event
+        self._loop = loop
+        self._pending: Dict[str, str] = dict()
+        self._pending_lock = Lock()
+        self._flush_scheduled = False
+
+    def _notify_found(self) -> None:
+        """Sets the `found_event` in its event loop, if there is an online
+        service in the context."""
+        if self._found_event is None or self._loop is None:
+            return
+        if self._loop.is_closed():
+            return
+        if self._service_context.any_online():
+            self._loop.call_soon_threadsafe(self._found_event.set)
+
+    def _schedule(self, zc: Zeroconf, type_: str, name: str) -> None:
+        """Adds a service to the pending batch, and schedules the batch to
+        be flushed in the Zeroconf event loop, if it is not yet scheduled.
 
         Args:
-            zc (AsyncZeroconf): AsyncZeroconf instance.
+            zc (Zeroconf): Zeroconf instance.
             type_ (str): The service type.
             name (str): The name of the service.
         """
-        zcinfo = await zc.async_get_service_info(type_, name)
-        info = self._extract_info(zcinfo)
-        if info:
-            await self.__service_context.update_service(
-                info.serial_number,
-                info,
-            )
-
-    async def remove_service(
-        self,
-        zc: AsyncZeroconf,
-        type_: str,
-        name: str,
-    ):
-        """Removes the service information from the service context.
+        with self._pending_lock:
+            self._pending[name] = type_
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        zc.loop.call_soon_threadsafe(
+            zc.loop.call_later,
+            SERVICE_INFO_BATCH_WINDOW,
+            lambda: zc.loop.create_task(self._flush(zc)),
+        )
+
+    async def _flush(self, zc: Zeroconf) -> None:
+        """Requests the information of all the pending services at once,
+        and updates the service context with them.
 
         Args:
-            zc (AsyncZeroconf): AsyncZeroconf instance.
+            zc (Zeroconf): Zeroconf instance.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, dict()
+            self._flush_scheduled = False
+        zcinfos = await asyncio.gather(
+            *(
+                zc.async_get_service_info(type_, name)
+                for name, type_ in pending.items()
+            ),
+            return_exceptions=True,
+        )
+        for name, zcinfo in zip(pending, zcinfos):
+            if isinstance(zcinfo, Exception):
+                logger.warning(f'Failed to get service info of {name}')
+                continue
+            info = self._extract_info(zcinfo)
+            if info:
+                self._service_context.update_service(info.serial_number, info)
+        self._notify_found()
+
+    def update_service(self, zc: Zeroconf, type_: str, name: str) -> None:
+        """Schedules the update of the service information in the service
+        context.
+
+        Args:
+            zc (Zeroconf): Zeroconf instance.
             type_ (str): The service type.
             name (str): The name of the service.
         """
-        zcinfo = await zc.async_get_service_info(type_, name)
-        info = self._extract_info(zcinfo)
-        if info:
-            await self.__service_context.to_offline_service(
-                info.serial_number,
-                info,
-            )
-
-    async def add_service(
-        self,
-        zc: AsyncZeroconf,
-        type_: str,
-        name: str,
-    ):
-        """Adds the service information to the service context.
+        self._schedule(zc, type_, name)
+
+    def add_service(self, zc: Zeroconf, type_: str, name: str) -> None:
+        """Schedules the addition of the service information to the service
+        context.
 
         Args:
-            zc (AsyncZeroconf): AsyncZeroconf instance.
+            zc (Zeroconf): Zeroconf instance.
             type_ (str): The service type.
             name (str): The name of the service.
         """
-        zcinfo = await zc.async_get_service_info(type_, name)
-        info = self._extract_info(zcinfo)
-        if info:
-            await self.__service_context.add_service(
-                info.serial_number,
-                info,
-            )
+        self._schedule(zc, type_, name)
@@ -9,11 +9,13 @@ class AsyncZeroconf(AZc):
     and provides the necessary attributes.
     """
 
-    def __getattribute__(self, name: str):
-        """__getattribute__ method to get the attribute from the Zeroconf
-        instance if it does not exist in the AsyncZeroconf instance.
+    __slots__ = ()
+
+    def __getattr__(self, name: str):
+        """__getattr__ method to get the attribute from the Zeroconf instance
+        if it does not exist in the AsyncZeroconf instance. It is only called
+        when the normal attribute lookup fails.
         """
-        try:
-            return super().__getattribute__(name)
-        except AttributeError:
-            return self.zeroconf.__getattribute__(name)
+        if name == 'zeroconf':
+            raise AttributeError(name)
+        return getattr(self.zeroconf, name)
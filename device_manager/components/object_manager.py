@@ -1,5 +1,12 @@
-from types import MappingProxyType
-from typing import Dict, Generic, Optional, TypeVar
+from typing import (
+    Dict,
+    Generic,
+    ItemsView,
+    KeysView,
+    Optional,
+    TypeVar,
+    ValuesView,
+)
 
 T = TypeVar('T')
 
@@ -12,19 +19,45 @@ class ObjectManager(Generic[T]):
     The class is generic and can be used to manage objects of any type, but
     the type of the objects must be consistent. The class will raise a
     TypeError if an object of a different type is added to the manager.
+
+    Args:
+        cls (Optional[type], optional): The type of the objects. If not
+            given, the type of the first object added is used, until the
+            manager is empty again. Defaults to None.
     """
 
-    def __init__(self):
+    __slots__ = ('__objects', '__cls', '__elem_type')
+
+    def __init__(self, cls: Optional[type] = None):
         self.__objects: Dict[str, T] = dict()
+        self.__cls = cls
+        self.__elem_type: Optional[type] = cls
 
-    def keys(self) -> MappingProxyType:
+    def keys(self) -> KeysView[str]:
         """Get the keys of the objects in the manager.
 
         Returns:
-            MappingProxyType: A read-only view of the keys in the manager.
+            KeysView[str]: A read-only view of the keys in the manager.
         """
         return self.__objects.keys()
 
+    def values(self) -> ValuesView[T]:
+        """Get the objects in the manager.
+
+        Returns:
+            ValuesView[T]: A read-only view of the objects in the manager.
+        """
+        return self.__objects.values()
+
+    def items(self) -> ItemsView[str, T]:
+        """Get the keys and objects in the manager.
+
+        Returns:
+            ItemsView[str, T]: A read-only view of the (key, object) pairs in
+                the manager.
+        """
+        return self.__objects.items()
+
     def add(self, key: str, obj: T):
         """Add an object to the manager.
 
@@ -39,10 +72,16 @@ class ObjectManager(Generic[T]):
         """
         if not isinstance(key, str):
             raise TypeError(f'Key of type {type(key)} not allowed')
-        if len(self.__objects) > 0:
-            if not isinstance(obj, type(list(self.__objects.values())[0])):
-                raise TypeError(f'Object of type {type(obj)} not allowed')
-        self[key] = obj
+        elem_type = self.__elem_type
+        if elem_type is None and len(self.__objects) > 0:
+            elem_type = type(next(iter(self.__objects.values())))
+        if elem_type is None:
+            self.__elem_type = type(obj)
+        elif not isinstance(obj, elem_type):
+            raise TypeError(f'Object of type {type(obj)} not allowed')
+        else:
+            self.__elem_type = elem_type
+        self.__objects[key] = obj
 
     def remove(self, key: str):
         """Remove an object from the manager.
@@ -72,7 +111,7 @@ class ObjectManager(Generic[T]):
             new_obj (T): The new object to replace the existing object.
         """
         if key in self.__objects:
-            self[key] = new_obj
+            self.__objects[key] = new_obj
 
     def __len__(self):
         """Get the number of objects in the manager.
@@ -116,6 +155,8 @@ class ObjectManager(Generic[T]):
             key (str): The key of the object to remove.
         """
         del self.__objects[key]
+        if len(self.__objects) == 0:
+            self.__elem_type = self.__cls
 
     def __contains__(self, key: str) -> bool:
         """Check if the manager contains an object with the specified key.
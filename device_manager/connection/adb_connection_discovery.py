@@ -1,7 +1,7 @@
 import logging
 import weakref
 from contextlib import contextmanager
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
 
 from zeroconf import ServiceBrowser, Zeroconf
 
@@ -39,9 +39,12 @@ class AdbConnectionDiscovery:
         start_discovery_listener: Context manager to start the ServiceBrowser
             and stop it after the block is executed.
         online_devices: Get the online devices from the class Context.
+        online_snapshot: Get a read-only snapshot of the online devices.
+        wait_for_devices: Wait until the discovery finds an online device.
         offline_devices: Get the offline devices from the class Context.
         get_service_info_for: Get the service information for a given serial
             number.
+        wait_for_serial: Wait until the discovery finds a given device.
         connection_status_for_device: Check the connection status for a given
             service, based on the current context.
         stop_discovery_listener: Stop the ServiceBrowser and close the Zeroconf
@@ -71,20 +74,33 @@ class AdbConnectionDiscovery:
                 ),
             )
 
-            def atexit() -> None:
-                """Callback function to update the __started attribute and
-                the __browser attribute, once the Zeroconf service has been
-                finalized."""
-                logger.debug('Finalizing Zeroconf instance.')
-                self.__browser = None
-                self.__started = False
-
             self.__finalize = weakref.finalize(
                 self.__zeroconf,
-                atexit,
+                self.__zeroconf_finalized,
+                weakref.ref(self),
             )
             self.__started = True
 
+    @staticmethod
+    def __zeroconf_finalized(
+        discovery_ref: 'weakref.ReferenceType[AdbConnectionDiscovery]',
+    ) -> None:
+        """Callback function to update the __started attribute and the
+        __browser attribute, once the Zeroconf service has been finalized.
+        It only holds a weak reference to the discovery, so the finalizer
+        does not keep the discovery alive.
+
+        Args:
+            discovery_ref (weakref.ReferenceType[AdbConnectionDiscovery]):
+                The weak reference to the discovery.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Finalizing Zeroconf instance.')
+        discovery = discovery_ref()
+        if discovery is not None:
+            discovery.__browser = None
+            discovery.__started = False
+
     @contextmanager
     def start_discovery_listener(self):
         """Context manager to start the ServiceBrowser and stop it after the
@@ -135,6 +151,31 @@ class AdbConnectionDiscovery:
         """
         return self.__context.get_online_service()
 
+    def online_snapshot(self) -> Mapping[str, ServiceInfo]:
+        """Get a read-only snapshot of the online devices. It is only rebuilt
+        after the discovery finds or loses a device, so it is cheap to call
+        repeatedly.
+
+        Returns:
+            Mapping[str, ServiceInfo]: The online devices. The key is the
+                serial number and the value is the service information.
+        """
+        return self.__context.online_snapshot()
+
+    def wait_for_devices(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the discovery finds an online device, instead of
+        sleeping for a fixed time after the ServiceBrowser is started. It
+        returns as soon as the first device shows up.
+
+        Args:
+            timeout (Optional[float], optional): The maximum time to wait, in
+                seconds. If None, waits without a limit. Defaults to None.
+
+        Returns:
+            bool: True if there is an online device, False otherwise.
+        """
+        return self.__context.wait_online(timeout)
+
     def offline_devices(self) -> Dict[str, ServiceInfo]:
         """Get the offline devices from the class Context.
 
@@ -155,9 +196,28 @@ class AdbConnectionDiscovery:
             Optional[ServiceInfo]: The service information of the device or
                 None if the device is not online.
         """
-        services_data = self.__context.get_online_service()
-        if serial_num in services_data:
-            return services_data[serial_num]
+        return self.__context.lookup_online(serial_num)
+
+    def wait_for_serial(
+        self,
+        serial_num: str,
+        timeout: Optional[float] = None,
+    ) -> Optional[ServiceInfo]:
+        """Wait until the discovery finds a device and get its service
+        information. It returns as soon as the device is online, so it does
+        not report a device as missing while the discovery is still warming
+        up.
+
+        Args:
+            serial_num (str): The serial number of the device.
+            timeout (Optional[float], optional): The maximum time to wait, in
+                seconds. If None, waits without a limit. Defaults to None.
+
+        Returns:
+            Optional[ServiceInfo]: The service information of the device, or
+                None if it was not found in time.
+        """
+        return self.__context.wait_lookup_online(serial_num, timeout)
 
     def connection_status_for_device(
         self,
@@ -182,23 +242,27 @@ class AdbConnectionDiscovery:
         Returns:
             ConnectionInfoStatus: The connection status.
         """
-        if service_info.serial_number in self.__context.get_offline_service():
+        serial_number = service_info.serial_number
+        if self.__context.is_offline(serial_number):
             return ConnectionInfoStatus.DOWN
 
-        if (
-            service_info.serial_number
-            not in self.__context.get_online_service()
-        ):
+        service_ref = self.__context.lookup_online(serial_number)
+        if service_ref is None:
             return ConnectionInfoStatus.UNKNOWN
 
-        services_data = self.__context.get_online_service()
-        service_ref = services_data[service_info.serial_number]
-
         if service_ref.ip == service_info.ip:
             return ConnectionInfoStatus.UPDATED
 
         return ConnectionInfoStatus.CHANGED
 
     def stop_discovery_listener(self) -> None:
-        """Stop the ServiceBrowser and close the Zeroconf instance."""
+        """Stop the ServiceBrowser and close the Zeroconf instance. It does
+        nothing if the ServiceBrowser was not started, or was already
+        stopped."""
+        if not self.__started or self.__zeroconf is None:
+            return
+        self.__finalize.detach()
         self.__zeroconf.close()
+        self.__zeroconf = None
+        self.__browser = None
+        self.__started = False
@@ -1,26 +1,68 @@
+import atexit
 import logging
+import re
 import subprocess
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Generator, List, Optional, Sequence, Tuple, Union
-from weakref import finalize
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    ClassVar,
+    Deque,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from weakref import ReferenceType, finalize, ref
 
-import qrcode
-from qrcode.main import GenericImage
 from zeroconf import InterfaceChoice, IPVersion, ServiceBrowser, Zeroconf
 
+from device_manager.adb_client import AdbClient
 from device_manager.connection.utils.mdns_context import MDnsContext
 from device_manager.connection.utils.mdns_listener import (
     PAIRING_SERVICE_TYPE,
     MDnsListener,
 )
+from device_manager.exceptions import AdbServerError
+from device_manager.utils import qrcode_fast
 from device_manager.utils.qrcode import QRCode
-from device_manager.utils.util_functions import create_password
+from device_manager.utils.util_functions import (
+    create_password,
+    interface_addresses,
+)
+
+if TYPE_CHECKING:
+    from PIL.Image import Image
 
 InterfacesType = Union[
     Sequence[Union[str, int, Tuple[Tuple[str, int, int], int]]],
     InterfaceChoice,
 ]  # noqa
 
+# Maximum number of devices paired at the same time. The adb server handles the
+# requests of its clients one at a time, so a small pool is enough.
+PAIRING_WORKERS = 4
+
+# Time, in seconds, to wait for each `adb pair` process used when the adb
+# server can not handle the pairing requests.
+PAIRING_PROCESS_TIMEOUT = 30.0
+
+# Default time, in seconds, to wait for a device to show up for pairing.
+DEVICE_TO_PAIRING_TIMEOUT = 5.0
+
+# Delay, in seconds, before the first pairing retry of `pair`. It doubles on
+# each new attempt, giving the mDNS listener time to find the devices.
+PAIRING_RETRY_DELAY = 0.25
+
+_PAIR_OK = re.compile(r'Successfully paired to (\S+)')
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,8 +82,16 @@ class AdbPairing:
             must raise an exception if the command fails. Defaults to False.
         password (Optional[str], optional): The password to pair the devices.
             If None, a random password is generated. Defaults to None.
-        max_zeroconf_instances (int, optional): The max number of Zeroconf
-            instances that can be created. Defaults to 10.
+        max_zeroconf_instances (int, optional): The max number of replaced
+            Zeroconf instances kept open. Once it is reached, the oldest one
+            is closed. Defaults to 10.
+        interface (Optional[str], optional): The name of the network
+            interface the devices are reached through, e.g. `wlan0`. If set,
+            the mDNS listener only binds to its addresses, instead of the
+            default interfaces, which reduces the sockets and the duplicated
+            answers, at the cost of missing devices on other networks. It
+            also needs a Zeroconf instance of its own, instead of the shared
+            one. Defaults to None.
 
     Properties:
         - `service_browser_started` (bool): Check if the ServiceBrowser has
@@ -50,8 +100,8 @@ class AdbPairing:
             instance.
         - `zeroconf_status` (bool): Check if the Zeroconf instance is active.
         - `qrcode_string` (str): Get the qrcode string.
-        - `qrcode` (qrcode.QRCode): Get the qrcode object.
-        - `qrcode_image` (qrcode.image.base.BaseImage): Get the qrcode image.
+        - `qrcode` (qrcode_fast.QRCode): Get the qrcode object.
+        - `qrcode_image` (PIL.Image.Image): Get the qrcode image.
         - `password` (str): Get the password.
 
     Methods:
@@ -62,6 +112,8 @@ class AdbPairing:
             library.
         pair_devices: Attempts to pair with the devices found by the mDNS
             listener.
+        pair_online_devices: Attempts to pair with the devices found by the
+            mDNS listener, returning the result of each one.
         stop_pair_listener: Stop the ServiceBrowser and close the Zeroconf
             instance.
         pair: Pair the devices using the mDNS listener.
@@ -69,8 +121,32 @@ class AdbPairing:
     Class Methods:
         generate_qrcode_string: Generate the qrcode string using the service
             name and password.
+
+    With the default configuration, a single Zeroconf instance is shared by
+    all the AdbPairing instances, and kept open until the process exits. Only
+    the ServiceBrowser is created and cancelled on each session.
     """
 
+    _shared_zc: ClassVar[Optional[Zeroconf]] = None
+    _shared_zc_lock: ClassVar[Lock] = Lock()
+
+    @classmethod
+    def _shared_zeroconf(cls) -> Zeroconf:
+        """Returns the Zeroconf instance shared by the pairing sessions with
+        the default configuration, creating it on the first use.
+
+        Returns:
+            Zeroconf: The shared Zeroconf instance.
+        """
+        with cls._shared_zc_lock:
+            if cls._shared_zc is None or cls._shared_zc.done:
+                cls._shared_zc = Zeroconf(
+                    interfaces=InterfaceChoice.Default,
+                    apple_p2p=False,
+                )
+                atexit.register(cls._shared_zc.close)
+            return cls._shared_zc
+
     @staticmethod
     def generate_qrcode_string(service_name: str, password: str) -> str:
         """Generate the qrcode string using the service name and password.
@@ -84,25 +160,24 @@ class AdbPairing:
         """
         return f'WIFI:T:ADB;S:{service_name};P:{password};;'
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         service_name: str = 'robot-celular',
         service_regex_filter: Optional[str] = None,
         subprocess_check_flag: bool = False,
         password: Optional[str] = None,
         max_zeroconf_instances: int = 10,
+        *,
+        interface: Optional[str] = None,
     ) -> None:
         self._name = service_name
+        self._interface = interface
         if password is not None:
             self._passwd = password
         else:
             self._passwd = create_password()
-        self._qrcode = QRCode(
-            qrcode_data=self.generate_qrcode_string(
-                service_name=self._name,
-                password=self._passwd,
-            )
-        )
+        self._qrcode_string: Optional[str] = None
+        self._qrcode: Optional[QRCode] = None
         self._service_re_filter = service_regex_filter
         self._service_type = PAIRING_SERVICE_TYPE
         self._zeroconf: Optional[Zeroconf] = None
@@ -111,8 +186,10 @@ class AdbPairing:
         self._subprocess_check_flag = subprocess_check_flag
         self._browser: Optional[ServiceBrowser] = None
         self._finalize: Optional[finalize] = None
-        self._max_zc_instances = max_zeroconf_instances
-        self._zeroconf_zombies: List[Zeroconf] = list()
+        self._zeroconf_zombies: Deque[Zeroconf] = deque(
+            maxlen=max_zeroconf_instances,
+        )
+        self._adb = AdbClient()
 
     @property
     def service_browser_started(self) -> bool:
@@ -155,10 +232,17 @@ class AdbPairing:
             `S:{service_name}` represents the service name.
             `P:{password}` represents the password to pair the devices.
 
+        The string is built once, and again only after the password changes.
+
         Returns:
             str: The qrcode string.
         """
-        return self.generate_qrcode_string(self._name, self._passwd)
+        if self._qrcode_string is None:
+            self._qrcode_string = self.generate_qrcode_string(
+                self._name,
+                self._passwd,
+            )
+        return self._qrcode_string
 
     @property
     def password(self) -> str:
@@ -170,27 +254,57 @@ class AdbPairing:
         return self._passwd
 
     @property
-    def qrcode(self) -> qrcode.QRCode:
+    def qrcode(self) -> qrcode_fast.QRCode:
         """Get the qrcode object.
 
         Returns:
-            qrcode.QRCode: The qrcode object.
+            qrcode_fast.QRCode: The qrcode object.
         """
-        return self._qrcode.qrcode_object
+        return self._get_qrcode().qrcode_object
 
     @property
-    def qrcode_image(self) -> GenericImage:
+    def qrcode_image(self) -> 'Image':
         """Get the qrcode image.
 
         Returns:
-            GenericImage: The qrcode image.
+            Image: The qrcode image.
+        """
+        return self._get_qrcode().qr_image
+
+    def _get_qrcode(self) -> QRCode:
+        """Returns the QRCode of the pairing session. It is only built when
+        first needed, so sessions that only use the `qrcode_string` never
+        encode it.
+
+        Returns:
+            QRCode: The QRCode of the pairing session.
         """
-        return self._qrcode.qr_image
+        if self._qrcode is None:
+            self._qrcode = QRCode(qrcode_data=self.qrcode_string)
+        return self._qrcode
+
+    def qrcode_prompt_show(self) -> None:
+        """Show the qrcode in the terminal."""
+        self._get_qrcode().qrcode_cli_show()
+
+    def qrcode_cv_window_show(self, delay: int = 0, size: int = 400) -> None:
+        """Show the qrcode in a window, using the openCV library. It expects
+        the user to close the window to continue the execution.
+
+        Args:
+            delay (int, optional): The delay in milliseconds to show the
+                window. If it is 0, the window is shown until the user
+                closes it. Defaults to 0.
+            size (int, optional): The size of the image. Defaults to 400.
+        """
+        self._get_qrcode().qrcode_cv_window_show(delay=delay, size=size)
 
     def update_qrcode(self, new_password: bool = False) -> None:
         """Update the qrcode image.
-        The qrcode image is updated using the qrcode library. The qrcode
-        string is updated using the method `qrcode_string`.
+        The qrcode image is updated using the qrcode encoder. The qrcode
+        string is updated using the method `qrcode_string`. The qrcode is not
+        rebuilt if its string did not change, and is otherwise only rebuilt
+        when next needed.
 
         Args:
             new_password (bool, optional): Indicates that a new password must
@@ -199,7 +313,12 @@ class AdbPairing:
         """
         if new_password:
             self._passwd = create_password()
-        self._qrcode = QRCode(qrcode_data=self.qrcode_string)
+            self._qrcode_string = None
+        if (
+            self._qrcode is not None
+            and self._qrcode.qrcode_string != self.qrcode_string
+        ):
+            self._qrcode = None
 
     def set_password(self, password: str, update_qrcode: bool = True) -> None:
         """Explicitly sets the internal password attribute, and updates the
@@ -211,9 +330,31 @@ class AdbPairing:
                 must be updated. Defaults to True.
         """
         self._passwd = password
+        self._qrcode_string = None
         if update_qrcode:
             self.update_qrcode(new_password=False)
 
+    def _resolve_interfaces(
+        self,
+        interfaces: InterfacesType,
+    ) -> InterfacesType:
+        """Returns the interfaces the Zeroconf instance listens to. The
+        addresses of the `interface` given to the constructor replace the
+        default interfaces.
+
+        Args:
+            interfaces (InterfacesType): The interfaces requested.
+
+        Raises:
+            ValueError: If the interface has no IPv4 address.
+
+        Returns:
+            InterfacesType: The interfaces to listen to.
+        """
+        if self._interface is None or interfaces != InterfaceChoice.Default:
+            return interfaces
+        return interface_addresses(self._interface)
+
     def _new_zeroconf_instance(
         self,
         interfaces: InterfacesType = InterfaceChoice.Default,
@@ -221,8 +362,9 @@ class AdbPairing:
         ip_version: Optional[IPVersion] = None,
     ) -> None:
         """Creates a new Zeroconf instance and appends the old instance to the
-        __zeroconf_zombies list, if the list is not full (defined by the
-        __max_zc_instances attribute)
+        `_zeroconf_zombies` deque. Once the deque is full (its `maxlen` is the
+        `max_zeroconf_instances` argument), the oldest instance is closed.
+        With the default arguments, the shared instance is used instead.
 
         Args:
             interfaces (InterfacesType, optional): The interfaces to listen to.
@@ -232,16 +374,39 @@ class AdbPairing:
             ip_version (Optional[IPVersion], optional): The IP version to use.
                 Defaults to None.
         """
-        if len(self._zeroconf_zombies) <= self._max_zc_instances:
-            if self._zeroconf is not None:
-                self._zeroconf_zombies.append(self._zeroconf)
-                self._zeroconf = None
-            self._zeroconf = Zeroconf(
-                interfaces=interfaces,
-                unicast=unicast,
-                ip_version=ip_version,
-                apple_p2p=False,
-            )
+        if (
+            interfaces == InterfaceChoice.Default
+            and not unicast
+            and ip_version is None
+        ):
+            self._zeroconf = self._shared_zeroconf()
+            return
+        if (
+            self._zeroconf is not None
+            and self._zeroconf is not self._shared_zc
+        ):
+            self._retire_zeroconf(self._zeroconf)
+        self._zeroconf = Zeroconf(
+            interfaces=interfaces,
+            unicast=unicast,
+            ip_version=ip_version,
+            apple_p2p=False,
+        )
+
+    def _retire_zeroconf(self, zeroconf: Zeroconf) -> None:
+        """Appends a replaced Zeroconf instance to the `_zeroconf_zombies`
+        deque, closing the instance evicted from it.
+
+        Args:
+            zeroconf (Zeroconf): The replaced Zeroconf instance.
+        """
+        zombies = self._zeroconf_zombies
+        if len(zombies) == zombies.maxlen:
+            evicted = zombies.popleft() if zombies else zeroconf
+            evicted.close()
+            if evicted is zeroconf:
+                return
+        zombies.append(zeroconf)
 
     def start(
         self,
@@ -272,7 +437,9 @@ class AdbPairing:
         """
         if not self._started:
             self._new_zeroconf_instance(
-                interfaces=interfaces, unicast=unicast, ip_version=ip_version
+                interfaces=self._resolve_interfaces(interfaces),
+                unicast=unicast,
+                ip_version=ip_version,
             )
             try:
                 self._browser = ServiceBrowser(
@@ -290,27 +457,54 @@ class AdbPairing:
                     'Maximum number of Zeroconf instances reached.'
                 ) from e
 
-            def atexit() -> None:
-                """Callback function to update the __started attribute and
-                the __browser attribute, once the Zeroconf service has been
-                finalized."""
-                logger.debug('Finalizing Zeroconf instance.')
-                self._browser = None
-                self._started = False
-
             self._finalize = finalize(
                 self._zeroconf,
-                atexit,
+                self._zeroconf_finalized,
+                ref(self),
             )
             self._started = True
 
+    @staticmethod
+    def _zeroconf_finalized(pairing_ref: 'ReferenceType[AdbPairing]') -> None:
+        """Callback function to update the __started attribute and the
+        __browser attribute, once the Zeroconf service has been finalized.
+        It only holds a weak reference to the pairing, so the finalizer does
+        not keep the pairing alive.
+
+        Args:
+            pairing_ref (ReferenceType[AdbPairing]): The weak reference to
+                the pairing.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Finalizing Zeroconf instance.')
+        pairing = pairing_ref()
+        if pairing is not None:
+            pairing._browser = None
+            pairing._started = False
+
     def has_device_to_pairing(self) -> bool:
         """Check if there are devices to pair.
 
         Returns:
             bool: True if there are devices to pair, False otherwise.
         """
-        return len(self._context.get_online_service()) > 0
+        return self._context.any_online()
+
+    def wait_for_device_to_pairing(
+        self,
+        timeout: float = DEVICE_TO_PAIRING_TIMEOUT,
+    ) -> bool:
+        """Waits until the mDNS listener finds a device to pair, without
+        polling. It returns as soon as the first device shows up.
+
+        Args:
+            timeout (float, optional): The maximum time to wait, in seconds.
+                Defaults to 5.0.
+
+        Returns:
+            bool: True if there is a device to pair, False otherwise.
+        """
+        return self._context.wait_online(timeout)
 
     def pair_devices(self) -> bool:
         """Attempts to pair with the devices found by the mDNS listener.
@@ -319,32 +513,172 @@ class AdbPairing:
         mDNS listener. That being said, it is necessary that the mDNS listener
         has been started before calling this method.
 
+        The pairing requests are sent straight to the adb server socket, so
+        no `adb` client process is spawned per device, unless the adb server
+        can not handle them. Up to `PAIRING_WORKERS` devices are paired at
+        the same time through the adb server, and the `adb pair` processes
+        of the remaining devices run concurrently.
+
         Returns:
             bool: True if the pairing was successful, False otherwise.
         """
-        online_services = list(self._context.get_online_service().items())
-        all_ops = list()
-        for elem in online_services:
-            comm_uri = f'{elem[1].ip}:{elem[1].port}'
-            result = subprocess.run(
+        results = self.pair_online_devices()
+        return len(results) > 0 and all(results.values())
+
+    def pair_online_devices(
+        self,
+        skip: AbstractSet[str] = frozenset(),
+    ) -> Dict[str, bool]:
+        """Attempts to pair with the devices found by the mDNS listener, the
+        same as `pair_devices`, and returns the result of each device.
+
+        Args:
+            skip (AbstractSet[str], optional): The communication URIs already
+                paired. They are reported as paired, without being paired
+                again. Defaults to an empty set.
+
+        Returns:
+            Dict[str, bool]: The pairing result of each online device, by
+                its communication URI.
+        """
+        comm_uris = [info.comm_uri for info in self._context.iter_online()]
+        results = dict.fromkeys(comm_uris, True)
+        pending = [comm_uri for comm_uri in comm_uris if comm_uri not in skip]
+        if len(pending) == 0:
+            return results
+
+        if len(pending) == 1:
+            outputs = [self._pair_through_server(pending[0])]
+        else:
+            workers = min(PAIRING_WORKERS, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outputs = list(
+                    executor.map(self._pair_through_server, pending),
+                )
+
+        fallback = [
+            comm_uri
+            for comm_uri, output in zip(pending, outputs)
+            if output is None
+        ]
+        if fallback:
+            fallback_outputs = iter(self._pair_processes(fallback))
+            outputs = [
+                next(fallback_outputs) if output is None else output
+                for output in outputs
+            ]
+
+        for comm_uri, output in zip(pending, outputs):
+            results[comm_uri] = self._check_paired(comm_uri, output)
+        return results
+
+    def _pair_through_server(self, comm_uri: str) -> Optional[str]:
+        """Sends the pairing request of a device to the adb server.
+
+        Args:
+            comm_uri (str): The communication URI of the pairing service.
+
+        Returns:
+            Optional[str]: The pairing result message, or None if the adb
+                server failed to handle the request.
+        """
+        try:
+            return self._adb.pair(comm_uri, self._passwd)
+        except AdbServerError as e:
+            logger.debug(f'adb server pairing failed, spawning adb: {e}')
+            return None
+
+    def _pair_processes(self, comm_uris: List[str]) -> List[str]:
+        """Pairs with the devices through `adb pair` processes. All the
+        processes are spawned before any of them is waited for, so the
+        pairing latencies overlap instead of adding up.
+
+        Args:
+            comm_uris (List[str]): The communication URIs of the pairing
+                services.
+
+        Raises:
+            subprocess.CalledProcessError: If a process fails and the
+                `subprocess_check_flag` is set.
+
+        Returns:
+            List[str]: The output of each process, in the same order as the
+                communication URIs.
+        """
+        processes = [
+            subprocess.Popen(
                 ['adb', 'pair', comm_uri, self._passwd],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                check=self._subprocess_check_flag,
             )
-            if f'Successfully paired to {comm_uri}' in result.stdout:
-                all_ops.append(True)
-            else:
-                all_ops.append(False)
+            for comm_uri in comm_uris
+        ]
+        outputs = list()
+        try:
+            for process in processes:
+                try:
+                    stdout, stderr = process.communicate(
+                        timeout=PAIRING_PROCESS_TIMEOUT,
+                    )
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    stdout, stderr = process.communicate()
+                    logger.warning(f'adb pair timed out: {process.args[2]}')
+                if self._subprocess_check_flag and process.returncode != 0:
+                    raise subprocess.CalledProcessError(
+                        process.returncode,
+                        process.args,
+                        stdout,
+                        stderr,
+                    )
+                outputs.append(stdout)
+        finally:
+            for process in processes:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+        return outputs
+
+    def _check_paired(self, comm_uri: str, output: str) -> bool:
+        """Checks the pairing result message of a device.
 
-        if len(all_ops) == 0:
-            return False
+        Args:
+            comm_uri (str): The communication URI of the pairing service.
+            output (str): The pairing result message.
 
-        return all(all_ops)
+        Raises:
+            subprocess.CalledProcessError: If the pairing failed and the
+                `subprocess_check_flag` is set.
+
+        Returns:
+            bool: True if the pairing was successful, False otherwise.
+        """
+        match = _PAIR_OK.search(output)
+        paired = match is not None and match.group(1) == comm_uri
+        if self._subprocess_check_flag and not paired:
+            raise subprocess.CalledProcessError(
+                1,
+                ['adb', 'pair', comm_uri],
+                output,
+            )
+        return paired
 
     def stop_pair_listener(self) -> None:
-        """Stop the ServiceBrowser and close the Zeroconf instance."""
-        self._zeroconf.close()
+        """Stop the ServiceBrowser. The Zeroconf instance is closed, unless
+        it is the shared one. It does nothing if the ServiceBrowser was not
+        started, or was already stopped. The replaced Zeroconf instances
+        are closed as well."""
+        while self._zeroconf_zombies:
+            self._zeroconf_zombies.popleft().close()
+        if not self._started or self._zeroconf is None:
+            return
+        self._finalize.detach()
+        if self._browser is not None:
+            self._browser.cancel()
+        if self._zeroconf is not self._shared_zc:
+            self._zeroconf.close()
+            self._zeroconf = None
         self._browser = None
         self._started = False
 
@@ -356,6 +690,10 @@ class AdbPairing:
         to be paired. The context manager stops the mDNS listener after the
         block is executed.
 
+        The devices already paired are not paired again on the retries, and
+        the delay between the attempts doubles, starting from
+        `PAIRING_RETRY_DELAY` seconds.
+
         Args:
             max_attempts (int, optional): The max number of retry attempts to
                 detect the pair proccess. Defaults to 3.
@@ -366,18 +704,22 @@ class AdbPairing:
         Yields:
             Generator[str, None, None]: The qrcode string.
         """
-
-        def coro():
+        try:
+            self.start()
+            yield self.qrcode_string
+        finally:
             try:
-                self.start()
-                yield self.qrcode_string
+                paired = set()
+                for attempt in range(max_attempts):
+                    if attempt > 0:
+                        time.sleep(PAIRING_RETRY_DELAY * 2 ** (attempt - 1))
+                    results = self.pair_online_devices(
+                        skip=frozenset(paired),
+                    )
+                    paired.update(
+                        comm_uri for comm_uri, ok in results.items() if ok
+                    )
+                    if results and len(paired) == len(results):
+                        break
             finally:
-                success = False
-                attempts = 0
-                while not success and attempts < max_attempts:
-                    success = self.pair_devices()
-                    attempts += 1
                 self.stop_pair_listener()
-
-        c = coro()
-        yield next(c)
@@ -1,8 +1,11 @@
 import logging
 import subprocess
-from time import sleep, time
-from typing import Dict, Optional
+from threading import Lock
+from time import monotonic, sleep
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
+from device_manager.adb_client import AdbClient
 from device_manager.connection.adb_connection_discovery import (
     AdbConnectionDiscovery,
 )
@@ -10,7 +13,27 @@ from device_manager.connection.adb_pairing import AdbPairing
 from device_manager.connection.utils.connection_status import (
     ConnectionInfoStatus,
 )
+from device_manager.connection.utils.known_devices import (
+    load_known_devices,
+    save_known_devices,
+)
 from device_manager.connection.utils.service_info import ServiceInfo
+from device_manager.exceptions import AdbServerError
+from device_manager.utils.util_functions import parse_adb_devices
+
+# Time, in seconds, during which the adb devices snapshot is reused. The set of
+# visible devices does not change that fast, and each refresh of the snapshot
+# costs an `adb devices` call.
+DEVICES_CACHE_TTL = 2.0
+
+# Maximum time, in seconds, to wait for the discovery to find a device before
+# connecting to it, e.g. while the mDNS discovery is still warming up.
+DEVICE_LOOKUP_TIMEOUT = 1.0
+
+# Maximum time, in seconds, to wait for a just started adb server to answer,
+# and the interval between each check.
+ADB_SERVER_START_TIMEOUT = 2.0
+ADB_SERVER_POLL_INTERVAL = 0.05
 
 logger = logging.getLogger(__name__)
 
@@ -19,29 +42,107 @@ class ConnectionManager:
     # Connection Manager has been developed based in to code available on
     # https://github.com/openatx/adbutils/issues/111#issuecomment-2094694894
 
-    __start_discovery = True
+    _adb_devices_cache: Tuple[float, Mapping[str, str]] = (
+        0.0,
+        MappingProxyType({}),
+    )
+    _adb_host = AdbClient()
 
     def __init__(
         self,
         subprocess_check_flag: bool = False,
     ) -> None:
         self.__subprocess_check_flag = subprocess_check_flag
-        if self.__start_discovery:
-            subprocess.run(
-                ["adb", "kill-server"],
-                check=self.__subprocess_check_flag,
-            )
-            self.__discovery = AdbConnectionDiscovery()
-            subprocess.run(
-                ["adb", "start-server"],
-                check=self.__subprocess_check_flag,
+        self.__known_devices = load_known_devices()
+        self.__known_devices_lock = Lock()
+        self.__discovery = AdbConnectionDiscovery()
+        if not self._adb_host.ping():
+            self.__start_adb_server()
+        self.__discovery.start()
+
+    def __start_adb_server(self) -> None:
+        """Starts the adb server and waits until it answers requests, for at
+        most `ADB_SERVER_START_TIMEOUT` seconds.
+
+        Raises:
+            AdbServerError: If the server does not answer in time and the
+                `subprocess_check_flag` is set.
+        """
+        subprocess.Popen(
+            ["adb", "start-server"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = monotonic() + ADB_SERVER_START_TIMEOUT
+        while monotonic() < deadline:
+            if self._adb_host.ping():
+                return
+            sleep(ADB_SERVER_POLL_INTERVAL)
+        if self.__subprocess_check_flag:
+            raise AdbServerError("adb server did not start in time")
+        logger.warning("adb server did not start in time")
+
+    @classmethod
+    def adb_devices(
+        cls,
+        subprocess_check_flag: bool = False,
+    ) -> Mapping[str, str]:
+        """Get the state of the devices known by the adb server, as listed
+        by the `adb devices` command, indexed by their communication URI.
+        The devices are requested straight to the adb server socket, falling
+        back to an `adb devices` process if the server can not be reached.
+        The result is reused for `DEVICES_CACHE_TTL` seconds.
+
+        Args:
+            subprocess_check_flag (bool, optional): A flag to check if the
+                subprocess execution was successful, passed to the subprocess
+                `check` argument. Defaults to False.
+                Check the subprocess documentation for more information.
+
+        Returns:
+            Mapping[str, str]: A read-only mapping of the devices states.
+        """
+        timestamp, devices = cls._adb_devices_cache
+        if monotonic() - timestamp < DEVICES_CACHE_TTL:
+            return devices
+        try:
+            states = cls._adb_host.devices()
+        except AdbServerError as e:
+            logger.debug(f"adb server request failed, spawning adb: {e}")
+            result = subprocess.run(
+                ["adb", "devices"],
+                capture_output=True,
+                text=True,
+                check=subprocess_check_flag,
             )
-            self.__discovery.start()
-            sleep(2)
-        self.__start_discovery = False
+            states = parse_adb_devices(str(result.stdout))
+        devices = MappingProxyType(states)
+        cls._adb_devices_cache = (monotonic(), devices)
+        return devices
 
-    @staticmethod
+    @classmethod
+    def invalidate_adb_devices_cache(cls) -> None:
+        """Discard the cached `adb devices` snapshot, forcing the next check
+        to query the adb server again."""
+        cls._adb_devices_cache = (0.0, MappingProxyType({}))
+
+    @classmethod
+    def kill_adb_server(cls) -> None:
+        """Ask the adb server to exit, through its socket, disconnecting all
+        the devices. The cached `adb devices` snapshot is discarded.
+
+        Raises:
+            AdbServerUnreachableError: If the adb server is not running.
+            AdbServerError: If the adb server refuses the request.
+        """
+        try:
+            cls._adb_host.kill()
+        finally:
+            cls.invalidate_adb_devices_cache()
+
+    @classmethod
     def check_devices_adb_connection(
+        cls,
         comm_uri: str,
         subprocess_check_flag: bool = False,
     ) -> bool:
@@ -59,26 +160,30 @@ class ConnectionManager:
         Returns:
             bool: True if the device is connected, False otherwise.
         """
-        result = subprocess.run(
-            ["adb", "devices"],
-            capture_output=True,
-            text=True,
-            check=subprocess_check_flag,
-        )
-        devices_lines = str(result.stdout).split("\n")
-        for info_line in devices_lines:
-            if comm_uri in info_line and "offline" not in info_line:
-                return True
-        return False
+        state = cls.adb_devices(subprocess_check_flag).get(comm_uri)
+        return state not in {None, "offline"}
 
     def available_devices(self) -> Dict[str, ServiceInfo]:
         """Get the list of devices that are currently online.
-        The dict is indexed by the serial number of the devices.
+        The dict is indexed by the serial number of the devices. The devices
+        are read from the snapshot kept by the discovery, which is only
+        rebuilt when a device is found or lost.
 
         Returns:
             Dict[str, ServiceInfo]: A dictionary of devices that are online.
         """
-        return self.__discovery.online_devices()
+        return self.__discovery.online_snapshot()
+
+    def known_devices(self) -> Dict[str, ServiceInfo]:
+        """Get the devices connected in this or in previous sessions. They
+        may not be online, see `available_devices`.
+
+        Returns:
+            Dict[str, ServiceInfo]: A dictionary of the known devices,
+                indexed by their serial number.
+        """
+        with self.__known_devices_lock:
+            return dict(self.__known_devices)
 
     @staticmethod
     def device_pairing(timeout_s: float) -> bool:
@@ -99,19 +204,16 @@ class ConnectionManager:
         )
         adb_pairing = AdbPairing()
         adb_pairing.start()
-        adb_pairing._qrcode.qrcode_cv_window_show()
-        start_time = time()
-        while (
-            not adb_pairing.has_device_to_pairing()
-            and (time() - start_time) <= timeout_s
-        ):
-            sleep(0.1)
+        adb_pairing.qrcode_cv_window_show()
+        adb_pairing.wait_for_device_to_pairing(timeout_s)
         result = adb_pairing.pair_devices()
         adb_pairing.stop_pair_listener()
         return result
 
     def device_connect(self, serial_num: str) -> Optional[ServiceInfo]:
-        """Connects to a device using the serial number.
+        """Connects to a device using the serial number. If the device is not
+        online yet, waits up to `DEVICE_LOOKUP_TIMEOUT` seconds for the
+        discovery to find it.
 
         Args:
             serial_num (str): The serial number of the device.
@@ -119,19 +221,32 @@ class ConnectionManager:
         Returns:
             Optional[ServiceInfo]: The service information of the device.
         """
-        info = self.__discovery.get_service_info_for(serial_num)
+        info = self.__discovery.wait_for_serial(
+            serial_num,
+            DEVICE_LOOKUP_TIMEOUT,
+        )
         if info is None:
             logger.warning("Device service not online or located")
         else:
-            comm_uri = f"{info.ip}:{info.port}"
-            result = subprocess.run(
-                ["adb", "connect", comm_uri],
-                capture_output=True,
-                text=True,
-                check=self.__subprocess_check_flag,
-            )
-            if f"failed to connect to {comm_uri}" in result.stdout:
+            comm_uri = info.comm_uri
+            try:
+                output = self._adb_host.connect(comm_uri)
+            except AdbServerError as e:
+                logger.debug(f"adb server request failed, spawning adb: {e}")
+                output = subprocess.run(
+                    ["adb", "connect", comm_uri],
+                    capture_output=True,
+                    text=True,
+                    check=self.__subprocess_check_flag,
+                ).stdout
+            if f"failed to connect to {comm_uri}" in output:
                 logger.warning("Failed to connect device")
+            else:
+                with self.__known_devices_lock:
+                    if self.__known_devices.get(serial_num) != info:
+                        self.__known_devices[serial_num] = info
+                        save_known_devices(self.__known_devices)
+            self.invalidate_adb_devices_cache()
         return info
 
     def check_wireless_adb_service_for(
@@ -148,6 +263,39 @@ class ConnectionManager:
         """
         return self.__discovery.connection_status_for_device(info)
 
+    def wait_for_devices(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the discovery finds an online device. The waiting
+        thread is woken up as soon as a device is found.
+
+        Args:
+            timeout (Optional[float], optional): The maximum time to wait, in
+                seconds. If None, waits without a limit. Defaults to None.
+
+        Returns:
+            bool: True if there is an online device, False if the timeout
+                expired first.
+        """
+        return self.__discovery.wait_for_devices(timeout)
+
+    def wait_for_device(
+        self,
+        serial_num: str,
+        timeout: Optional[float] = None,
+    ) -> Optional[ServiceInfo]:
+        """Wait until the discovery finds a device online. It returns right
+        away if the device is already online.
+
+        Args:
+            serial_num (str): The serial number of the device.
+            timeout (Optional[float], optional): The maximum time to wait, in
+                seconds. If None, waits without a limit. Defaults to None.
+
+        Returns:
+            Optional[ServiceInfo]: The service information of the device, or
+                None if it was not found in time.
+        """
+        return self.__discovery.wait_for_serial(serial_num, timeout)
+
     def validate_and_reconnect_device(
         self,
         info: ServiceInfo,
@@ -161,7 +309,7 @@ class ConnectionManager:
         Returns:
             Optional[ServiceInfo]: The service information of the device.
         """
-        comm_uri = f"{info.ip}:{info.port}"
+        comm_uri = info.comm_uri
         if self.check_devices_adb_connection(comm_uri):
             return info
         return self.device_connect(info.serial_number)
@@ -172,11 +320,20 @@ class ConnectionManager:
 
 
 class ConnectionManagerSingleton(ConnectionManager):
-    """Singleton class to manage the ConnectionManager instance."""
+    """Singleton class to manage the ConnectionManager instance. The instance
+    is only initialized once, so constructing it again does not reload the
+    known devices nor probe the adb server."""
 
     _instance = None
+    _initialized = False
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super(ConnectionManagerSingleton, cls).__new__(cls)
         return cls._instance
+
+    def __init__(self, *args, **kwargs) -> None:
+        if self._initialized:
+            return
+        super().__init__(*args, **kwargs)
+        self._initialized = True
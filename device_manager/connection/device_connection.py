@@ -1,10 +1,23 @@
 import logging
 import subprocess
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import sleep
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from rich.console import Console
 from rich.prompt import Prompt
 
+from device_manager.adb_client import AdbClient
 from device_manager.components.object_manager import ObjectManager
 from device_manager.connection.connection_manager import (
     ConnectionManager,
@@ -16,10 +29,46 @@ from device_manager.connection.utils.connection_status import (
 from device_manager.connection.utils.mdns_context import (
     ServiceInfo,
 )
+from device_manager.exceptions import (
+    AdbServerError,
+    AdbServerUnreachableError,
+)
+from device_manager.utils.util_functions import parse_adb_devices
 
 DEFAULT_FIXED_PORT = 5555
 MAX_CONNECTION_RETRIES = 5
 
+# Delay, in seconds, before the first connection retry. It doubles after each
+# failed attempt, giving the adb server and the mDNS discovery time to settle
+# instead of hammering them.
+CONNECTION_RETRY_DELAY = 0.2
+
+# Maximum number of disconnect/reconnect cycles run by `validate_connection`
+# when `force_reconnect` is set. Each cycle reconnects every device, which
+# takes seconds, so a device that keeps failing is reported instead of being
+# retried forever.
+MAX_RECONNECT_ATTEMPTS = 2
+
+# Time, in seconds, to wait for the device service to be online before the
+# first reconnection cycle. It doubles before each following cycle, up to
+# `MAX_RECONNECT_BACKOFF` seconds. The wait ends as soon as the device is
+# online, so a device that comes back quickly is reconnected right away.
+RECONNECT_BACKOFF = 0.25
+MAX_RECONNECT_BACKOFF = 4.0
+
+# Maximum number of devices connected at the same time. Each connection mostly
+# waits for the adb server and the network, so the devices are handled by a
+# thread pool instead of one after the other.
+CONNECTION_WORKERS = 16
+
+# Maximum time, in seconds, to wait for the discovery to find a device when
+# none is available to select.
+DEVICE_SEARCH_TIMEOUT = 5.0
+
+T = TypeVar('T')
+
+_YES_NO = ['Y', 'N']
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,8 +115,9 @@ class DeviceConnection:
             devices.
         stop_connection: Disconnects the selected devices from the host.
         is_connected: Check if the device is connected to the host.
-        disconnect: Kills the ADB server, effectively disconnecting the current
-            session with the specified device.
+        disconnect: Disconnects the ADB sessions of the managed devices.
+        teardown: Kills the ADB server, effectively disconnecting the current
+            session with all devices.
     """
 
     def __init__(
@@ -77,22 +127,24 @@ class DeviceConnection:
     ):
         self.console = Console()
         self.__subprocess_check_flag = subprocess_check_flag
+        self.__adb = AdbClient()
         self.connection = ConnectionManagerSingleton(
             subprocess_check_flag=self.__subprocess_check_flag,
         )
-        self.connection_info: ObjectManager[ServiceInfo] = ObjectManager()
+        self.connection_info: ObjectManager[ServiceInfo] = ObjectManager(
+            ServiceInfo,
+        )
         self.fixed_port = fixed_port
+        self.__lock = Lock()
 
     # region: user_interaction
     def check_pairing(self) -> None:
         """Checks if a device is already paired with the host.
         Case it is not, it calls the `ConnectionManager` to pair the device.
         """
-        prompt = Prompt()
-        options = ['Y', 'N']
-        response = prompt.ask(
+        response = Prompt.ask(
             'Device already paired with host?',
-            choices=options,
+            choices=_YES_NO,
             case_sensitive=False,
         )
         paired = False if response.upper() == 'N' else True
@@ -111,37 +163,30 @@ class DeviceConnection:
             List[str]: A list of serial numbers of the devices selected by the
                 user.
         """
-        prompt = Prompt()
-
-        device_idx = None
         finish_loop = False
-        available_devices = self.connection.available_devices()
+        refresh = True
         selected_devices = list()
         while not finish_loop:
-            prompt_options = {
-                str(i + 1): f'{srnmb} on IP: {available_devices[srnmb].ip}'
-                for i, srnmb in enumerate(available_devices)
-            }
+            if refresh:
+                serials, prompt_options = self.__device_prompt_options()
+                options = [*prompt_options, '0']
+                refresh = False
             self.console.print('Available devices found in the network:')
             for key, prompt_msg in prompt_options.items():
                 self.console.print(f'  [{key}] - {prompt_msg}')
-            options = list(prompt_options.keys())
-            options.append('0')
-            response = prompt.ask(
+            response = Prompt.ask(
                 'Select device index to connect, or 0 to search devices again',
                 choices=options,
             )
 
             if response == '0':
-                available_devices = self.connection.available_devices()
+                refresh = True
             else:
-                device_idx = int(response) - 1
-                device = list(available_devices.keys())[device_idx]
-                selected_devices.append(device)
+                selected_devices.append(serials[int(response) - 1])
 
-                connect_another = prompt.ask(
+                connect_another = Prompt.ask(
                     'Do you want to connect to another device?',
-                    choices=['Y', 'N'],
+                    choices=_YES_NO,
                     case_sensitive=False,
                 )
                 if connect_another == 'N':
@@ -149,6 +194,39 @@ class DeviceConnection:
 
         return selected_devices
 
+    def __device_prompt_options(
+        self,
+    ) -> Tuple[Tuple[str, ...], Dict[str, str]]:
+        """Builds the options of the device selection prompt from the
+        available devices. They are only rebuilt when the user asks to
+        search the devices again. If there is no device available, it
+        waits up to `DEVICE_SEARCH_TIMEOUT` seconds for the discovery to find
+        one, instead of leaving the user to search again and again.
+
+        Returns:
+            Tuple[Tuple[str, ...], Dict[str, str]]: The serial numbers of the
+                available devices, in the order of the options, and the
+                description of each option, indexed by its choice.
+        """
+        available_devices = self.connection.available_devices()
+        if not available_devices:
+            self.console.print('Searching devices in the network ...')
+            if self.connection.wait_for_devices(DEVICE_SEARCH_TIMEOUT):
+                available_devices = self.connection.available_devices()
+        offline = sorted(
+            set(self.connection.known_devices()) - set(available_devices),
+        )
+        if offline:
+            self.console.print(
+                f'Known devices not online: {", ".join(offline)}',
+            )
+        serials = tuple(available_devices)
+        prompt_options = {
+            str(idx): f'{serial} on IP: {available_devices[serial].ip}'
+            for idx, serial in enumerate(serials, start=1)
+        }
+        return serials, prompt_options
+
     def prompt_device_connection(self) -> List[str]:
         """Prompts the user to select devices to connect to.
         If the devices are not paired, it calls the `check_pairing` method to
@@ -159,13 +237,12 @@ class DeviceConnection:
             List[str]: A list of serial numbers of the devices selected by the
                 user.
         """
-        prompt = Prompt()
         done = False
         while not done:
             self.check_pairing()
-            res = prompt.ask(
+            res = Prompt.ask(
                 'Do you want to pair another device?',
-                choices=['Y', 'N'],
+                choices=_YES_NO,
                 case_sensitive=False,
             )
             done = True if res == 'N' else False
@@ -195,33 +272,31 @@ class DeviceConnection:
     def is_connected(
         self,
         serial_number: str,
-        devices_connected: Optional[str] = None,
+        devices_connected: Optional[Union[str, Mapping[str, str]]] = None,
     ) -> bool:
         """Check if the device is connected to the host.
 
         Args:
             serial_number (str): The serial number of the device to check.
+            devices_connected (Optional[Union[str, Mapping[str, str]]],
+                optional): The devices states, or the output of the
+                `adb devices` command. If None, the cached snapshot of the
+                adb server is used. Defaults to None.
 
         Returns:
             bool: True if the device is connected, False otherwise.
         """
         if devices_connected is None:
-            devices_connected = subprocess.run(
-                ['adb', 'devices'],
-                capture_output=True,
-                text=True,
-                check=self.__subprocess_check_flag,
-            ).stdout
+            devices_connected = ConnectionManager.adb_devices(
+                self.__subprocess_check_flag,
+            )
+        elif isinstance(devices_connected, str):
+            devices_connected = parse_adb_devices(devices_connected)
 
         device = self.connection_info.get(serial_number)
         if device is None:
             return False
-        substr = f'{device.ip}:{device.port}\tdevice'
-
-        result = False
-        if substr in devices_connected:
-            result = True
-        return result
+        return devices_connected.get(device.comm_uri) == 'device'
 
     def check_connections(self) -> bool:
         """
@@ -234,24 +309,21 @@ class DeviceConnection:
                 otherwise.
         """
 
-        devices_connected = subprocess.run(
-            ['adb', 'devices'],
-            capture_output=True,
-            text=True,
-            check=self.__subprocess_check_flag,
-        ).stdout
-        self.console.print(devices_connected)
-        serial_numbers = self.connection_info.keys()
-        if len(serial_numbers) == 0:
+        devices_connected = ConnectionManager.adb_devices(
+            self.__subprocess_check_flag,
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'adb devices: {dict(devices_connected)}')
+        if len(self.connection_info) == 0:
             return False
-        all_connected = [False] * len(serial_numbers)
-        for idx, serial_number in enumerate(serial_numbers):
-            result = self.is_connected(
-                serial_number=serial_number,
-                devices_connected=devices_connected,
-            )
-            all_connected[idx] = result
-        return all(all_connected)
+        connected = frozenset(
+            comm_uri
+            for comm_uri, state in devices_connected.items()
+            if state == 'device'
+        )
+        return all(
+            device.comm_uri in connected for device in self.connection_info
+        )
 
     def build_comm_uri(self, serial_number: str) -> str:
         """
@@ -267,7 +339,7 @@ class DeviceConnection:
         """
 
         device = self.connection_info.get(serial_number)
-        return f'{device.ip}:{device.port}'
+        return device.comm_uri
 
     def establish_first_connection(
         self,
@@ -275,6 +347,8 @@ class DeviceConnection:
         max_retries: int = MAX_CONNECTION_RETRIES,
     ) -> bool:
         """Attempts to establish an ADB connection with the specified device.
+        The failed attempts are retried with an exponential backoff, starting
+        at `CONNECTION_RETRY_DELAY` seconds.
 
         Args:
             device_serial_number (str): The serial number of the device to
@@ -286,33 +360,34 @@ class DeviceConnection:
             bool: True if the connection is successfully established, False
                 otherwise.
         """
-        success = False
         connection = None
-        for _ in range(max_retries):
-            if not success:
-                self.console.print('Trying to connect ...')
-                connection = self.connection.device_connect(
-                    device_serial_number,
-                )
-
+        for attempt in range(max_retries):
+            logger.info(
+                'Trying to connect serial=%s attempt=%d',
+                device_serial_number,
+                attempt + 1,
+            )
+            connection = self.connection.device_connect(device_serial_number)
             if connection is not None:
-                success = True
-            else:
-                logger.warning(
-                    f'ADB Connection for device {device_serial_number} failed',
-                )
+                break
+            logger.warning(
+                f'ADB Connection for device {device_serial_number} failed',
+            )
+            if attempt < max_retries - 1:
+                sleep(CONNECTION_RETRY_DELAY * (1 << attempt))
 
         if connection is not None:
-            if self.connection_info.get(device_serial_number) is not None:
-                self.connection_info.remove(device_serial_number)
-            self.connection_info.add(connection.serial_number, connection)
-            if (
-                self.connection_info.get(
-                    connection.serial_number,
-                ).port
-                != self.fixed_port
+            with self.__lock:
+                if self.connection_info.get(device_serial_number) is not None:
+                    self.connection_info.remove(device_serial_number)
+                self.connection_info.add(connection.serial_number, connection)
+            serial_number = connection.serial_number
+            if self.connection_info.get(
+                serial_number,
+            ).port != self.fixed_port and not self.__reach_fixed_port(
+                serial_number,
             ):
-                self.__fix_adb_port(connection.serial_number)
+                self.__fix_adb_port(serial_number)
             return True
         return False
 
@@ -324,9 +399,11 @@ class DeviceConnection:
         """
         This method validates the current connection with the specified device.
         If the connection is not valid, the method attempts to reconnect to the
-        device, if the `force_reconnect` parameter is set to True.
-        Be aware that to ensure the reconnection, the method will kill the ADB
-        server and reconnect all devices in the `connection_info` attribute.
+        device, up to `MAX_RECONNECT_ATTEMPTS` times, if the `force_reconnect`
+        parameter is set to True. Before each attempt, it waits for the device
+        service to be online, with an exponential backoff.
+        Be aware that to ensure the reconnection, the method will disconnect
+        and reconnect all devices in the `connection_info` attribute.
 
         Args:
             serial_number (str): The serial number of the device to validate
@@ -339,46 +416,72 @@ class DeviceConnection:
             bool: True if the connection is valid, False otherwise.
         """
 
-        if self.connection_info.get(serial_number) is None:
-            self.console.print('No devices currently connected')
+        device = self.connection_info.get(serial_number)
+        if device is None:
+            logger.warning(
+                'Device %s is not currently connected', serial_number
+            )
             return False
 
-        device = self.connection_info.get(serial_number)
-        comm_uri = f'{device.ip}:{device.port}'
+        if self.__is_connection_valid(device):
+            return True
+        if not force_reconnect:
+            return False
+        for attempt in range(MAX_RECONNECT_ATTEMPTS):
+            self.connection.wait_for_device(
+                serial_number,
+                min(RECONNECT_BACKOFF * (1 << attempt), MAX_RECONNECT_BACKOFF),
+            )
+            self.establish_first_connection(serial_number)
+            self.__disconnect_stale()
+            self.connect_all_devices()
+            if self.__is_connection_valid(
+                self.connection_info.get(serial_number),
+            ):
+                return True
+        return False
+
+    def __is_connection_valid(self, device: Optional[ServiceInfo]) -> bool:
+        """Checks if the device service is up to date and its adb connection
+        is ready. The adb connection is only checked if the service is up to
+        date.
 
+        Args:
+            device (Optional[ServiceInfo]): The service information of the
+                device, or None if it is not managed.
+
+        Returns:
+            bool: True if the connection is valid, False otherwise.
+        """
+        if device is None:
+            return False
         coninfostatus = self.connection.check_wireless_adb_service_for(
-            self.connection_info.get(serial_number),
+            device,
+        )
+        return (
+            coninfostatus == ConnectionInfoStatus.UPDATED
+            and self.connection.check_devices_adb_connection(device.comm_uri)
         )
-        if coninfostatus != (
-            ConnectionInfoStatus.UPDATED
-            or not self.connection.check_devices_adb_connection(comm_uri)
-        ):
-            if force_reconnect:
-                self.establish_first_connection(serial_number)
-                self.disconnect()
-                self.connect_all_devices()
-                return self.validate_connection(
-                    serial_number,
-                    force_reconnect,
-                )
-            else:
-                return False
-        return True
 
     def connect_all_devices(self) -> None:
         """Connects to all devices in the `connection_info` attribute.
         This method expects that all the devices added to the `connection_info`
-        attribute are available and with the correct port set."""
-        serial_numbers = self.connection_info.keys()
-        for serial_number in serial_numbers:
-            self.__connect_with_fix_port(serial_number)
+        attribute are available and with the correct port set. The devices
+        are connected concurrently."""
+        self.__for_each_device(
+            self.__connect_with_fix_port,
+            list(self.connection_info.keys()),
+        )
+        self.connection.invalidate_adb_devices_cache()
 
     def start_connection(self, selected_devices: List[str]) -> bool:
         """Starts the connection process for the selected devices.
         This method establishes a first connection with the selected devices,
         changing the ADB port the `fixed_port` if necessary. After that, it
-        disconnects the current connection, and then reconnects to all devices
-        in the `connection_info` attribute.
+        disconnects the stale sessions of the devices, and then reconnects to
+        all devices in the `connection_info` attribute. The sessions already
+        ready on the `fixed_port` are kept. The first connections are
+        established concurrently.
 
         Args:
             selected_devices (List[str]): A list of serial numbers of the
@@ -388,15 +491,17 @@ class DeviceConnection:
             bool: True if all devices are connected and updated, False
                 otherwise.
         """
-        for selected_serial_num in selected_devices:
-            self.establish_first_connection(selected_serial_num)
-        self.disconnect()
+        self.__for_each_device(
+            self.establish_first_connection,
+            list(selected_devices),
+        )
+        self.__disconnect_stale()
         self.connect_all_devices()
         return self.check_connections()
 
     def stop_connection(self, selected_devices: List[str]) -> bool:
         """Disconnects the selected devices from the host.
-        This method runs the ADB command to disconnect the selected devices
+        This method sends the ADB request to disconnect the selected devices
         from the host. It checks if the devices are selected and raises a
         ValueError if no devices are selected. It returns True if all devices
         are disconnected successfully, and False otherwise.
@@ -417,22 +522,59 @@ class DeviceConnection:
         all_ops = [None] * len(selected_devices)
         for idx, serial_num in enumerate(selected_devices):
             selected_uri = self.build_comm_uri(serial_num)
-            result = subprocess.run(
-                ['adb', 'disconnect', selected_uri],
-                check=self.__subprocess_check_flag,
-                capture_output=True,
-                text=True,
-            )
-            if result.stdout == f'disconnected {selected_uri}\n':
+            if self.__adb_disconnect(selected_uri):
                 all_ops[idx] = True
                 self.connection_info.remove(serial_num)
             else:
                 all_ops[idx] = False
+        self.connection.invalidate_adb_devices_cache()
 
         if all(all_ops):
             return True
         return False
 
+    @staticmethod
+    def __for_each_device(
+        action: Callable[[str], T],
+        serial_numbers: List[str],
+    ) -> List[T]:
+        """Runs an action for each device, through a thread pool of at most
+        `CONNECTION_WORKERS` threads. A single device is handled in the
+        calling thread.
+
+        Args:
+            action (Callable[[str], T]): The action, called with the serial
+                number of each device.
+            serial_numbers (List[str]): The serial numbers of the devices.
+
+        Returns:
+            List[T]: The result of each action, in the same order as the
+                serial numbers.
+        """
+        if len(serial_numbers) <= 1:
+            return [action(serial_number) for serial_number in serial_numbers]
+        workers = min(CONNECTION_WORKERS, len(serial_numbers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(action, serial_numbers))
+
+    def __reach_fixed_port(self, serial_number: str) -> bool:
+        """Check if the device already listens on the `fixed_port`, e.g. when
+        it was set in a previous session, so the port fix can be skipped.
+
+        Returns:
+            bool: True if the device is connected through the `fixed_port`,
+                False otherwise.
+        """
+        device = self.connection_info.get(serial_number)
+        comm_uri = f'{device.ip}:{self.fixed_port}'
+        self.__adb_connect(comm_uri, check=False)
+        self.connection.invalidate_adb_devices_cache()
+        devices = self.connection.adb_devices(self.__subprocess_check_flag)
+        if devices.get(comm_uri) != 'device':
+            return False
+        device.port = self.fixed_port
+        return True
+
     def __fix_adb_port(self, serial_number: str):
         """Fix the ADB port by setting it to the `fixed_port` attribute value.
 
@@ -442,11 +584,18 @@ class DeviceConnection:
 
         if self.validate_connection(serial_number):
             comm_uri = self.build_comm_uri(serial_number)
-            subprocess.run(
-                ['adb', '-s', comm_uri, 'tcpip', f'{self.fixed_port}'],
-                check=self.__subprocess_check_flag,
-            )
+            try:
+                self.__adb.tcpip(comm_uri, self.fixed_port)
+            except AdbServerUnreachableError as e:
+                logger.debug(f'adb server request failed, spawning adb: {e}')
+                subprocess.run(
+                    ['adb', '-s', comm_uri, 'tcpip', f'{self.fixed_port}'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=self.__subprocess_check_flag,
+                )
             self.connection_info.get(serial_number).port = self.fixed_port
+            self.connection.invalidate_adb_devices_cache()
 
     def __connect_with_fix_port(self, serial_number: str):
         """Reconnect using the fixed ADB port.
@@ -455,26 +604,106 @@ class DeviceConnection:
         attribute.
         """
         device = self.connection_info.get(serial_number)
-        subprocess.run(
-            ['adb', 'connect', f'{device.ip}:{self.fixed_port}'],
+        self.__adb_connect(
+            f'{device.ip}:{self.fixed_port}',
             check=self.__subprocess_check_flag,
         )
 
+    def __adb_connect(self, comm_uri: str, check: bool) -> None:
+        """Connects to a device through the adb server socket, falling back
+        to an `adb connect` process if the server can not be reached.
+
+        Args:
+            comm_uri (str): The communication URI of the device.
+            check (bool): The subprocess `check` argument of the fallback.
+        """
+        try:
+            self.__adb.connect(comm_uri)
+        except AdbServerError as e:
+            logger.debug(f'adb server request failed, spawning adb: {e}')
+            subprocess.run(
+                ['adb', 'connect', comm_uri],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=check,
+            )
+
+    def __adb_disconnect(self, comm_uri: str) -> bool:
+        """Disconnects from a device through the adb server socket, falling
+        back to an `adb disconnect` process if the server can not be reached.
+
+        Args:
+            comm_uri (str): The communication URI of the device.
+
+        Returns:
+            bool: True if the device was disconnected, False otherwise, e.g.
+                if it was not connected.
+        """
+        try:
+            output = self.__adb.disconnect(comm_uri)
+        except AdbServerUnreachableError as e:
+            logger.debug(f'adb server request failed, spawning adb: {e}')
+            output = subprocess.run(
+                ['adb', 'disconnect', comm_uri],
+                capture_output=True,
+                text=True,
+                check=self.__subprocess_check_flag,
+            ).stdout
+        except AdbServerError as e:
+            logger.debug(f'Failed to disconnect {comm_uri}: {e}')
+            return False
+        return output.strip() == f'disconnected {comm_uri}'
+
+    def disconnect(self) -> None:
+        """
+        This method disconnects the ADB sessions of the devices in the
+        `connection_info` attribute, including the sessions left on ports
+        other than the current one, e.g. before the port fix. Sessions with
+        other devices connected to the ADB server are kept.
+        """
+        managed_ips = {device.ip for device in self.connection_info}
+        devices = self.connection.adb_devices(self.__subprocess_check_flag)
+        for comm_uri in devices:
+            if comm_uri.rpartition(':')[0] in managed_ips:
+                self.__adb_disconnect(comm_uri)
+        self.connection.invalidate_adb_devices_cache()
+
+    def __disconnect_stale(self) -> None:
+        """Disconnects the ADB sessions of the devices in the
+        `connection_info` attribute that are not ready on the `fixed_port`,
+        e.g. the sessions left on the port used before the port fix. The
+        ready sessions are kept, so they are not torn down and connected
+        again."""
+        managed_ips = {device.ip for device in self.connection_info}
+        devices = self.connection.adb_devices(self.__subprocess_check_flag)
+        for comm_uri, state in devices.items():
+            ip, _, port = comm_uri.rpartition(':')
+            if ip not in managed_ips:
+                continue
+            if port == str(self.fixed_port) and state == 'device':
+                continue
+            self.__adb_disconnect(comm_uri)
+        self.connection.invalidate_adb_devices_cache()
+
     @staticmethod
-    def disconnect(
+    def teardown(
         subprocess_check_flag: bool = False,
     ):
         """
-        This method executes an ADB command to kill the ADB server, effectively
-        disconnecting the current session with all devices.
+        This method asks the ADB server to exit, through its socket,
+        effectively disconnecting the current session with all devices.
 
         Args:
-            subprocess_check_flag (bool, optional): A flag to check if the
-                subprocess execution was successful, passed to the subprocess
-                `check` argument. Defaults to False.
-                Check the subprocess documentation for more information.
+            subprocess_check_flag (bool, optional): If True, an
+                `AdbServerError` is raised when the ADB server refuses the
+                request. Otherwise, the failure is only logged. Defaults to
+                False.
         """
-        subprocess.run(
-            ['adb', 'kill-server'],
-            check=subprocess_check_flag,
-        )
+        try:
+            ConnectionManager.kill_adb_server()
+        except AdbServerUnreachableError:
+            logger.debug('adb server is not running, nothing to kill')
+        except AdbServerError as e:
+            if subprocess_check_flag:
+                raise
+            logger.warning(f'Failed to kill the adb server: {e}')
@@ -0,0 +1,60 @@
+import json
+import logging
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Union
+
+from device_manager.connection.utils.service_info import ServiceInfo
+
+KNOWN_DEVICES_PATH = (
+    Path.home() / '.cache' / 'device_manager' / 'known_devices.json'
+)
+
+logger = logging.getLogger(__name__)
+
+
+def load_known_devices(
+    path: Union[str, Path] = KNOWN_DEVICES_PATH,
+) -> Dict[str, ServiceInfo]:
+    """Loads the devices connected in previous sessions.
+
+    Args:
+        path (Union[str, Path], optional): The file where the devices are
+            stored. Defaults to `KNOWN_DEVICES_PATH`.
+
+    Returns:
+        Dict[str, ServiceInfo]: The known devices, indexed by their serial
+            number. Empty if the file does not exist or is not valid.
+    """
+    try:
+        with Path(path).open(encoding='utf-8') as file:
+            entries = json.load(file)
+        return {
+            entry['serial_number']: ServiceInfo(**entry) for entry in entries
+        }
+    except FileNotFoundError:
+        return dict()
+    except (OSError, ValueError, TypeError, KeyError) as e:
+        logger.warning(f'Ignoring invalid known devices file {path}: {e}')
+        return dict()
+
+
+def save_known_devices(
+    devices: Dict[str, ServiceInfo],
+    path: Union[str, Path] = KNOWN_DEVICES_PATH,
+) -> None:
+    """Stores the devices, so they are still known in the next sessions.
+
+    Args:
+        devices (Dict[str, ServiceInfo]): The devices, indexed by their
+            serial number.
+        path (Union[str, Path], optional): The file where the devices are
+            stored. Defaults to `KNOWN_DEVICES_PATH`.
+    """
+    path = Path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open('w', encoding='utf-8') as file:
+            json.dump([asdict(info) for info in devices.values()], file)
+    except OSError as e:
+        logger.warning(f'Could not store known devices in {path}: {e}')
@@ -1,5 +1,6 @@
-from threading import Lock
-from typing import Dict, List
+from threading import Condition, Event, Lock
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional
 
 from device_manager.connection.utils.service_info import ServiceInfo
 
@@ -22,6 +23,15 @@ class MDnsContext:
     Methods:
         get_online_service_list(): Get the online service list.
         get_offline_service_list(): Get the offline service list.
+        is_online(key_data): Check if a service is in the online list.
+        is_offline(key_data): Check if a service is in the offline list.
+        lookup_online(key_data): Get a service from the online list.
+        any_online(): Check if there is any online service.
+        iter_online(): Iterate over the online services.
+        online_snapshot(): Get a read-only snapshot of the online services.
+        wait_online(timeout): Wait until there is an online service.
+        wait_lookup_online(key_data, timeout): Wait until a service is online
+            and get it.
         add_service(key_data, data): Add a service to the online list.
         update_service(key_data, data): Update a service in the online list.
         to_offline_service(key_data, data): Move a service to the offline list.
@@ -31,6 +41,9 @@ class MDnsContext:
         self.__services_info_online = {}
         self.__services_info_offline = {}
         self.__mutex = Lock()
+        self.__online_changed = Condition(self.__mutex)
+        self.__online_event = Event()
+        self.__online_snapshot: Optional[Mapping[str, ServiceInfo]] = None
 
     @property
     def online_service_list(self) -> List[ServiceInfo]:
@@ -72,6 +85,121 @@ class MDnsContext:
 
             return all_data
 
+    def is_online(self, key_data: str) -> bool:
+        """Check if a service is in the online list.
+
+        Args:
+            key_data (str): The key to identify the service.
+
+        Returns:
+            bool: True if the service is online, False otherwise.
+        """
+        with self.__mutex:
+            return key_data in self.__services_info_online
+
+    def is_offline(self, key_data: str) -> bool:
+        """Check if a service is in the offline list.
+
+        Args:
+            key_data (str): The key to identify the service.
+
+        Returns:
+            bool: True if the service is offline, False otherwise.
+        """
+        with self.__mutex:
+            return key_data in self.__services_info_offline
+
+    def lookup_online(self, key_data: str) -> Optional[ServiceInfo]:
+        """Get a service from the online list.
+
+        Args:
+            key_data (str): The key to identify the service.
+
+        Returns:
+            Optional[ServiceInfo]: The service data, or None if the service
+                is not online.
+        """
+        with self.__mutex:
+            return self.__services_info_online.get(key_data)
+
+    def any_online(self) -> bool:
+        """Check if there is any online service, without building the online
+        service list.
+
+        Returns:
+            bool: True if there is at least one online service, False
+                otherwise.
+        """
+        with self.__mutex:
+            return bool(self.__services_info_online)
+
+    def iter_online(self) -> Iterator[ServiceInfo]:
+        """Iterate over the online services. The services are taken at once,
+        under the mutex, so the iteration is not affected by the services
+        found meanwhile.
+
+        Returns:
+            Iterator[ServiceInfo]: The online services.
+        """
+        with self.__mutex:
+            services = tuple(self.__services_info_online.values())
+        return iter(services)
+
+    def online_snapshot(self) -> Mapping[str, ServiceInfo]:
+        """Get a read-only snapshot of the online services. The snapshot is
+        only rebuilt after the online services change, so repeated calls
+        return the same mapping.
+
+        Returns:
+            Mapping[str, ServiceInfo]: The online services, indexed by their
+                key.
+        """
+        with self.__mutex:
+            if self.__online_snapshot is None:
+                self.__online_snapshot = MappingProxyType(
+                    dict(self.__services_info_online),
+                )
+            return self.__online_snapshot
+
+    def wait_online(self, timeout: Optional[float] = None) -> bool:
+        """Wait until there is an online service. The waiting thread is woken
+        up as soon as a service is added, instead of polling the context.
+
+        Args:
+            timeout (Optional[float], optional): The maximum time to wait, in
+                seconds. If None, waits without a limit. Defaults to None.
+
+        Returns:
+            bool: True if there is an online service, False if the timeout
+                expired first.
+        """
+        return self.__online_event.wait(timeout)
+
+    def wait_lookup_online(
+        self,
+        key_data: str,
+        timeout: Optional[float] = None,
+    ) -> Optional[ServiceInfo]:
+        """Wait until a service is in the online list and get it. The waiting
+        thread is woken up each time a service is added or updated, instead
+        of polling the context.
+
+        Args:
+            key_data (str): The key to identify the service.
+            timeout (Optional[float], optional): The maximum time to wait, in
+                seconds. If None, waits without a limit. Defaults to None.
+
+        Returns:
+            Optional[ServiceInfo]: The service data, or None if the service
+                is not online when the timeout expires.
+        """
+        with self.__online_changed:
+            self.__online_changed.wait_for(
+                lambda: key_data in self.__services_info_online,
+                timeout,
+            )
+            return self.__services_info_online.get(key_data)
+
     def add_service(
         self,
         key_data: str,
@@ -88,6 +216,9 @@ class MDnsContext:
             if key_data in self.__services_info_offline:
                 self.__services_info_offline.pop(key_data)
             self.__services_info_online[key_data] = data
+            self.__online_snapshot = None
+            self.__online_event.set()
+            self.__online_changed.notify_all()
 
     def update_service(
         self,
@@ -105,6 +236,9 @@ class MDnsContext:
             if key_data in self.__services_info_offline:
                 self.__services_info_offline.pop(key_data)
             self.__services_info_online[key_data] = data
+            self.__online_snapshot = None
+            self.__online_event.set()
+            self.__online_changed.notify_all()
 
     def to_offline_service(
         self,
@@ -121,4 +255,7 @@ class MDnsContext:
         with self.__mutex:
             if key_data in self.__services_info_online:
                 self.__services_info_online.pop(key_data)
+                self.__online_snapshot = None
+                if not self.__services_info_online:
+                    self.__online_event.clear()
             self.__services_info_offline[key_data] = data
@@ -65,8 +65,11 @@ class MDnsListener(ServiceListener):
     ) -> None:
         super().__init__()
         self.__service_context = service_context
-        self.__re_filter = re_filter
-        self.__type_filter = service_type
+        self.__name_pattern: Optional[re.Pattern] = None
+        if re_filter is not None:
+            self.__name_pattern = re.compile(
+                rf'{re_filter}\.{re.escape(service_type)}',
+            )
 
     def update_service(self, zc: Zeroconf, type_: str, name: str) -> None:
         """Updates the service information in the service context.
@@ -126,11 +129,9 @@ class MDnsListener(ServiceListener):
         try:
             ip = f'{socket.inet_ntoa(info.addresses[0])}'
             port = info.port
-            if self.__re_filter is None:
+            if self.__name_pattern is None:
                 return ServiceInfo(info.name.split('.')[0], ip, port)
-            match_result = re.match(
-                rf'{self.__re_filter}.{self.__type_filter}', info.name
-            )
+            match_result = self.__name_pattern.match(info.name)
             if match_result:
                 serial_num = match_result.group(1)
                 return ServiceInfo(serial_num, ip, port)
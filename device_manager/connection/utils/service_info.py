@@ -6,3 +6,8 @@ class ServiceInfo:
     serial_number: str
     ip: str
     port: int
+
+    @property
+    def comm_uri(self) -> str:
+        """The communication URI of the device, in the format `ip:port`."""
+        return f'{self.ip}:{self.port}'
@@ -1,3 +1,4 @@
+import shlex
 from pathlib import Path
 from typing import Optional
 
@@ -6,6 +7,10 @@ from device_manager.adb_executor import execute_adb_command
 from device_manager.connection.device_connection import DeviceConnection
 from device_manager.enumerations.adb_keyevents import ADBKeyEvent
 
+_KEYEVENT_POWER = ['input', 'keyevent', str(ADBKeyEvent.KEYCODE_POWER.value)]
+_KEYEVENT_MENU = ['input', 'keyevent', str(ADBKeyEvent.KEYCODE_MENU.value)]
+_KEYEVENT_HOME = ['input', 'keyevent', str(ADBKeyEvent.KEYCODE_HOME.value)]
+
 
 class DeviceActions:
     """Class responsible for interacting with a single device. It is able
@@ -104,7 +109,7 @@ class DeviceActions:
 
         if self.validate_connection():
             execute_adb_command(
-                command=f'input tap {x} {y}',
+                command=['input', 'tap', str(x), str(y)],
                 comm_uris=[self.current_comm_uri],
                 shell=True,
                 subprocess_check_flag=self.subprocess_check_flag,
@@ -124,7 +129,11 @@ class DeviceActions:
 
         if self.validate_connection():
             execute_adb_command(
-                command=f'input swipe {x1} {y1} {x2} {y2} {time}',
+                command=[
+                    'input',
+                    'swipe',
+                    *map(str, (x1, y1, x2, y2, time)),
+                ],
                 comm_uris=[self.current_comm_uri],
                 shell=True,
                 subprocess_check_flag=self.subprocess_check_flag,
@@ -141,7 +150,7 @@ class DeviceActions:
                 Ex.: 'com.android.deskclock/.DeskClockTabActivity'
         """
         execute_adb_command(
-            command=f'am start -n {package_activity}',
+            command=['am', 'start', '-n', package_activity],
             comm_uris=[self.current_comm_uri],
             shell=True,
             subprocess_check_flag=self.subprocess_check_flag,
@@ -166,7 +175,12 @@ class DeviceActions:
             activity_name (str): The activity name of the application.
         """
         execute_adb_command(
-            command=f'am start -n {package_name}/{activity_name}',
+            command=[
+                'am',
+                'start',
+                '-n',
+                f'{package_name}/{activity_name}',
+            ],
             comm_uris=[self.current_comm_uri],
             shell=True,
             subprocess_check_flag=self.subprocess_check_flag,
@@ -201,7 +215,7 @@ class DeviceActions:
 
         if self.validate_connection():
             execute_adb_command(
-                command=f'am force-stop {package_name}',
+                command=['am', 'force-stop', package_name],
                 comm_uris=[self.current_comm_uri],
                 shell=True,
                 subprocess_check_flag=self.subprocess_check_flag,
@@ -225,9 +239,9 @@ class DeviceActions:
 
         if self.validate_connection():
             apk_file_path = (path.resolve()).as_posix()
-            command = f'install {apk_file_path}'
+            command = ['install', apk_file_path]
             if replace:
-                command = f'install -r {apk_file_path}'
+                command = ['install', '-r', apk_file_path]
             execute_adb_command(
                 command=command,
                 comm_uris=[self.current_comm_uri],
@@ -241,7 +255,7 @@ class DeviceActions:
         """
         if self.validate_connection():
             execute_adb_command(
-                command=f'input keyevent {ADBKeyEvent.KEYCODE_POWER.value}',
+                command=_KEYEVENT_POWER,
                 comm_uris=[self.current_comm_uri],
                 shell=True,
                 subprocess_check_flag=self.subprocess_check_flag,
@@ -254,7 +268,7 @@ class DeviceActions:
         """
         if self.validate_connection():
             execute_adb_command(
-                command=f'input keyevent {ADBKeyEvent.KEYCODE_MENU.value}',
+                command=_KEYEVENT_MENU,
                 comm_uris=[self.current_comm_uri],
                 shell=True,
                 subprocess_check_flag=self.subprocess_check_flag,
@@ -267,7 +281,7 @@ class DeviceActions:
         """
         if self.validate_connection():
             execute_adb_command(
-                command=f'input keyevent {ADBKeyEvent.KEYCODE_HOME.value}',
+                command=_KEYEVENT_HOME,
                 comm_uris=[self.current_comm_uri],
                 shell=True,
                 subprocess_check_flag=self.subprocess_check_flag,
@@ -278,7 +292,11 @@ class DeviceActions:
         """
         if self.validate_connection():
             execute_adb_command(
-                command=f'screencap -p /sdcard/{image_name}.png',
+                command=[
+                    'screencap',
+                    '-p',
+                    shlex.quote(f'/sdcard/{image_name}.png'),
+                ],
                 comm_uris=[self.current_comm_uri],
                 shell=True,
                 subprocess_check_flag=self.subprocess_check_flag,
@@ -292,7 +310,7 @@ class DeviceActions:
         """
         if self.validate_connection():
             execute_adb_command(
-                command=f'rm {remote_path}',
+                command=['rm', shlex.quote(remote_path)],
                 comm_uris=[self.current_comm_uri],
                 shell=True,
                 subprocess_check_flag=self.subprocess_check_flag,
@@ -341,7 +359,7 @@ class DeviceActions:
         """
         if self.validate_connection():
             execute_adb_command(
-                command=f'push {local_path} {remote_path}',
+                command=['push', str(local_path), remote_path],
                 comm_uris=[self.current_comm_uri],
                 subprocess_check_flag=self.subprocess_check_flag,
             )
@@ -359,7 +377,7 @@ class DeviceActions:
         """
         if self.validate_connection():
             execute_adb_command(
-                command=f'pull {remote_path} {local_path}',
+                command=['pull', remote_path, str(local_path)],
                 comm_uris=[self.current_comm_uri],
                 subprocess_check_flag=self.subprocess_check_flag,
             )
@@ -1,14 +1,27 @@
 import re
-from typing import Dict, List, Optional, TypedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Dict, List, Optional, Tuple, TypedDict
 
 import uiautomator2 as u2
 
-from device_manager.adb_executor import execute_adb_command
+from device_manager.adb_executor import (
+    execute_adb_command,
+    execute_adb_command_batch,
+)
 from device_manager.connection.device_connection import DeviceConnection
 from device_manager.infos.app import AppInfo
 from device_manager.utils.util_functions import grep
 
 UNEXPECTED_ADB_OUTPUT = 'Unexpected output from ADB command'
+DEVICE_STATE_TTL = 0.2
+DEVICE_STATE_COMMANDS = [
+    'dumpsys deviceidle | grep -E "mScreenOn|mScreenLocked"',
+    'dumpsys activity activities | grep mCurrentFocus',
+]
+ACTIVITY_PACKAGE_PATTERN = re.compile(
+    r'com\.[a-zA-Z0-9_]+(?:\.[a-zA-Z0-9_]+)*',
+)
 
 
 class DeviceProperties(TypedDict):
@@ -20,6 +33,56 @@ class DeviceProperties(TypedDict):
     android_version: str
 
 
+@dataclass(frozen=True)
+class DeviceState:
+    """Screen and activity state of a device, read at a single instant.
+    The flags are None when the device did not report them."""
+
+    screen_on: Optional[bool]
+    locked: Optional[bool]
+    activity: str
+
+
+def _parse_flag(output: str, key: str) -> Optional[bool]:
+    """Parses a `key=true|false` line of a `dumpsys` output.
+
+    Args:
+        output (str): The `dumpsys` output.
+        key (str): The flag name.
+
+    Returns:
+        Optional[bool]: The flag value, or None if the flag is not present
+            exactly once or has an unexpected value.
+    """
+    lines = grep(output, key)
+    if len(lines) != 1:
+        return None
+    value = lines[0].split('=')
+    if 'true' in value:
+        return True
+    if 'false' in value:
+        return False
+    return None
+
+
+def _parse_activity(output: str) -> str:
+    """Parses the focused activity of a `dumpsys activity` output.
+
+    Args:
+        output (str): The `dumpsys activity` output.
+
+    Returns:
+        str: The activity packages joined by `/`, or `No activity`.
+    """
+    lines = grep(output, 'mCurrentFocus')
+    if len(lines) == 0:
+        return 'No activity'
+    result = re.findall(ACTIVITY_PACKAGE_PATTERN, lines[0])
+    if len(result) == 0:
+        return 'No activity'
+    return '/'.join(result)
+
+
 class DeviceInfo:
     """Class responsible for retrieving information from a single device.
     It is able to execute predefined actions at the device.
@@ -38,6 +101,9 @@ class DeviceInfo:
         - `serial_number` (str): The serial number associated with the device.
 
     Methods:
+        snapshot() -> DeviceState:
+            Reads the screen, lock and activity state with a single ADB
+            command.
         actual_activity() -> str:
             Checks the device connection and executes an ADB command to obtain
             information about the top resumed activity from the Android
@@ -63,6 +129,9 @@ class DeviceInfo:
         self.current_comm_uri = self.device_connection.build_comm_uri(
             self.__serial_number,
         )
+        self._u2: Optional[u2.Device] = None
+        self._u2_uri: Optional[str] = None
+        self.__state_cache: Tuple[float, Optional[DeviceState]] = (0.0, None)
 
     @property
     def serial_number(self) -> str:
@@ -73,37 +142,55 @@ class DeviceInfo:
         """
         return self.__serial_number
 
-    def actual_activity(self) -> str:
+    def snapshot(self) -> Optional[DeviceState]:
         """
-        This method checks the device connection and executes an ADB command
-        to obtain information about the top resumed activity from the Android
-        activity manager. The output is captured and returned as a string.
+        This method checks the device connection and reads the screen, lock
+        and activity state of the device with a single ADB command. The
+        result is kept for `DEVICE_STATE_TTL` seconds, and reused by the
+        `actual_activity`, `is_screen_on` and `is_device_locked` methods.
 
         Returns:
-            str: The name of the currently resumed activity.
+            Optional[DeviceState]: The device state, or None if the
+                connection is not valid.
         """
-
         if self.device_connection.validate_connection(
             self.__serial_number,
             force_reconnect=True,
         ):
-            output = execute_adb_command(
-                command='dumpsys activity activities',
-                shell=True,
+            output = execute_adb_command_batch(
+                commands=DEVICE_STATE_COMMANDS,
                 comm_uris=[self.current_comm_uri],
                 subprocess_check_flag=self.subprocess_check_flag,
                 capture_output=True,
             ).stdout
-            greplines = grep(output, 'mCurrentFocus')
-            if len(greplines) == 0:
-                return 'No activity'
-            package_pattern = re.compile(
-                r'com\.[a-zA-Z0-9_]+(?:\.[a-zA-Z0-9_]+)*'
+            state = DeviceState(
+                screen_on=_parse_flag(output, 'mScreenOn'),
+                locked=_parse_flag(output, 'mScreenLocked'),
+                activity=_parse_activity(output),
             )
-            result = re.findall(package_pattern, greplines[0])
-            if len(result) == 0:
-                return 'No activity'
-            return '/'.join(result)
+            self.__state_cache = (monotonic(), state)
+            return state
+
+    def __cached_snapshot(self) -> Optional[DeviceState]:
+        """Returns the last device state, if it is not older than
+        `DEVICE_STATE_TTL` seconds, or reads a new one."""
+        timestamp, state = self.__state_cache
+        if state is None or monotonic() - timestamp >= DEVICE_STATE_TTL:
+            state = self.snapshot()
+        return state
+
+    def actual_activity(self) -> str:
+        """
+        This method checks the device connection and executes an ADB command
+        to obtain information about the top resumed activity from the Android
+        activity manager. The output is captured and returned as a string.
+
+        Returns:
+            str: The name of the currently resumed activity.
+        """
+        state = self.__cached_snapshot()
+        if state is not None:
+            return state.activity
 
     def is_screen_on(self) -> bool:
         """This method checks if the associated device screen is on.
@@ -111,25 +198,11 @@ class DeviceInfo:
         Returns:
             bool: True if the screen is on, false otherwise.
         """
-        if self.device_connection.validate_connection(
-            self.__serial_number,
-            force_reconnect=True,
-        ):
-            output = execute_adb_command(
-                command='dumpsys deviceidle',
-                shell=True,
-                comm_uris=[self.current_comm_uri],
-                subprocess_check_flag=self.subprocess_check_flag,
-                capture_output=True,
-            ).stdout
-            greplines = grep(output, 'mScreenOn')
-            assert len(greplines) == 1
-            result = greplines[0].split('=')
-            if 'true' in result:
-                return True
-            elif 'false' in result:
-                return False
-            raise ValueError(UNEXPECTED_ADB_OUTPUT)
+        state = self.__cached_snapshot()
+        if state is not None:
+            if state.screen_on is None:
+                raise ValueError(UNEXPECTED_ADB_OUTPUT)
+            return state.screen_on
 
     def is_device_locked(self) -> bool:
         """This method checks if the associated device is locked.
@@ -137,32 +210,16 @@ class DeviceInfo:
         Returns:
             bool: True if the device is locked, false otherwise.
         """
-        if self.device_connection.validate_connection(
-            self.__serial_number,
-            force_reconnect=True,
-        ):
-            output = execute_adb_command(
-                command='dumpsys deviceidle',
-                shell=True,
-                comm_uris=[self.current_comm_uri],
-                subprocess_check_flag=self.subprocess_check_flag,
-                capture_output=True,
-            ).stdout
-            grep_lines = grep(output, 'mScreenLocked')
-            if len(grep_lines) != 1:
+        state = self.__cached_snapshot()
+        if state is not None:
+            if state.locked is None:
                 raise ValueError(UNEXPECTED_ADB_OUTPUT)
-
-            result = grep_lines[0].split('=')
-            if 'true' in result:
-                return True
-            elif 'false' in result:
-                return False
-
-            raise ValueError(UNEXPECTED_ADB_OUTPUT)
+            return state.locked
 
     def get_screen_gui_xml(self) -> str:
         """This method retrieves the .xml that represents the current state
-        of the device screen.
+        of the device screen. The `uiautomator2` connection is kept and
+        reused while the communication URI does not change.
 
         Returns:
             str: The device screen xml as a string.
@@ -171,8 +228,10 @@ class DeviceInfo:
             self.__serial_number,
             force_reconnect=True,
         ):
-            device = u2.connect(self.current_comm_uri)
-            return device.dump_hierarchy()
+            if self._u2 is None or self._u2_uri != self.current_comm_uri:
+                self._u2 = u2.connect(self.current_comm_uri)
+                self._u2_uri = self.current_comm_uri
+            return self._u2.dump_hierarchy()
 
     def get_properties(
         self,
@@ -199,7 +258,7 @@ class DeviceInfo:
             force_reconnect=True,
         ):
             output = execute_adb_command(
-                command='getprop',
+                command=['getprop'],
                 shell=True,
                 comm_uris=[self.current_comm_uri],
                 subprocess_check_flag=self.subprocess_check_flag,
@@ -236,7 +295,7 @@ class DeviceInfo:
             force_reconnect=True,
         ):
             result = execute_adb_command(
-                command='wm size',
+                command=['wm', 'size'],
                 shell=True,
                 comm_uris=[self.current_comm_uri],
                 subprocess_check_flag=self.subprocess_check_flag,
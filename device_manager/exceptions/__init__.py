@@ -1,3 +1,7 @@
+from device_manager.exceptions.adb_server_error import AdbServerError
+from device_manager.exceptions.adb_server_unreachable_error import (
+    AdbServerUnreachableError,
+)
 from device_manager.exceptions.dependency_not_found_error import (
     DependencyNotFoundError,
 )
@@ -5,4 +9,9 @@ from device_manager.exceptions.dependency_version_error import (
     DependencyVersionError,
 )
 
-__all__ = ['DependencyNotFoundError', 'DependencyVersionError']
+__all__ = [
+    'AdbServerError',
+    'AdbServerUnreachableError',
+    'DependencyNotFoundError',
+    'DependencyVersionError',
+]
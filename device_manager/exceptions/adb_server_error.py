@@ -0,0 +1,4 @@
+class AdbServerError(ConnectionError):
+    """Raised when the adb server is unreachable or refuses a request."""
+
+    pass
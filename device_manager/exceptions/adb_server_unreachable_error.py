@@ -0,0 +1,8 @@
+from device_manager.exceptions.adb_server_error import AdbServerError
+
+
+class AdbServerUnreachableError(AdbServerError):
+    """Raised when the adb server can not be reached, e.g. when it is not
+    running."""
+
+    pass
@@ -30,7 +30,7 @@ class AppInfo:
             force_reconnect=True,
         ):
             self.dumpsys = execute_adb_command(
-                command=f'dumpsys package {self.package}',
+                command=['dumpsys', 'package', self.package],
                 shell=True,
                 comm_uris=[self.current_comm_uri],
                 subprocess_check_flag=self.subprocess_check_flag,
@@ -57,8 +57,6 @@ class DeviceManager:
             given serial number.
         get_device_actions: Retrieves the device actions associated with a
             given serial number.
-        build_command_list: Builds a list of commands to be executed on
-            multiple devices.
         execute_adb_command: Executes a custom adb command on all connected
             devices.
         adb_pairing_instance: Creates an instance of the AdbPairing class.
@@ -80,8 +78,12 @@ class DeviceManager:
             fixed_port=self._devices_fixed_port,
         )
         self.adb_pair: Optional[AdbPairing] = None
-        self.__device_info: ObjectManager[DeviceInfo] = ObjectManager()
-        self.__device_actions: ObjectManager[DeviceActions] = ObjectManager()
+        self.__device_info: ObjectManager[DeviceInfo] = ObjectManager(
+            DeviceInfo,
+        )
+        self.__device_actions: ObjectManager[DeviceActions] = ObjectManager(
+            DeviceActions,
+        )
 
     def __getitem__(
         self,
@@ -331,5 +333,5 @@ class DeviceManager:
 
     def clear(self) -> None:
         """Clears the internal object managers, removing all devices."""
-        self.__device_info = ObjectManager()
-        self.__device_actions = ObjectManager()
+        self.__device_info = ObjectManager(DeviceInfo)
+        self.__device_actions = ObjectManager(DeviceActions)
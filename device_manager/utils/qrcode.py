@@ -1,20 +1,34 @@
+import sys
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
 import cv2 as cv
 import numpy as np
-import qrcode
-import qrcode.constants
-from qrcode.main import GenericImage
+
+from device_manager.utils import qrcode_fast
+
+if TYPE_CHECKING:
+    from PIL.Image import Image
+
+# BGR values of the colors the QR code is usually drawn with, so they do not
+# need PIL to be parsed.
+_BGR_COLORS = {
+    'black': (0, 0, 0),
+    'white': (255, 255, 255),
+}
 
 
 class QRCode:
-    """Class to generate a QR code from a given string. It uses the qrcode
-    library to generate the QR code image.
+    """Class to generate a QR code from a given string. It uses the pure
+    Python encoder of `device_manager.utils.qrcode_fast` to generate the QR
+    code image.
 
     Properties:
         - `qrcode_string` (str): The QR code data string.
-        - `qrcode_object` (qrcode.QRCode): The QR code object.
-        - `qr_image` (GenericImage): The QR code image.
+        - `qrcode_object` (qrcode_fast.QRCode): The QR code object.
+        - `qr_image` (Image): The QR code image.
 
     Methods:
+        - `render_svg`: Render the QR code as a SVG document.
         - `qrcode_cli_show`: Show the QR code in the terminal.
         - `qrcode_cv_window_show`: Show the QR code in a window, using the
             OpenCV library.
@@ -34,17 +48,18 @@ class QRCode:
         back_color: str = 'white',
     ) -> None:
         self.__qrcode_data = qrcode_data
-        self.__object = qrcode.QRCode(
+        self.__object = qrcode_fast.QRCode(
             version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
+            error_correction=qrcode_fast.ERROR_CORRECT_L,
             box_size=20,
             border=2,
         )
         self.__object.add_data(self.__qrcode_data)
-        self.__qr_image = self.__object.make_image(
-            fill_color=fill_color,
-            back_color=back_color,
-        )
+        self.__fill_color = fill_color
+        self.__back_color = back_color
+        self.__qr_image: Optional['Image'] = None
+        self.__cli_text: Optional[str] = None
+        self.__cv_images: Dict[int, cv.typing.MatLike] = dict()
 
     @property
     def qrcode_string(self) -> str:
@@ -67,32 +82,63 @@ class QRCode:
         self.__qrcode_data = value
 
     @property
-    def qrcode_object(self) -> qrcode.QRCode:
+    def qrcode_object(self) -> qrcode_fast.QRCode:
         """Returns the QR code object.
 
         Returns:
-            qrcode.QRCode: The QR code object.
+            qrcode_fast.QRCode: The QR code object.
         """
         return self.__object
 
     @property
-    def qr_image(self) -> GenericImage:
-        """Returns the QR code image.
+    def qr_image(self) -> 'Image':
+        """Returns the QR code image. It is only rendered when first
+        needed, so showing the QR code in the terminal does not render it.
 
         Returns:
-            GenericImage: The QR code image.
+            Image: The QR code image.
         """
+        if self.__qr_image is None:
+            self.__qr_image = self.__object.make_image(
+                fill_color=self.__fill_color,
+                back_color=self.__back_color,
+            )
         return self.__qr_image
 
+    def render_svg(self) -> str:
+        """Renders the QR code as a SVG document, straight from the modules
+        matrix. Nothing is rendered until a vector output is requested.
+
+        Returns:
+            str: The SVG document.
+        """
+        return self.__object.make_svg(
+            fill_color=self.__fill_color,
+            back_color=self.__back_color,
+        )
+
     def qrcode_cli_show(self) -> None:
-        """Show the QR code in the terminal."""
-        self.__object.print_ascii(tty=True)
+        """Show the QR code in the terminal. The drawn QR code is kept, so
+        showing it again only writes it to the terminal.
+
+        Raises:
+            OSError: If the standard output is not a terminal.
+        """
+        if not sys.stdout.isatty():
+            raise OSError('Not a tty')
+        if self.__cli_text is None:
+            self.__cli_text = self.__object.ascii(tty=True)
+        sys.stdout.write(self.__cli_text)
+        sys.stdout.flush()
 
     def __get_img_cv(
         self,
         size: int = 400,
     ) -> cv.typing.MatLike:
-        """Get the QR code image in OpenCV format.
+        """Get the QR code image in OpenCV format. The image is rendered
+        straight from the modules matrix, one pixel per module, and scaled
+        to the final size, without rendering the PIL image. The image of
+        each size is kept for the next calls.
 
         Args:
             size (int, optional): The size of the image. Defaults to 400.
@@ -101,10 +147,22 @@ class QRCode:
         Returns:
             cv.typing.MatLike: The QR code image in OpenCV format.
         """
-        img_rgb = self.__qr_image.convert('RGB')
-        img_mat = cv.cvtColor(np.array(img_rgb), cv.COLOR_RGB2BGR)
+        cached = self.__cv_images.get(size)
+        if cached is not None:
+            return cached
 
-        return cv.resize(img_mat, (size, size))
+        palette = np.array(
+            [_to_bgr(self.__back_color), _to_bgr(self.__fill_color)],
+            dtype=np.uint8,
+        )
+        modules = np.array(self.__object.get_matrix(), dtype=np.uint8)
+
+        image = self.__cv_images[size] = cv.resize(
+            palette[modules],
+            (size, size),
+            interpolation=cv.INTER_NEAREST,
+        )
+        return image
 
     def qrcode_cv_window_show(
         self,
@@ -125,3 +183,33 @@ class QRCode:
         cv.imshow('QRCode', self.__get_img_cv(size=size))
         cv.waitKey(delay=delay)
         cv.destroyAllWindows()
+
+
+def _to_bgr(color: str) -> Tuple[int, int, int]:
+    """Converts a color to its BGR value. The common colors and the
+    `#rrggbb` and `#rgb` codes are parsed here, and PIL is only imported
+    for the other color names.
+
+    Args:
+        color (str): The color name or code.
+
+    Returns:
+        Tuple[int, int, int]: The BGR value of the color.
+    """
+    lowered = color.lower()
+    if lowered in _BGR_COLORS:
+        return _BGR_COLORS[lowered]
+    if lowered.startswith('#') and len(lowered) in {4, 7}:
+        digits = lowered[1:]
+        if len(digits) == 3:  # noqa: PLR2004
+            digits = ''.join(digit * 2 for digit in digits)
+        try:
+            red, green, blue = bytes.fromhex(digits)
+        except ValueError:
+            pass
+        else:
+            return blue, green, red
+
+    from PIL import ImageColor  # noqa: PLC0415
+
+    return tuple(ImageColor.getrgb(color)[2::-1])
@@ -0,0 +1,813 @@
+import sys
+from itertools import product
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from PIL.Image import Image
+
+# Error correction levels, with the same values used by the qrcode library,
+# which are also the bits stored in the format information.
+ERROR_CORRECT_L = 1
+ERROR_CORRECT_M = 0
+ERROR_CORRECT_Q = 3
+ERROR_CORRECT_H = 2
+
+MIN_VERSION = 1
+MAX_VERSION = 40
+
+# Weights of the penalty rules used to choose the mask pattern.
+PENALTY_N1 = 3
+PENALTY_N2 = 3
+PENALTY_N3 = 40
+PENALTY_N4 = 10
+
+# Table index of each error correction level, from the lowest to the highest
+# correction.
+_ECL_INDEX = {
+    ERROR_CORRECT_L: 0,
+    ERROR_CORRECT_M: 1,
+    ERROR_CORRECT_Q: 2,
+    ERROR_CORRECT_H: 3,
+}
+
+# fmt: off
+_ECC_CODEWORDS_PER_BLOCK = (
+    (-1, 7, 10, 15, 20, 26, 18, 20, 24, 30, 18, 20, 24, 26, 30, 22, 24, 28,
+     30, 28, 28, 28, 28, 30, 30, 26, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+     30, 30, 30, 30, 30),
+    (-1, 10, 16, 26, 18, 24, 16, 18, 22, 22, 26, 30, 22, 22, 24, 24, 28, 28,
+     26, 26, 26, 26, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+     28, 28, 28, 28, 28),
+    (-1, 13, 22, 18, 26, 18, 24, 18, 22, 20, 24, 28, 26, 24, 20, 30, 24, 28,
+     28, 26, 30, 28, 30, 30, 30, 30, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+     30, 30, 30, 30, 30),
+    (-1, 17, 28, 22, 16, 22, 28, 26, 26, 24, 28, 24, 28, 22, 24, 24, 30, 28,
+     28, 26, 28, 30, 24, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+     30, 30, 30, 30, 30),
+)
+
+_NUM_ERROR_CORRECTION_BLOCKS = (
+    (-1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 4, 4, 4, 4, 4, 6, 6, 6, 6, 7, 8, 8, 9, 9,
+     10, 12, 12, 12, 13, 14, 15, 16, 17, 18, 19, 19, 20, 21, 22, 24, 25),
+    (-1, 1, 1, 1, 2, 2, 4, 4, 4, 5, 5, 5, 8, 9, 9, 10, 10, 11, 13, 14, 16, 17,
+     17, 18, 20, 21, 23, 25, 26, 28, 29, 31, 33, 35, 37, 38, 40, 43, 45, 47,
+     49),
+    (-1, 1, 1, 2, 2, 4, 4, 6, 6, 8, 8, 8, 10, 12, 16, 12, 17, 16, 18, 21, 20,
+     23, 23, 25, 27, 29, 34, 34, 35, 38, 40, 43, 45, 48, 51, 53, 56, 59, 62,
+     65, 68),
+    (-1, 1, 1, 2, 4, 4, 4, 5, 6, 8, 8, 11, 11, 16, 16, 18, 16, 19, 21, 25, 25,
+     25, 34, 30, 32, 35, 37, 40, 42, 45, 48, 51, 54, 57, 60, 63, 66, 70, 74,
+     77, 81),
+)
+# fmt: on
+
+_MASK_FUNCTIONS = (
+    lambda x, y: (x + y) % 2 == 0,
+    lambda x, y: y % 2 == 0,
+    lambda x, y: x % 3 == 0,
+    lambda x, y: (x + y) % 3 == 0,
+    lambda x, y: (x // 3 + y // 2) % 2 == 0,
+    lambda x, y: x * y % 2 + x * y % 3 == 0,
+    lambda x, y: (x * y % 2 + x * y % 3) % 2 == 0,
+    lambda x, y: ((x + y) % 2 + x * y % 3) % 2 == 0,
+)
+
+# Distances, from the center, of the light rings of the finder and of the
+# alignment patterns.
+_FINDER_LIGHT_RINGS = frozenset((2, 4))
+_ALIGNMENT_LIGHT_RINGS = frozenset((1,))
+
+_MODE_BYTE = 0b0100
+_PAD_CODEWORDS = (0xEC, 0x11)
+
+
+def _build_gf_tables() -> Tuple[bytes, bytes]:
+    """Builds the exponential and logarithm tables of GF(2^8), with the
+    0x11D reducing polynomial."""
+    exp = bytearray(512)
+    log = bytearray(256)
+    value = 1
+    for i in range(255):
+        exp[i] = value
+        log[value] = i
+        value <<= 1
+        if value & 0x100:
+            value ^= 0x11D
+    for i in range(255, 512):
+        exp[i] = exp[i - 255]
+    return bytes(exp), bytes(log)
+
+
+_GF_EXP, _GF_LOG = _build_gf_tables()
+
+# Per version caches of the function patterns and of the mask patterns. The
+# mask rows only cover the modules that are not part of a function pattern.
+_TEMPLATES: Dict[int, Tuple[Tuple[bytes, ...], Tuple[bytes, ...]]] = dict()
+_MASKS: Dict[int, Tuple[Tuple[int, ...], ...]] = dict()
+_RS_DIVISORS: Dict[int, bytes] = dict()
+
+
+def _num_raw_data_modules(version: int) -> int:
+    """Returns the number of modules available to store data and error
+    correction codewords, in the given version."""
+    result = (16 * version + 128) * version + 64
+    if version >= 2:  # noqa: PLR2004
+        num_align = version // 7 + 2
+        result -= (25 * num_align - 10) * num_align - 55
+        if version >= 7:  # noqa: PLR2004
+            result -= 36
+    return result
+
+
+def _num_data_codewords(version: int, ecl: int) -> int:
+    """Returns the number of data codewords of the given version and error
+    correction level."""
+    index = _ECL_INDEX[ecl]
+    return (
+        _num_raw_data_modules(version) // 8
+        - _ECC_CODEWORDS_PER_BLOCK[index][version]
+        * _NUM_ERROR_CORRECTION_BLOCKS[index][version]
+    )
+
+
+def _alignment_positions(version: int) -> List[int]:
+    """Returns the center coordinates of the alignment patterns."""
+    if version == 1:
+        return []
+    num_align = version // 7 + 2
+    step = (version * 8 + num_align * 3 + 5) // (num_align * 4 - 4) * 2
+    size = version * 4 + 17
+    positions = [size - 7 - i * step for i in range(num_align - 1)] + [6]
+    return positions[::-1]
+
+
+def _rs_divisor(degree: int) -> bytes:
+    """Returns the Reed-Solomon generator polynomial of the given degree,
+    without its leading coefficient."""
+    divisor = _RS_DIVISORS.get(degree)
+    if divisor is not None:
+        return divisor
+    result = bytearray(degree)
+    result[-1] = 1
+    root = 1
+    for _ in range(degree):
+        for j in range(degree):
+            result[j] = _gf_multiply(result[j], root)
+            if j + 1 < degree:
+                result[j] ^= result[j + 1]
+        root = _gf_multiply(root, 0x02)
+    divisor = _RS_DIVISORS[degree] = bytes(result)
+    return divisor
+
+
+def _gf_multiply(x: int, y: int) -> int:
+    """Multiplies two elements of GF(2^8)."""
+    if x == 0 or y == 0:
+        return 0
+    return _GF_EXP[_GF_LOG[x] + _GF_LOG[y]]
+
+
+def _rs_remainder(data: bytes, divisor: bytes) -> bytearray:
+    """Returns the Reed-Solomon error correction codewords of the data."""
+    gf_exp = _GF_EXP
+    divisor_log = [_GF_LOG[coef] if coef else -1 for coef in divisor]
+    result = bytearray(len(divisor))
+    for byte in data:
+        factor = byte ^ result[0]
+        del result[0]
+        result.append(0)
+        if factor:
+            factor_log = _GF_LOG[factor]
+            for i, coef_log in enumerate(divisor_log):
+                if coef_log >= 0:
+                    result[i] ^= gf_exp[coef_log + factor_log]
+    return result
+
+
+def _format_bits(ecl: int, mask: int) -> int:
+    """Returns the 15 format information bits, already masked."""
+    data = ecl << 3 | mask
+    rem = data
+    for _ in range(10):
+        rem = (rem << 1) ^ ((rem >> 9) * 0x537)
+    return (data << 10 | rem) ^ 0x5412
+
+
+def _version_bits(version: int) -> int:
+    """Returns the 18 version information bits."""
+    rem = version
+    for _ in range(12):
+        rem = (rem << 1) ^ ((rem >> 11) * 0x1F25)
+    return version << 12 | rem
+
+
+def _draw_rings(
+    set_function: Callable[[int, int, bool], None],
+    size: int,
+    center: Tuple[int, int],
+    radius: int,
+    light_rings: FrozenSet[int],
+) -> None:
+    """Draws a square pattern of concentric rings, clipped to the symbol.
+    The rings whose distance to the center is in `light_rings` are light."""
+    cx, cy = center
+    for dy in range(-radius, radius + 1):
+        for dx in range(-radius, radius + 1):
+            x, y = cx + dx, cy + dy
+            if 0 <= x < size and 0 <= y < size:
+                set_function(x, y, max(abs(dx), abs(dy)) not in light_rings)
+
+
+def _template(version: int) -> Tuple[Tuple[bytes, ...], Tuple[bytes, ...]]:
+    """Returns the modules and the function pattern flags of an empty
+    symbol of the given version, one byte per module. The format bits are
+    left light, and drawn for each mask pattern."""
+    cached = _TEMPLATES.get(version)
+    if cached is not None:
+        return cached
+    size = version * 4 + 17
+    modules = [bytearray(size) for _ in range(size)]
+    is_function = [bytearray(size) for _ in range(size)]
+
+    def set_function(x: int, y: int, dark: bool) -> None:
+        modules[y][x] = dark
+        is_function[y][x] = 1
+
+    for i in range(size):
+        set_function(6, i, i % 2 == 0)
+        set_function(i, 6, i % 2 == 0)
+
+    for center in ((3, 3), (size - 4, 3), (3, size - 4)):
+        _draw_rings(set_function, size, center, 4, _FINDER_LIGHT_RINGS)
+
+    positions = _alignment_positions(version)
+    corners = {(6, 6), (6, size - 7), (size - 7, 6)}
+    for center in product(positions, positions):
+        if center not in corners:
+            _draw_rings(set_function, size, center, 2, _ALIGNMENT_LIGHT_RINGS)
+
+    for i in range(9):
+        is_function[8][i] = is_function[i][8] = 1
+    for i in range(8):
+        is_function[8][size - 1 - i] = is_function[size - 1 - i][8] = 1
+    set_function(8, size - 8, True)
+
+    if version >= 7:  # noqa: PLR2004
+        bits = _version_bits(version)
+        for i in range(18):
+            dark = (bits >> i) & 1
+            a, b = size - 11 + i % 3, i // 3
+            set_function(a, b, dark)
+            set_function(b, a, dark)
+
+    cached = _TEMPLATES[version] = (
+        tuple(bytes(row) for row in modules),
+        tuple(bytes(row) for row in is_function),
+    )
+    return cached
+
+
+def _masks(version: int) -> Tuple[Tuple[int, ...], ...]:
+    """Returns the rows of each mask pattern of the given version, as
+    integers built from one byte per module, ready to be XORed with the
+    symbol rows."""
+    cached = _MASKS.get(version)
+    if cached is not None:
+        return cached
+    is_function = _template(version)[1]
+    size = len(is_function)
+    cached = _MASKS[version] = tuple(
+        tuple(
+            int.from_bytes(
+                bytes(
+                    not function[x] and mask_function(x, y)
+                    for x in range(size)
+                ),
+                'big',
+            )
+            for y, function in enumerate(is_function)
+        )
+        for mask_function in _MASK_FUNCTIONS
+    )
+    return cached
+
+
+def _draw_format_bits(modules: List[bytearray], ecl: int, mask: int) -> None:
+    """Draws both copies of the format information."""
+    size = len(modules)
+    bits = _format_bits(ecl, mask)
+    for i in range(6):
+        modules[i][8] = (bits >> i) & 1
+    modules[7][8] = (bits >> 6) & 1
+    modules[8][8] = (bits >> 7) & 1
+    modules[8][7] = (bits >> 8) & 1
+    for i in range(9, 15):
+        modules[8][14 - i] = (bits >> i) & 1
+    for i in range(8):
+        modules[8][size - 1 - i] = (bits >> i) & 1
+    for i in range(8, 15):
+        modules[size - 15 + i][8] = (bits >> i) & 1
+
+
+def _line_penalty(line: bytes, size: int) -> int:
+    """Returns the penalty of the runs of same colored modules (N1) and of
+    the finder-like patterns (N3) of a single row or column."""
+    result = 0
+    run_color = 0
+    run_length = 0
+    # Lengths of the last 7 runs, from the newest to the oldest.
+    rh0 = rh1 = rh2 = rh3 = rh4 = rh5 = rh6 = 0
+    for color in line:
+        if color == run_color:
+            run_length += 1
+            if run_length == 5:  # noqa: PLR2004
+                result += PENALTY_N1
+            elif run_length > 5:  # noqa: PLR2004
+                result += 1
+            continue
+        if rh0 == 0:
+            run_length += size
+        rh0, rh1, rh2, rh3, rh4, rh5, rh6 = (
+            run_length, rh0, rh1, rh2, rh3, rh4, rh5,
+        )  # fmt: skip
+        if not run_color:
+            result += PENALTY_N3 * _finder_patterns(
+                rh0, rh1, rh2, rh3, rh4, rh5, rh6
+            )
+        run_color = color
+        run_length = 1
+    if run_color:
+        if rh0 == 0:
+            run_length += size
+        rh0, rh1, rh2, rh3, rh4, rh5, rh6 = (
+            run_length, rh0, rh1, rh2, rh3, rh4, rh5,
+        )  # fmt: skip
+        run_length = 0
+    run_length += size
+    if rh0 == 0:
+        run_length += size
+    rh0, rh1, rh2, rh3, rh4, rh5, rh6 = (
+        run_length, rh0, rh1, rh2, rh3, rh4, rh5,
+    )  # fmt: skip
+    return result + PENALTY_N3 * _finder_patterns(
+        rh0, rh1, rh2, rh3, rh4, rh5, rh6
+    )
+
+
+def _finder_patterns(  # noqa: PLR0913, PLR0917
+    rh0: int,
+    rh1: int,
+    rh2: int,
+    rh3: int,
+    rh4: int,
+    rh5: int,
+    rh6: int,
+) -> int:
+    """Counts the 1:1:3:1:1 finder-like patterns, with a light run of 4
+    modules on either side, that end at the newest run of the history."""
+    n = rh1
+    core = n > 0 and rh2 == rh4 == rh5 == n and rh3 == n * 3
+    if not core:
+        return 0
+    return (rh0 >= n * 4 and rh6 >= n) + (rh6 >= n * 4 and rh0 >= n)
+
+
+def _penalty(rows: List[bytes]) -> int:
+    """Returns the penalty score of a symbol. The run, finder-like, 2x2
+    block and dark proportion rules are evaluated in a single pass over the
+    rows, and the run and finder-like rules in a single pass over the
+    columns."""
+    size = len(rows)
+    result = 0
+    dark = 0
+    previous = None
+    for row in rows:
+        result += _line_penalty(row, size)
+        dark += row.count(1)
+        if previous is not None:
+            for x in range(size - 1):
+                color = row[x]
+                if (
+                    color == row[x + 1]
+                    and color == previous[x]
+                    and color == previous[x + 1]
+                ):
+                    result += PENALTY_N2
+        previous = row
+    for column in zip(*rows):
+        result += _line_penalty(bytes(column), size)
+    total = size * size
+    k = (abs(dark * 20 - total * 10) + total - 1) // total - 1
+    return result + k * PENALTY_N4
+
+
+class DataOverflowError(ValueError):
+    """Raised when the data does not fit in the requested version."""
+
+
+class QRCode:
+    """Pure Python QR code encoder, with the subset of the `qrcode.QRCode`
+    interface used by this package. The data is always encoded in byte mode.
+
+    The symbol is kept as one `bytearray` per row, with one byte per module,
+    and the function patterns and mask patterns of each version are computed
+    once. Applying a mask is a XOR of whole rows, taken as integers, and the
+    penalty rules are evaluated in a pass over the rows and another over the
+    columns.
+
+    Args:
+        version (Optional[int], optional): The version of the symbol, from 1
+            to 40. If None, or if `make` is called with `fit=True`, the
+            smallest version that fits the data, starting at this one, is
+            used. Defaults to None.
+        error_correction (int, optional): The error correction level.
+            Defaults to ERROR_CORRECT_M.
+        box_size (int, optional): The size, in pixels, of each module of the
+            image. Defaults to 10.
+        border (int, optional): The width, in modules, of the quiet zone.
+            Defaults to 4.
+        mask_pattern (Optional[int], optional): The mask pattern, from 0 to
+            7. If None, the one with the lowest penalty is used.
+            Defaults to None.
+    """
+
+    def __init__(
+        self,
+        version: Optional[int] = None,
+        error_correction: int = ERROR_CORRECT_M,
+        box_size: int = 10,
+        border: int = 4,
+        mask_pattern: Optional[int] = None,
+    ) -> None:
+        if version is not None and not MIN_VERSION <= version <= MAX_VERSION:
+            raise ValueError(f'Invalid version {version}')
+        if error_correction not in _ECL_INDEX:
+            raise ValueError(f'Invalid error correction {error_correction}')
+        if mask_pattern is not None and not 0 <= mask_pattern < 8:  # noqa: PLR2004
+            raise ValueError(f'Invalid mask pattern {mask_pattern}')
+        self.version = version
+        self.error_correction = error_correction
+        self.box_size = box_size
+        self.border = border
+        self.mask_pattern = mask_pattern
+        self.modules: List[bytearray] = list()
+        self.modules_count = 0
+        self.data_cache: Optional[bytes] = None
+        self.__data = bytearray()
+
+    def add_data(self, data: Union[str, bytes]) -> None:
+        """Appends data to the symbol.
+
+        Args:
+            data (Union[str, bytes]): The data. Strings are UTF-8 encoded.
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        self.__data.extend(data)
+        self.data_cache = None
+
+    def clear(self) -> None:
+        """Removes all the data and the symbol."""
+        self.__data = bytearray()
+        self.modules = list()
+        self.modules_count = 0
+        self.data_cache = None
+
+    def __data_bits(self, version: int) -> int:
+        """Returns the number of bits of the byte mode segment."""
+        count_bits = 8 if version < 10 else 16  # noqa: PLR2004
+        return 4 + count_bits + len(self.__data) * 8
+
+    def best_fit(self, start: Optional[int] = None) -> int:
+        """Returns the smallest version that fits the data.
+
+        Args:
+            start (Optional[int], optional): The first version to try.
+                Defaults to 1.
+
+        Raises:
+            DataOverflowError: If the data does not fit in any version.
+
+        Returns:
+            int: The version.
+        """
+        for version in range(start or MIN_VERSION, MAX_VERSION + 1):
+            capacity = _num_data_codewords(version, self.error_correction)
+            if self.__data_bits(version) <= capacity * 8:
+                return version
+        raise DataOverflowError('Data too long for a QR code')
+
+    def make(self, fit: bool = True) -> None:
+        """Encodes the data and builds the symbol.
+
+        Args:
+            fit (bool, optional): If True, or if no version was given, the
+                smallest version that fits the data is used.
+                Defaults to True.
+
+        Raises:
+            DataOverflowError: If the data does not fit in the version.
+        """
+        if fit or self.version is None:
+            self.version = self.best_fit(self.version)
+        version = self.version
+        capacity = _num_data_codewords(version, self.error_correction)
+        if self.__data_bits(version) > capacity * 8:
+            raise DataOverflowError(
+                f'Data too long for a version {version} QR code',
+            )
+        codewords = self.__add_error_correction(self.__encode(capacity))
+        template, is_function = _template(version)
+        rows = self.__draw_codewords(codewords, template, is_function)
+        self.modules = self.__apply_best_mask(rows)
+        self.modules_count = len(self.modules)
+        self.data_cache = bytes(codewords)
+
+    def __encode(self, capacity: int) -> bytes:
+        """Returns the data codewords: the byte mode segment, the terminator
+        and the pad codewords."""
+        count_bits = 8 if self.version < 10 else 16  # noqa: PLR2004
+        data = self.__data
+        value = (_MODE_BYTE << count_bits | len(data)) << len(data) * 8
+        value |= int.from_bytes(data, 'big')
+        num_bits = self.__data_bits(self.version)
+        terminator = min(4, capacity * 8 - num_bits)
+        value <<= terminator
+        num_bits += terminator
+        padding = -num_bits % 8
+        value <<= padding
+        num_bits += padding
+        encoded = bytearray(value.to_bytes(num_bits // 8, 'big'))
+        for i in range(capacity - len(encoded)):
+            encoded.append(_PAD_CODEWORDS[i % 2])
+        return bytes(encoded)
+
+    def __add_error_correction(self, data: bytes) -> bytes:
+        """Splits the data codewords into blocks, appends the error
+        correction codewords of each block, and interleaves them."""
+        index = _ECL_INDEX[self.error_correction]
+        num_blocks = _NUM_ERROR_CORRECTION_BLOCKS[index][self.version]
+        block_ecc_len = _ECC_CODEWORDS_PER_BLOCK[index][self.version]
+        raw_codewords = _num_raw_data_modules(self.version) // 8
+        num_short_blocks = num_blocks - raw_codewords % num_blocks
+        short_block_len = raw_codewords // num_blocks
+        divisor = _rs_divisor(block_ecc_len)
+
+        blocks = list()
+        offset = 0
+        for i in range(num_blocks):
+            length = short_block_len - block_ecc_len + (i >= num_short_blocks)
+            block = bytearray(data[offset : offset + length])
+            offset += length
+            ecc = _rs_remainder(block, divisor)
+            if i < num_short_blocks:
+                block.append(0)
+            blocks.append(block + ecc)
+
+        result = bytearray()
+        skipped = short_block_len - block_ecc_len
+        for i in range(len(blocks[0])):
+            for j, block in enumerate(blocks):
+                if i != skipped or j >= num_short_blocks:
+                    result.append(block[i])
+        return bytes(result)
+
+    @staticmethod
+    def __draw_codewords(
+        codewords: bytes,
+        template: Tuple[bytes, ...],
+        is_function: Tuple[bytes, ...],
+    ) -> List[bytearray]:
+        """Draws the codewords on a copy of the template, in the zigzag
+        order, skipping the function patterns."""
+        rows = [bytearray(row) for row in template]
+        size = len(rows)
+        bits = int.from_bytes(codewords, 'big')
+        total = len(codewords) * 8
+        i = 0
+        right = size - 1
+        while right >= 1:
+            if right == 6:  # noqa: PLR2004
+                right = 5
+            upward = ((right + 1) & 2) == 0
+            for vert in range(size):
+                y = size - 1 - vert if upward else vert
+                row = rows[y]
+                function = is_function[y]
+                for x in (right, right - 1):
+                    if not function[x] and i < total:
+                        row[x] = (bits >> (total - 1 - i)) & 1
+                        i += 1
+            right -= 2
+        return rows
+
+    def __apply_best_mask(self, rows: List[bytearray]) -> List[bytearray]:
+        """Applies the mask pattern, or the one with the lowest penalty if
+        no mask was given, and draws the format information."""
+        size = len(rows)
+        values = [int.from_bytes(row, 'big') for row in rows]
+        masks = _masks(self.version)
+        candidates = (
+            range(len(masks))
+            if self.mask_pattern is None
+            else (self.mask_pattern,)
+        )
+        best = None
+        best_penalty = None
+        for mask in candidates:
+            masked = [
+                bytearray((value ^ mask_row).to_bytes(size, 'big'))
+                for value, mask_row in zip(values, masks[mask])
+            ]
+            _draw_format_bits(masked, self.error_correction, mask)
+            if len(candidates) == 1:
+                return masked
+            penalty = _penalty(masked)
+            if best_penalty is None or penalty < best_penalty:
+                best, best_penalty = masked, penalty
+        return best
+
+    def __ensure_made(self) -> None:
+        if self.data_cache is None:
+            self.make()
+
+    def get_matrix(self) -> List[List[bool]]:
+        """Returns the symbol modules, including the quiet zone.
+
+        Returns:
+            List[List[bool]]: The modules, row by row. True is dark.
+        """
+        self.__ensure_made()
+        width = self.modules_count + self.border * 2
+        light = [False] * width
+        edge = [False] * self.border
+        return (
+            [light[:] for _ in range(self.border)]
+            + [edge + [bool(m) for m in row] + edge for row in self.modules]
+            + [light[:] for _ in range(self.border)]
+        )
+
+    def ascii(self, tty: bool = False, invert: bool = False) -> str:
+        """Returns the symbol drawn with half block characters, two rows of
+        modules per line of text, the same as `qrcode.QRCode.print_ascii`.
+
+        Args:
+            tty (bool, optional): If True, the colors are forced with ANSI
+                escape codes. Defaults to False.
+            invert (bool, optional): Inverts the dark and light modules.
+                Defaults to False.
+
+        Returns:
+            str: The drawn symbol.
+        """
+        self.__ensure_made()
+        count = self.modules_count
+        border = self.border
+        codes = ['\xa0', '▀', '▄', '█']
+        if tty:
+            invert = True
+        if invert:
+            codes.reverse()
+
+        def get_module(row: int, col: int) -> int:
+            if invert and border and max(row, col) >= count + border:
+                return 1
+            if min(row, col) < 0 or max(row, col) >= count:
+                return 0
+            return self.modules[row][col]
+
+        lines = list()
+        for row in range(-border, count + border, 2):
+            prefix = suffix = ''
+            if tty:
+                if not invert or row < count + border - 1:
+                    prefix = '\x1b[48;5;232m'
+                prefix += '\x1b[38;5;255m'
+                suffix = '\x1b[0m'
+            lines.append(
+                prefix
+                + ''.join(
+                    codes[get_module(row, col) | get_module(row + 1, col) << 1]
+                    for col in range(-border, count + border)
+                )
+                + suffix
+                + '\n'
+            )
+        return ''.join(lines)
+
+    def print_ascii(
+        self,
+        out: Optional[TextIO] = None,
+        tty: bool = False,
+        invert: bool = False,
+    ) -> None:
+        """Prints the symbol drawn by `ascii`.
+
+        Args:
+            out (Optional[TextIO], optional): The output stream. Defaults to
+                the standard output.
+            tty (bool, optional): If True, the colors are forced with ANSI
+                escape codes. Defaults to False.
+            invert (bool, optional): Inverts the dark and light modules.
+                Defaults to False.
+
+        Raises:
+            OSError: If `tty` is set and the output is not a tty.
+        """
+        if out is None:
+            out = sys.stdout
+        if tty and not out.isatty():
+            raise OSError('Not a tty')
+        out.write(self.ascii(tty=tty, invert=invert))
+        out.flush()
+
+    def make_image(
+        self,
+        fill_color: str = 'black',
+        back_color: str = 'white',
+    ) -> 'Image':
+        """Renders the symbol as a PIL image.
+
+        Args:
+            fill_color (str, optional): The color of the dark modules.
+                Defaults to 'black'.
+            back_color (str, optional): The color of the light modules.
+                Defaults to 'white'.
+
+        Returns:
+            Image: The rendered image.
+        """
+        from PIL import Image, ImageOps  # noqa: PLC0415
+
+        self.__ensure_made()
+        count = self.modules_count + self.border * 2
+        raster = bytearray(b'\xff') * (count * count)
+        offset = self.border * count + self.border
+        for y, row in enumerate(self.modules):
+            start = offset + y * count
+            raster[start : start + self.modules_count] = row.translate(
+                _RASTER_TABLE,
+            )
+        image = Image.frombytes('L', (count, count), bytes(raster))
+        size = count * self.box_size
+        image = image.resize((size, size), Image.NEAREST)
+        return ImageOps.colorize(image, black=fill_color, white=back_color)
+
+    def make_svg(
+        self,
+        fill_color: str = 'black',
+        back_color: str = 'white',
+    ) -> str:
+        """Renders the symbol as a SVG document, drawing each horizontal run
+        of dark modules as a single rectangle of a path. The document is
+        scaled by `box_size`, one user unit per module.
+
+        Args:
+            fill_color (str, optional): The color of the dark modules.
+                Defaults to 'black'.
+            back_color (str, optional): The color of the light modules.
+                Defaults to 'white'.
+
+        Returns:
+            str: The SVG document.
+        """
+        self.__ensure_made()
+        count = self.modules_count + self.border * 2
+        size = count * self.box_size
+        commands = list()
+        for y, row in enumerate(self.modules, self.border):
+            x = 0
+            end = len(row)
+            while x < end:
+                if not row[x]:
+                    x += 1
+                    continue
+                start = x
+                while x < end and row[x]:
+                    x += 1
+                commands.append(
+                    f'M{start + self.border},{y}h{x - start}v1h-{x - start}z',
+                )
+        return (
+            '<svg xmlns="http://www.w3.org/2000/svg" '
+            f'width="{size}" height="{size}" '
+            f'viewBox="0 0 {count} {count}" shape-rendering="crispEdges">'
+            f'<rect width="{count}" height="{count}" fill="{back_color}"/>'
+            f'<path d="{"".join(commands)}" fill="{fill_color}"/>'
+            '</svg>'
+        )
+
+
+# Maps the module values to grayscale pixels: dark modules to 0, light modules
+# to 255.
+_RASTER_TABLE = bytes([255, 0]) + bytes(254)
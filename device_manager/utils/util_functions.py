@@ -1,12 +1,19 @@
 import re
 import secrets
 import string
-from typing import List
+from typing import Dict, List
+
+PASSWORD_ALPHABET = string.ascii_letters + string.digits
+
+# Random bytes equal or above this limit are discarded, so every character of
+# the alphabet is drawn with the same probability.
+_PASSWORD_BYTE_LIMIT = 256 - 256 % len(PASSWORD_ALPHABET)
 
 
 def create_password(size: int = 8) -> str:
     """Creates a random password.
-    The password contains only alphanumeric characters.
+    The password contains only alphanumeric characters. The random bytes are
+    read from the OS at once, instead of once per character.
 
     Args:
         size (int, optional): The size of the password. Defaults to 8.
@@ -14,8 +21,15 @@ def create_password(size: int = 8) -> str:
     Returns:
         str: The random password.
     """
-    alphabet = string.ascii_letters + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(size))
+    alphabet_size = len(PASSWORD_ALPHABET)
+    password = list()
+    while len(password) < size:
+        for byte in secrets.token_bytes(size * 2):
+            if byte < _PASSWORD_BYTE_LIMIT:
+                password.append(PASSWORD_ALPHABET[byte % alphabet_size])
+                if len(password) == size:
+                    break
+    return ''.join(password)
 
 
 def grep(
@@ -39,3 +53,47 @@ def grep(
 
     matching_lines = [line for line in text.splitlines() if regex.search(line)]
     return matching_lines
+
+
+def parse_adb_devices(output: str) -> Dict[str, str]:
+    """Parses the output of the `adb devices` command.
+
+    Args:
+        output (str): The output of the `adb devices` command.
+
+    Returns:
+        Dict[str, str]: The state of each device (e.g. `device`,
+            `offline`, `unauthorized`), indexed by its serial or
+            communication URI.
+    """
+    devices = dict()
+    for line in output.splitlines():
+        serial, sep, state = line.partition('\t')
+        if sep:
+            devices[serial] = state.strip()
+    return devices
+
+
+def interface_addresses(interface: str) -> List[str]:
+    """Returns the IPv4 addresses of a network interface, e.g. to bind the
+    Zeroconf instance to it.
+
+    Args:
+        interface (str): The name of the network interface, e.g. `wlan0`.
+
+    Raises:
+        ValueError: If the interface does not exist, or has no IPv4 address.
+
+    Returns:
+        List[str]: The IPv4 addresses of the interface.
+    """
+    import ifaddr  # noqa: PLC0415
+
+    for adapter in ifaddr.get_adapters():
+        if interface not in {adapter.name, adapter.nice_name}:
+            continue
+        addresses = [ip.ip for ip in adapter.ips if isinstance(ip.ip, str)]
+        if addresses:
+            return addresses
+        break
+    raise ValueError(f'No IPv4 address found for interface {interface!r}')
@@ -0,0 +1,147 @@
+import io
+import tarfile
+
+import pytest
+
+from device_manager.actions.camera_actions import CameraActions
+from device_manager.exceptions import AdbServerError
+
+COMM_URI = '192.168.0.10:5555'
+
+
+def tar_stream(files: dict) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w') as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    buffer.seek(0)
+    return buffer
+
+
+@pytest.fixture
+def adb(mocker):
+    client = mocker.patch('device_manager.actions.camera_actions.AdbClient')
+    return client.return_value
+
+
+@pytest.fixture
+def camera(adb, mocker):
+    return CameraActions(
+        device_connection=mocker.MagicMock(),
+        serial_number='serial',
+        subprocess_check_flag=True,
+        comm_uri=COMM_URI,
+    )
+
+
+def test_pull_pictures(camera, adb, tmp_path):
+    adb.shell.return_value = b'IMG_2.jpg\nIMG_1.jpg\n0\n'
+    adb.exec_out.return_value.__enter__.return_value = tar_stream({
+        'IMG_2.jpg': b'second',
+        'IMG_1.jpg': b'first',
+    })
+
+    camera.pull_pictures(tmp_path, amount=2)
+
+    assert (tmp_path / 'IMG_1.jpg').read_bytes() == b'first'
+    assert (tmp_path / 'IMG_2.jpg').read_bytes() == b'second'
+    assert 'head -n 2' in adb.shell.call_args.args[1]
+    assert adb.exec_out.call_args.args[1].endswith('IMG_2.jpg IMG_1.jpg')
+
+
+def test_pull_pictures_from_empty_folder(camera, adb, tmp_path):
+    adb.shell.return_value = b'0\n'
+
+    camera.pull_pictures(tmp_path)
+
+    adb.exec_out.assert_not_called()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_pull_pictures_raises_when_listing_fails(camera, adb, tmp_path):
+    adb.shell.return_value = b'sh: cd: Permission denied\n2\n'
+
+    with pytest.raises(RuntimeError, match='status 2'):
+        camera.pull_pictures(tmp_path)
+
+    adb.exec_out.assert_not_called()
+
+
+def test_pull_pictures_raises_on_missing_pictures(camera, adb, tmp_path):
+    adb.shell.return_value = b'IMG_2.jpg\nIMG_1.jpg\n0\n'
+    adb.exec_out.return_value.__enter__.return_value = tar_stream({
+        'IMG_2.jpg': b'second',
+    })
+
+    with pytest.raises(RuntimeError, match='IMG_1.jpg'):
+        camera.pull_pictures(tmp_path, amount=2)
+
+
+def test_shell_decodes_output(camera, adb):
+    adb.shell.return_value = 'câmera\n'.encode()
+
+    assert camera._shell('echo câmera') == 'câmera\n'
+    adb.shell.assert_called_once_with(
+        COMM_URI,
+        'echo câmera',
+        capture_output=True,
+    )
+
+
+def test_shell_logs_failure_without_check_flag(camera, adb):
+    camera.subprocess_check_flag = False
+    adb.shell.side_effect = AdbServerError('device offline')
+
+    assert not camera._shell('ls')
+
+
+def test_shell_raises_failure_with_check_flag(camera, adb):
+    adb.shell.side_effect = AdbServerError('device offline')
+
+    with pytest.raises(AdbServerError, match='device offline'):
+        camera._shell('ls')
+
+
+def test_package_is_cached(camera, adb):
+    adb.shell.return_value = b'priority=0\ncom.android.camera/.Camera\n'
+
+    assert camera.package() == 'com.android.camera'
+    assert camera.package() == 'com.android.camera'
+    adb.shell.assert_called_once()
+
+
+def test_package_without_camera(camera, adb):
+    adb.shell.return_value = b'No activity found\n'
+
+    assert camera.package() is None
+
+
+def test_refresh_package(camera, adb):
+    adb.shell.return_value = b'com.android.camera/.Camera\n'
+    camera.package()
+    adb.shell.return_value = b'com.google.android.GoogleCamera/.Camera\n'
+
+    assert camera.refresh_package() == 'com.google.android.GoogleCamera'
+    assert adb.shell.call_count == 2  # noqa: PLR2004
+
+
+def test_open_and_capture_sends_a_single_script(camera, adb):
+    adb.shell.return_value = b''
+
+    camera.open_and_capture(amount=3)
+
+    adb.shell.assert_called_once()
+    script = adb.shell.call_args.args[1]
+    assert script.startswith('am start -a ')
+    assert 'for i in $(seq 3); do input keyevent KEYCODE_ENTER;' in script
+    assert adb.shell.call_args.kwargs == {'capture_output': False}
+
+
+def test_actions_require_a_valid_connection(camera, adb):
+    camera.validate_connection_callback = lambda: False
+
+    with pytest.raises(RuntimeError, match='not valid'):
+        camera.open_and_capture()
+    adb.shell.assert_not_called()
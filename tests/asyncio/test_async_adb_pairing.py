@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from device_manager.asyncio.async_adb_pairing import AsyncAdbPairing
+from device_manager.connection.utils.service_info import ServiceInfo
+from device_manager.exceptions import AdbServerError
+
+COMM_URI = '192.168.0.10:37000'
+
+
+@pytest.fixture
+def mock_create_process(mocker):
+    process = mocker.MagicMock(returncode=0)
+    process.communicate = mocker.AsyncMock(
+        return_value=(f'Successfully paired to {COMM_URI}'.encode(), b''),
+    )
+    return mocker.patch(
+        'device_manager.asyncio.async_adb_pairing.asyncio.create_subprocess_exec',
+        return_value=process,
+    )
+
+
+@pytest.mark.enable_socket
+def test_pair_through_adb_server(mocker, mock_create_process):
+    adb_pair = mocker.patch(
+        'device_manager.adb_client.AdbClient.pair',
+        return_value=f'Successfully paired to {COMM_URI} [guid=adb-1]',
+    )
+    pairing = AsyncAdbPairing(password='123456')
+
+    assert asyncio.run(pairing._pair(COMM_URI)) is True
+    adb_pair.assert_called_once_with(COMM_URI, '123456')
+    mock_create_process.assert_not_called()
+
+
+@pytest.mark.enable_socket
+def test_pair_skips_recently_paired_device(mocker, mock_create_process):
+    mocker.patch(
+        'device_manager.adb_client.AdbClient.pair',
+        side_effect=AdbServerError('adb server not reachable'),
+    )
+    pairing = AsyncAdbPairing(password='123456')
+
+    assert asyncio.run(pairing._pair(COMM_URI)) is True
+    assert asyncio.run(pairing._pair(COMM_URI)) is True
+    mock_create_process.assert_called_once()
+
+
+@pytest.mark.enable_socket
+def test_pair_devices_limits_concurrency(mocker):
+    running = 0
+    max_running = 0
+
+    async def fake_pair(comm_uri):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return True
+
+    pairing = AsyncAdbPairing(password='123456', max_concurrent_pairings=2)
+    for port in range(5):
+        info = ServiceInfo(str(port), '192.168.0.10', 37000 + port)
+        pairing._context.add_service(str(port), info)
+    mocker.patch.object(pairing, '_pair', side_effect=fake_pair)
+
+    assert asyncio.run(pairing.pair_devices()) is True
+    assert max_running == 2  # noqa: PLR2004
+
+
+@pytest.mark.enable_socket
+def test_pair_retries_and_stops_listener(mocker):
+    pairing = AsyncAdbPairing(password='123456')
+    mocker.patch.object(pairing, 'start', mocker.AsyncMock())
+    stop = mocker.patch.object(
+        pairing, 'stop_pair_listener', mocker.AsyncMock()
+    )
+    sleep = mocker.patch(
+        'device_manager.asyncio.async_adb_pairing.asyncio.sleep',
+        mocker.AsyncMock(),
+    )
+    pair_online = mocker.patch.object(
+        pairing,
+        'pair_online_devices',
+        mocker.AsyncMock(
+            side_effect=[
+                {'a': True, 'b': False},
+                {'a': True, 'b': True},
+            ],
+        ),
+    )
+
+    async def run():
+        async with pairing.pair() as qrcode_string:
+            assert qrcode_string == pairing.qrcode_string
+
+    asyncio.run(run())
+
+    assert pair_online.await_args_list[1].kwargs == {'skip': {'a'}}
+    sleep.assert_awaited_once()
+    stop.assert_awaited_once()
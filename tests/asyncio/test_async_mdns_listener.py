@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from device_manager.asyncio.async_mdns_listener import AsyncMDnsListener
+from device_manager.connection.utils.mdns_context import MDnsContext
+from device_manager.connection.utils.service_info import ServiceInfo
+
+
+def test_add_service_is_batched(mocker):
+    zc = mocker.MagicMock()
+    listener = AsyncMDnsListener(MDnsContext())
+    listener.add_service(zc, 'test-type', 'first')
+    listener.update_service(zc, 'test-type', 'second')
+
+    zc.loop.call_soon_threadsafe.assert_called_once()
+
+
+@pytest.mark.enable_socket
+def test_flush_updates_context_and_sets_found_event(mocker):
+    async def scenario() -> MDnsContext:
+        context = MDnsContext()
+        zc = mocker.MagicMock()
+        zc.async_get_service_info = mocker.AsyncMock()
+        event = asyncio.Event()
+        listener = AsyncMDnsListener(
+            context,
+            found_event=event,
+            loop=asyncio.get_running_loop(),
+        )
+        mocker.patch.object(
+            listener,
+            '_extract_info',
+            return_value=ServiceInfo('emulator', '127.0.0.1', 5555),
+        )
+        listener.add_service(zc, 'test-type', 'test-name')
+        await listener._flush(zc)
+        await asyncio.wait_for(event.wait(), timeout=1)
+        return context
+
+    context = asyncio.run(scenario())
+
+    assert 'emulator' in context.get_online_service()
@@ -111,3 +111,32 @@ def test_object_manager_keys_returns_keys():
     manager.add('two', 2)
 
     assert manager.keys() == {'one': 1, 'two': 2}.keys()
+
+
+def test_object_manager_accepts_new_type_once_empty():
+    manager = ObjectManager()
+    manager.add('one', 1)
+    manager.remove('one')
+    manager.add('two', '2')
+
+    assert manager['two'] == '2'
+
+
+def test_object_manager_values_and_items():
+    manager = ObjectManager()
+    manager.add('one', 1)
+    manager.add('two', 2)
+
+    assert list(manager.values()) == [1, 2]
+    assert list(manager.items()) == [('one', 1), ('two', 2)]
+
+
+def test_object_manager_with_explicit_type():
+    manager = ObjectManager(int)
+    with pytest.raises(TypeError):
+        manager.add('one', '1')
+
+    manager.add('one', 1)
+    manager.remove('one')
+    with pytest.raises(TypeError):
+        manager.add('two', '2')
@@ -0,0 +1,46 @@
+from device_manager.connection.adb_connection_discovery import (
+    AdbConnectionDiscovery,
+)
+
+
+def test_stop_discovery_listener_without_start():
+    discovery = AdbConnectionDiscovery()
+    discovery.stop_discovery_listener()
+
+    assert not discovery.service_browser_started
+
+
+def test_stop_discovery_listener_closes_once(mocker):
+    zeroconf = mocker.patch(
+        'device_manager.connection.adb_connection_discovery.Zeroconf',
+    )
+    mocker.patch(
+        'device_manager.connection.adb_connection_discovery.ServiceBrowser',
+    )
+    discovery = AdbConnectionDiscovery()
+    discovery.start()
+    discovery.stop_discovery_listener()
+    discovery.stop_discovery_listener()
+
+    zeroconf.return_value.close.assert_called_once()
+    assert not discovery.service_browser_started
+    assert not discovery.zeroconf_status
+
+
+def test_zeroconf_finalizer_marks_browser_stopped(mocker):
+    mocker.patch('device_manager.connection.adb_connection_discovery.Zeroconf')
+    mocker.patch(
+        'device_manager.connection.adb_connection_discovery.ServiceBrowser',
+    )
+    discovery = AdbConnectionDiscovery()
+    discovery.start()
+    discovery._AdbConnectionDiscovery__finalize()
+
+    assert not discovery.service_browser_started
+    assert discovery.browser is None
+
+
+def test_wait_for_devices_times_out_without_devices():
+    discovery = AdbConnectionDiscovery()
+
+    assert not discovery.wait_for_devices(timeout=0)
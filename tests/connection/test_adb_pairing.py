@@ -0,0 +1,296 @@
+import gc
+import weakref
+
+import pytest
+
+from device_manager.connection.adb_pairing import AdbPairing
+from device_manager.connection.utils.service_info import ServiceInfo
+from device_manager.exceptions import AdbServerError
+
+COMM_URI = '192.168.0.10:37000'
+
+
+def test_pair_online_devices_through_adb_server(mocker):
+    adb_pair = mocker.patch(
+        'device_manager.connection.adb_pairing.AdbClient.pair',
+        return_value=f'Successfully paired to {COMM_URI} [guid=adb-1]',
+    )
+    popen = mocker.patch(
+        'device_manager.connection.adb_pairing.subprocess.Popen',
+    )
+    pairing = AdbPairing(password='123456')
+    pairing._context.add_service('0', ServiceInfo('0', '192.168.0.10', 37000))
+
+    assert pairing.pair_online_devices() == {COMM_URI: True}
+    adb_pair.assert_called_once_with(COMM_URI, '123456')
+    popen.assert_not_called()
+
+
+def test_pair_devices_falls_back_to_adb_process(mocker):
+    mocker.patch(
+        'device_manager.connection.adb_pairing.AdbClient.pair',
+        side_effect=AdbServerError('adb server not reachable'),
+    )
+    popen = mocker.patch(
+        'device_manager.connection.adb_pairing.subprocess.Popen',
+    )
+    popen.return_value.communicate.return_value = (
+        f'Successfully paired to {COMM_URI}',
+        '',
+    )
+    popen.return_value.returncode = 0
+    pairing = AdbPairing(password='123456')
+    pairing._context.add_service('0', ServiceInfo('0', '192.168.0.10', 37000))
+
+    assert pairing.pair_devices() is True
+    popen.assert_called_once()
+    assert popen.call_args.args[0] == ['adb', 'pair', COMM_URI, '123456']
+
+
+def test_pair_devices_pairs_every_online_service(mocker):
+    pairing = AdbPairing(password='123456')
+    for port in range(3):
+        info = ServiceInfo(str(port), '192.168.0.10', 37000 + port)
+        pairing._context.add_service(str(port), info)
+    adb_pair = mocker.patch.object(
+        pairing._adb,
+        'pair',
+        side_effect=lambda uri, _: f'Successfully paired to {uri}',
+    )
+
+    assert pairing.pair_devices() is True
+    assert sorted(call.args[0] for call in adb_pair.call_args_list) == [
+        '192.168.0.10:37000',
+        '192.168.0.10:37001',
+        '192.168.0.10:37002',
+    ]
+
+
+def test_pair_devices_spawns_fallback_processes_before_waiting(mocker):
+    pairing = AdbPairing(password='123456')
+    for port in range(3):
+        info = ServiceInfo(str(port), '192.168.0.10', 37000 + port)
+        pairing._context.add_service(str(port), info)
+    mocker.patch.object(
+        pairing._adb,
+        'pair',
+        side_effect=AdbServerError('adb server not reachable'),
+    )
+    events = list()
+
+    def spawn(args, **kwargs):
+        events.append(('spawn', args[2]))
+        process = mocker.MagicMock(args=args, returncode=0)
+        process.communicate.side_effect = lambda **_: (
+            events.append(('wait', args[2]))
+            or (f'Successfully paired to {args[2]}', '')
+        )
+        return process
+
+    mocker.patch(
+        'device_manager.connection.adb_pairing.subprocess.Popen',
+        side_effect=spawn,
+    )
+
+    assert pairing.pair_devices() is True
+    assert [event for event, _ in events] == ['spawn'] * 3 + ['wait'] * 3
+
+
+def test_pair_devices_without_services():
+    assert AdbPairing(password='123456').pair_devices() is False
+
+
+def test_pairing_sessions_share_zeroconf(mocker):
+    zeroconf = mocker.patch('device_manager.connection.adb_pairing.Zeroconf')
+    zeroconf.return_value.done = False
+    mocker.patch('device_manager.connection.adb_pairing.ServiceBrowser')
+    mocker.patch.object(AdbPairing, '_shared_zc', None)
+    first = AdbPairing(password='123456')
+    second = AdbPairing(password='123456')
+    first.start()
+    second.start()
+    first.stop_pair_listener()
+    second.stop_pair_listener()
+
+    zeroconf.assert_called_once()
+    zeroconf.return_value.close.assert_not_called()
+
+
+def test_restart_cancels_browser_and_keeps_shared_zeroconf(mocker):
+    zeroconf = mocker.patch('device_manager.connection.adb_pairing.Zeroconf')
+    zeroconf.return_value.done = False
+    browser = mocker.patch(
+        'device_manager.connection.adb_pairing.ServiceBrowser',
+    )
+    mocker.patch.object(AdbPairing, '_shared_zc', None)
+    pairing = AdbPairing(password='123456')
+    pairing.start()
+    pairing.stop_pair_listener()
+    pairing.start()
+    pairing.stop_pair_listener()
+
+    zeroconf.assert_called_once()
+    assert browser.return_value.cancel.call_count == 2  # noqa: PLR2004
+    assert pairing.service_browser_started is False
+
+
+def test_stop_drops_closed_private_zeroconf(mocker):
+    zeroconf = mocker.patch('device_manager.connection.adb_pairing.Zeroconf')
+    mocker.patch('device_manager.connection.adb_pairing.ServiceBrowser')
+    pairing = AdbPairing(password='123456')
+    pairing.start(unicast=True)
+    pairing.stop_pair_listener()
+    pairing.start(unicast=True)
+
+    zeroconf.return_value.close.assert_called_once()
+    assert not pairing._zeroconf_zombies
+
+
+def test_set_same_password_keeps_qrcode():
+    pairing = AdbPairing(password='123456')
+    qrcode = pairing.qrcode
+
+    pairing.set_password('123456')
+    pairing.update_qrcode()
+    assert pairing.qrcode is qrcode
+
+    pairing.set_password('654321')
+    assert pairing.qrcode is not qrcode
+    assert 'P:654321;' in pairing.qrcode_string
+
+
+def test_qrcode_is_built_on_first_use(mocker):
+    qrcode = mocker.patch('device_manager.connection.adb_pairing.QRCode')
+    pairing = AdbPairing(password='123456')
+    assert 'P:123456;' in pairing.qrcode_string
+    qrcode.assert_not_called()
+
+    pairing.qrcode_prompt_show()
+    qrcode.assert_called_once_with(qrcode_data=pairing.qrcode_string)
+
+
+def test_check_paired_matches_the_paired_uri():
+    pairing = AdbPairing(password='123456')
+
+    assert pairing._check_paired(
+        COMM_URI,
+        f'Successfully paired to {COMM_URI} [guid=adb-1]',
+    )
+    assert not pairing._check_paired(
+        COMM_URI,
+        f'Successfully paired to {COMM_URI}0 [guid=adb-1]',
+    )
+    assert not pairing._check_paired(COMM_URI, 'Failed: Wrong password')
+
+
+def test_replaced_zeroconf_instances_are_bounded(mocker):
+    instances = [mocker.MagicMock(name=f'zc{i}') for i in range(3)]
+    mocker.patch(
+        'device_manager.connection.adb_pairing.Zeroconf',
+        side_effect=instances,
+    )
+    pairing = AdbPairing(password='123456', max_zeroconf_instances=1)
+    for _ in instances:
+        pairing._new_zeroconf_instance(unicast=True)
+
+    instances[0].close.assert_called_once()
+    assert list(pairing._zeroconf_zombies) == [instances[1]]
+
+    pairing.stop_pair_listener()
+    instances[1].close.assert_called_once()
+    assert not pairing._zeroconf_zombies
+
+
+def test_pair_stops_listener_on_exit(mocker):
+    pairing = AdbPairing(password='123456')
+    mocker.patch.object(pairing, 'start')
+    stop = mocker.patch.object(pairing, 'stop_pair_listener')
+    mocker.patch('device_manager.connection.adb_pairing.time.sleep')
+    pair_online = mocker.patch.object(
+        pairing,
+        'pair_online_devices',
+        side_effect=[{COMM_URI: False}, RuntimeError('adb failed')],
+    )
+
+    with pytest.raises(RuntimeError, match='adb failed'):
+        with pairing.pair() as qrcode_string:
+            assert qrcode_string == pairing.qrcode_string
+
+    assert pair_online.call_count == 2  # noqa: PLR2004
+    stop.assert_called_once()
+
+
+def test_pair_online_devices_skips_paired_devices(mocker):
+    pairing = AdbPairing(password='123456')
+    for port in range(2):
+        info = ServiceInfo(str(port), '192.168.0.10', 37000 + port)
+        pairing._context.add_service(str(port), info)
+    adb_pair = mocker.patch.object(
+        pairing._adb,
+        'pair',
+        side_effect=lambda uri, _: f'Successfully paired to {uri}',
+    )
+
+    results = pairing.pair_online_devices(skip={'192.168.0.10:37000'})
+
+    assert results == {'192.168.0.10:37000': True, '192.168.0.10:37001': True}
+    adb_pair.assert_called_once_with('192.168.0.10:37001', '123456')
+
+
+def test_pair_retries_only_unpaired_devices(mocker):
+    pairing = AdbPairing(password='123456')
+    mocker.patch.object(pairing, 'start')
+    mocker.patch.object(pairing, 'stop_pair_listener')
+    sleep = mocker.patch('device_manager.connection.adb_pairing.time.sleep')
+    pair_online = mocker.patch.object(
+        pairing,
+        'pair_online_devices',
+        side_effect=[{'a': True, 'b': False}, {'a': True, 'b': True}],
+    )
+
+    with pairing.pair(max_attempts=5):
+        pass
+
+    assert pair_online.call_count == 2  # noqa: PLR2004
+    assert pair_online.call_args_list[1].kwargs == {'skip': {'a'}}
+    sleep.assert_called_once_with(0.25)
+
+
+def test_zeroconf_finalizer_does_not_keep_pairing_alive(mocker):
+    mocker.patch('device_manager.connection.adb_pairing.Zeroconf')
+    mocker.patch('device_manager.connection.adb_pairing.ServiceBrowser')
+    pairing = AdbPairing(password='123456')
+    pairing.start(unicast=True)
+    finalizer = pairing._finalize
+    pairing_ref = weakref.ref(pairing)
+    del pairing
+    gc.collect()
+
+    assert pairing_ref() is None
+    assert finalizer.alive
+    finalizer()
+
+
+def test_interface_binds_zeroconf_to_its_addresses(mocker):
+    zeroconf = mocker.patch('device_manager.connection.adb_pairing.Zeroconf')
+    mocker.patch('device_manager.connection.adb_pairing.ServiceBrowser')
+    mocker.patch(
+        'device_manager.connection.adb_pairing.interface_addresses',
+        return_value=['192.168.0.5'],
+    )
+    pairing = AdbPairing(password='123456', interface='wlan0')
+    pairing.start()
+    pairing.stop_pair_listener()
+
+    assert zeroconf.call_args.kwargs['interfaces'] == ['192.168.0.5']
+
+
+def test_qrcode_string_is_rebuilt_after_password_change():
+    pairing = AdbPairing(service_name='robot', password='123456')
+    qrcode_string = pairing.qrcode_string
+
+    assert pairing.qrcode_string is qrcode_string
+    pairing.set_password('654321', update_qrcode=False)
+    assert pairing.qrcode_string == 'WIFI:T:ADB;S:robot;P:654321;;'
+    pairing.update_qrcode(new_password=True)
+    assert pairing.password in pairing.qrcode_string
@@ -0,0 +1,113 @@
+import pytest
+
+from device_manager.connection.connection_manager import (
+    ConnectionManager,
+    ConnectionManagerSingleton,
+)
+from device_manager.connection.utils.service_info import ServiceInfo
+from device_manager.exceptions import (
+    AdbServerError,
+    AdbServerUnreachableError,
+)
+
+COMM_URI = '192.168.0.10:5555'
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    ConnectionManager.invalidate_adb_devices_cache()
+    yield
+    ConnectionManager.invalidate_adb_devices_cache()
+
+
+def test_check_connection_through_adb_server(mocker):
+    devices = mocker.patch.object(
+        ConnectionManager._adb_host,
+        'devices',
+        return_value={COMM_URI: 'device'},
+    )
+    run = mocker.patch(
+        'device_manager.connection.connection_manager.subprocess.run',
+    )
+
+    assert ConnectionManager.check_devices_adb_connection(COMM_URI)
+    assert ConnectionManager.check_devices_adb_connection(COMM_URI)
+    devices.assert_called_once()
+    run.assert_not_called()
+
+
+def test_check_connection_falls_back_to_adb_process(mocker):
+    mocker.patch.object(
+        ConnectionManager._adb_host,
+        'devices',
+        side_effect=AdbServerError('adb server not reachable'),
+    )
+    run = mocker.patch(
+        'device_manager.connection.connection_manager.subprocess.run',
+    )
+    run.return_value.stdout = (
+        f'List of devices attached\n{COMM_URI}\toffline\n'
+    )
+
+    assert not ConnectionManager.check_devices_adb_connection(COMM_URI)
+    run.assert_called_once()
+
+
+def test_kill_adb_server_discards_devices_snapshot(mocker):
+    devices = mocker.patch.object(
+        ConnectionManager._adb_host,
+        'devices',
+        return_value={COMM_URI: 'device'},
+    )
+    mocker.patch.object(
+        ConnectionManager._adb_host,
+        'kill',
+        side_effect=AdbServerUnreachableError('adb server not reachable'),
+    )
+    ConnectionManager.adb_devices()
+
+    with pytest.raises(AdbServerUnreachableError):
+        ConnectionManager.kill_adb_server()
+    ConnectionManager.adb_devices()
+
+    assert devices.call_count == 2  # noqa: PLR2004
+
+
+@pytest.fixture
+def singleton(mocker):
+    module = 'device_manager.connection.connection_manager'
+    mocker.patch(f'{module}.AdbConnectionDiscovery')
+    mocker.patch.object(ConnectionManager, '_adb_host')
+    load = mocker.patch(f'{module}.load_known_devices', return_value={})
+    ConnectionManagerSingleton._instance = None
+    yield load
+    ConnectionManagerSingleton._instance = None
+
+
+def test_singleton_is_initialized_once(singleton):
+    first = ConnectionManagerSingleton()
+    second = ConnectionManagerSingleton()
+
+    assert first is second
+    singleton.assert_called_once()
+
+
+def test_available_devices_reads_discovery_snapshot(singleton, mocker):
+    service = mocker.MagicMock()
+    manager = ConnectionManagerSingleton()
+    discovery = manager._ConnectionManager__discovery
+    discovery.online_snapshot.return_value = {'serial': service}
+
+    assert manager.available_devices() == {'serial': service}
+    discovery.online_devices.assert_not_called()
+
+
+def test_known_devices_are_not_available(singleton, mocker):
+    known = ServiceInfo('known', '192.168.0.20', 5555)
+    singleton.return_value = {'known': known}
+    manager = ConnectionManagerSingleton()
+    discovery = manager._ConnectionManager__discovery
+    discovery.online_snapshot.return_value = {}
+
+    assert manager.available_devices() == {}
+    assert manager.known_devices() == {'known': known}
@@ -0,0 +1,289 @@
+from threading import Barrier
+
+from device_manager.connection.device_connection import (
+    CONNECTION_RETRY_DELAY,
+    DEVICE_SEARCH_TIMEOUT,
+    MAX_RECONNECT_ATTEMPTS,
+    RECONNECT_BACKOFF,
+    DeviceConnection,
+)
+from device_manager.connection.utils.connection_status import (
+    ConnectionInfoStatus,
+)
+from device_manager.connection.utils.service_info import ServiceInfo
+from device_manager.exceptions import (
+    AdbServerError,
+    AdbServerUnreachableError,
+)
+
+
+def test_connect_all_devices_connects_concurrently(mocker):
+    mocker.patch(
+        'device_manager.connection.device_connection.'
+        'ConnectionManagerSingleton',
+    )
+    connection = DeviceConnection()
+    for idx in range(3):
+        connection.connection_info.add(
+            f'serial{idx}',
+            ServiceInfo(f'serial{idx}', f'192.168.0.{idx}', 5555),
+        )
+    barrier = Barrier(3, timeout=5)
+
+    def connect(*args, **kwargs):
+        barrier.wait()
+
+    adb_connect = mocker.patch(
+        'device_manager.connection.device_connection.AdbClient.connect',
+        side_effect=connect,
+    )
+    connection.connect_all_devices()
+
+    connection.connection.invalidate_adb_devices_cache.assert_called_once()
+    assert sorted(call.args[0] for call in adb_connect.call_args_list) == [
+        '192.168.0.0:5555',
+        '192.168.0.1:5555',
+        '192.168.0.2:5555',
+    ]
+
+
+def test_check_connections_requires_every_device(mocker):
+    mocker.patch(
+        'device_manager.connection.device_connection.'
+        'ConnectionManagerSingleton',
+    )
+    adb_devices = mocker.patch(
+        'device_manager.connection.device_connection.'
+        'ConnectionManager.adb_devices',
+        return_value={'192.168.0.0:5555': 'device'},
+    )
+    connection = DeviceConnection()
+    assert not connection.check_connections()
+
+    connection.connection_info.add(
+        'serial0',
+        ServiceInfo('serial0', '192.168.0.0', 5555),
+    )
+    assert connection.check_connections()
+
+    adb_devices.return_value = {'192.168.0.0:5555': 'offline'}
+    assert not connection.check_connections()
+
+
+def test_validate_connection_skips_adb_probe_on_changed_service(mocker):
+    mocker.patch(
+        'device_manager.connection.device_connection.'
+        'ConnectionManagerSingleton',
+    )
+    connection = DeviceConnection()
+    connection.connection_info.add(
+        'serial0',
+        ServiceInfo('serial0', '192.168.0.0', 5555),
+    )
+    manager = connection.connection
+    manager.check_wireless_adb_service_for.return_value = (
+        ConnectionInfoStatus.CHANGED
+    )
+
+    assert not connection.validate_connection('serial0')
+    manager.check_devices_adb_connection.assert_not_called()
+
+
+def test_validate_connection_bounds_reconnects(mocker):
+    mocker.patch(
+        'device_manager.connection.device_connection.'
+        'ConnectionManagerSingleton',
+    )
+    connection = DeviceConnection()
+    connection.connection_info.add(
+        'serial0',
+        ServiceInfo('serial0', '192.168.0.0', 5555),
+    )
+    connection.connection.check_wireless_adb_service_for.return_value = (
+        ConnectionInfoStatus.DOWN
+    )
+    establish = mocker.patch.object(connection, 'establish_first_connection')
+    mocker.patch.object(connection, 'disconnect')
+    mocker.patch.object(connection, 'connect_all_devices')
+
+    assert not connection.validate_connection('serial0', force_reconnect=True)
+    assert establish.call_count == MAX_RECONNECT_ATTEMPTS
+    assert [
+        call.args[1]
+        for call in connection.connection.wait_for_device.call_args_list
+    ] == [RECONNECT_BACKOFF * (1 << i) for i in range(MAX_RECONNECT_ATTEMPTS)]
+
+
+def test_establish_first_connection_backs_off_and_stops_on_success(mocker):
+    mocker.patch(
+        'device_manager.connection.device_connection.'
+        'ConnectionManagerSingleton',
+    )
+    sleep = mocker.patch('device_manager.connection.device_connection.sleep')
+    connection = DeviceConnection()
+    info = ServiceInfo('serial0', '192.168.0.0', connection.fixed_port)
+    device_connect = connection.connection.device_connect
+    device_connect.side_effect = [None, None, info]
+
+    assert connection.establish_first_connection('serial0')
+    assert device_connect.call_count == 3  # noqa: PLR2004
+    assert [call.args[0] for call in sleep.call_args_list] == [
+        CONNECTION_RETRY_DELAY,
+        CONNECTION_RETRY_DELAY * 2,
+    ]
+    assert connection.connection_info.get('serial0') is info
+
+
+def test_disconnect_falls_back_to_adb_process(mocker):
+    mocker.patch(
+        'device_manager.connection.device_connection.'
+        'ConnectionManagerSingleton',
+    )
+    mocker.patch(
+        'device_manager.connection.device_connection.AdbClient.disconnect',
+        side_effect=AdbServerUnreachableError('adb server not reachable'),
+    )
+    run = mocker.patch(
+        'device_manager.connection.device_connection.subprocess.run',
+    )
+    connection = DeviceConnection()
+    connection.connection_info.add(
+        'serial0',
+        ServiceInfo('serial0', '192.168.0.0', 5555),
+    )
+    connection.connection.adb_devices.return_value = {
+        '192.168.0.0:37000': 'device',
+        '192.168.0.9:5555': 'device',
+    }
+    connection.disconnect()
+
+    run.assert_called_once()
+    assert run.call_args.args[0] == ['adb', 'disconnect', '192.168.0.0:37000']
+
+
+def test_stop_connection_reports_devices_not_connected(mocker):
+    mocker.patch(
+        'device_manager.connection.device_connection.'
+        'ConnectionManagerSingleton',
+    )
+    mocker.patch(
+        'device_manager.connection.device_connection.AdbClient.disconnect',
+        side_effect=[
+            'disconnected 192.168.0.0:5555',
+            AdbServerError('no such device'),
+        ],
+    )
+    connection = DeviceConnection()
+    for idx in range(2):
+        connection.connection_info.add(
+            f'serial{idx}',
+            ServiceInfo(f'serial{idx}', f'192.168.0.{idx}', 5555),
+        )
+
+    assert not connection.stop_connection(['serial0', 'serial1'])
+    assert connection.connection_info.get('serial0') is None
+    assert connection.connection_info.get('serial1') is not None
+
+
+def test_start_connection_keeps_ready_sessions(mocker):
+    mocker.patch(
+        'device_manager.connection.device_connection.'
+        'ConnectionManagerSingleton',
+    )
+    adb_disconnect = mocker.patch(
+        'device_manager.connection.device_connection.AdbClient.disconnect',
+    )
+    mocker.patch(
+        'device_manager.connection.device_connection.AdbClient.connect',
+    )
+    connection = DeviceConnection()
+    mocker.patch.object(connection, 'establish_first_connection')
+    connection.connection_info.add(
+        'serial0',
+        ServiceInfo('serial0', '192.168.0.0', 5555),
+    )
+    connection.connection.adb_devices.return_value = {
+        '192.168.0.0:5555': 'device',
+        '192.168.0.0:37000': 'offline',
+        '192.168.0.9:37000': 'offline',
+    }
+    mocker.patch(
+        'device_manager.connection.device_connection.'
+        'ConnectionManager.adb_devices',
+        return_value=connection.connection.adb_devices.return_value,
+    )
+
+    assert connection.start_connection(['serial0'])
+
+    adb_disconnect.assert_called_once_with('192.168.0.0:37000')
+
+
+def test_select_devices_queries_only_on_refresh(mocker):
+    mocker.patch(
+        'device_manager.connection.device_connection.'
+        'ConnectionManagerSingleton',
+    )
+    connection = DeviceConnection()
+    mocker.patch.object(connection, 'console')
+    available_devices = connection.connection.available_devices
+    available_devices.side_effect = [
+        {'serial0': ServiceInfo('serial0', '192.168.0.0', 5555)},
+        {
+            'serial0': ServiceInfo('serial0', '192.168.0.0', 5555),
+            'serial1': ServiceInfo('serial1', '192.168.0.1', 5555),
+        },
+    ]
+    mocker.patch(
+        'device_manager.connection.device_connection.Prompt.ask',
+        side_effect=['1', 'Y', '0', '2', 'N'],
+    )
+
+    assert connection.select_devices_to_connect() == ['serial0', 'serial1']
+    assert available_devices.call_count == 2  # noqa: PLR2004
+
+
+def test_select_devices_waits_for_the_discovery(mocker):
+    mocker.patch(
+        'device_manager.connection.device_connection.'
+        'ConnectionManagerSingleton',
+    )
+    connection = DeviceConnection()
+    mocker.patch.object(connection, 'console')
+    manager = connection.connection
+    manager.available_devices.side_effect = [
+        {},
+        {'serial0': ServiceInfo('serial0', '192.168.0.0', 5555)},
+    ]
+    manager.wait_for_devices.return_value = True
+    mocker.patch(
+        'device_manager.connection.device_connection.Prompt.ask',
+        side_effect=['1', 'N'],
+    )
+
+    assert connection.select_devices_to_connect() == ['serial0']
+    manager.wait_for_devices.assert_called_once_with(DEVICE_SEARCH_TIMEOUT)
+
+
+def test_select_devices_lists_known_devices_apart(mocker):
+    mocker.patch(
+        'device_manager.connection.device_connection.'
+        'ConnectionManagerSingleton',
+    )
+    connection = DeviceConnection()
+    console = mocker.patch.object(connection, 'console')
+    manager = connection.connection
+    manager.available_devices.return_value = {
+        'serial0': ServiceInfo('serial0', '192.168.0.0', 5555),
+    }
+    manager.known_devices.return_value = {
+        'serial0': ServiceInfo('serial0', '192.168.0.0', 5555),
+        'serial9': ServiceInfo('serial9', '192.168.0.9', 5555),
+    }
+    mocker.patch(
+        'device_manager.connection.device_connection.Prompt.ask',
+        side_effect=['1', 'N'],
+    )
+
+    assert connection.select_devices_to_connect() == ['serial0']
+    console.print.assert_any_call('Known devices not online: serial9')
+    manager.wait_for_devices.assert_not_called()
@@ -0,0 +1,21 @@
+from device_manager.connection.utils.known_devices import (
+    load_known_devices,
+    save_known_devices,
+)
+from device_manager.connection.utils.service_info import ServiceInfo
+
+
+def test_known_devices_round_trip(tmp_path):
+    path = tmp_path / 'cache' / 'known_devices.json'
+    devices = {'ABC123': ServiceInfo('ABC123', '192.168.0.10', 5555)}
+    save_known_devices(devices, path)
+
+    assert load_known_devices(path) == devices
+
+
+def test_load_known_devices_invalid_file(tmp_path):
+    path = tmp_path / 'known_devices.json'
+    path.write_text('not json')
+
+    assert load_known_devices(path) == {}
+    assert load_known_devices(tmp_path / 'missing.json') == {}
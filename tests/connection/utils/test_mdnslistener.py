@@ -75,6 +75,26 @@ def test_extract_info_with_re_filter(
     assert result == expected
 
 
+def test_extract_info_matches_literal_dots(
+    mock_zeroconf,
+    mock_mdns_context,
+    mocker,
+):
+    listener = MDnsListener(
+        mock_mdns_context,
+        re_filter=DEFAULT_REGEX_FILTER,
+    )
+    mocker.patch(
+        'device_manager.connection.utils.mdns_listener.socket.inet_ntoa',
+        return_value='127.0.0.1',
+    )
+    mock_zeroconf.service_info.name = (
+        'adb-emulator-5555X_adb-tls-connectX_tcpXlocalX'
+    )
+
+    assert listener._extract_info(mock_zeroconf.service_info) is None
+
+
 def test_extract_info_with_no_match(
     mock_zeroconf,
     mock_mdns_context,
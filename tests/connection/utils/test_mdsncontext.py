@@ -1,3 +1,5 @@
+from threading import Timer
+
 import pytest
 
 from device_manager.connection.utils.mdns_context import MDnsContext
@@ -161,3 +163,96 @@ def test_offline_service_list_property(
     offline_list = mdns_context_with_services.offline_service_list
     assert len(offline_list) == 1
     assert isinstance(offline_list[0], ServiceInfo)
+
+
+def test_mdns_context_predicates(
+    mdns_context_with_services, sample_service_info
+):
+    serial_number = sample_service_info.serial_number
+    assert mdns_context_with_services.is_online(serial_number)
+    assert not mdns_context_with_services.is_offline(serial_number)
+    assert (
+        mdns_context_with_services.lookup_online(serial_number)
+        == sample_service_info
+    )
+
+    mdns_context_with_services.to_offline_service(
+        serial_number,
+        sample_service_info,
+    )
+    assert not mdns_context_with_services.is_online(serial_number)
+    assert mdns_context_with_services.is_offline(serial_number)
+    assert mdns_context_with_services.lookup_online(serial_number) is None
+
+
+def test_any_online(empty_mdns_context, sample_service_info):
+    assert not empty_mdns_context.any_online()
+
+    empty_mdns_context.add_service(
+        sample_service_info.serial_number,
+        sample_service_info,
+    )
+    assert empty_mdns_context.any_online()
+
+
+def test_iter_online_is_a_snapshot(
+    mdns_context_with_services, sample_service_info
+):
+    services = mdns_context_with_services.iter_online()
+    mdns_context_with_services.to_offline_service(
+        sample_service_info.serial_number,
+        sample_service_info,
+    )
+    expected_length = 3
+    assert len(list(services)) == expected_length
+
+
+def test_wait_online_wakes_up_on_new_service(
+    empty_mdns_context, sample_service_info
+):
+    assert not empty_mdns_context.wait_online(timeout=0)
+
+    Timer(
+        0.01,
+        empty_mdns_context.add_service,
+        (sample_service_info.serial_number, sample_service_info),
+    ).start()
+    assert empty_mdns_context.wait_online(timeout=5)
+
+    empty_mdns_context.to_offline_service(
+        sample_service_info.serial_number,
+        sample_service_info,
+    )
+    assert not empty_mdns_context.wait_online(timeout=0)
+
+
+def test_online_snapshot_is_rebuilt_on_change(
+    mdns_context_with_services, sample_service_info
+):
+    snapshot = mdns_context_with_services.online_snapshot()
+    assert mdns_context_with_services.online_snapshot() is snapshot
+
+    mdns_context_with_services.to_offline_service(
+        sample_service_info.serial_number,
+        sample_service_info,
+    )
+    updated = mdns_context_with_services.online_snapshot()
+    assert updated is not snapshot
+    assert sample_service_info.serial_number not in updated
+
+
+def test_wait_lookup_online_wakes_up_on_the_service(
+    empty_mdns_context, sample_service_info
+):
+    serial = sample_service_info.serial_number
+    assert empty_mdns_context.wait_lookup_online(serial, timeout=0) is None
+
+    Timer(
+        0.01,
+        empty_mdns_context.add_service,
+        (serial, sample_service_info),
+    ).start()
+    assert (
+        empty_mdns_context.wait_lookup_online(serial, timeout=5)
+        is sample_service_info
+    )
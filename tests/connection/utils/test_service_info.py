@@ -0,0 +1,24 @@
+from dataclasses import asdict
+
+from device_manager.connection.utils.service_info import ServiceInfo
+
+
+def test_comm_uri_follows_port_changes():
+    info = ServiceInfo('ABC123', '192.168.0.10', 5555)
+
+    assert info.comm_uri == '192.168.0.10:5555'
+
+    info.port = 37000
+    assert info.comm_uri == '192.168.0.10:37000'
+
+
+def test_comm_uri_is_not_a_field():
+    info = ServiceInfo('ABC123', '192.168.0.10', 5555)
+    assert info.comm_uri
+
+    assert asdict(info) == {
+        'serial_number': 'ABC123',
+        'ip': '192.168.0.10',
+        'port': 5555,
+    }
+    assert info == ServiceInfo('ABC123', '192.168.0.10', 5555)
@@ -0,0 +1,197 @@
+import pytest
+
+from device_manager.adb_client import AdbClient
+from device_manager.exceptions import (
+    AdbServerError,
+    AdbServerUnreachableError,
+)
+
+
+class FakeSocket:
+    def __init__(self, response: bytes):
+        self.response = bytearray(response)
+        self.sent = bytearray()
+        self.timeout = 10.0
+
+    def sendall(self, data: bytes):
+        self.sent.extend(data)
+
+    def recv(self, size: int) -> bytes:
+        chunk = bytes(self.response[:size])
+        del self.response[:size]
+        return chunk
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+@pytest.fixture
+def fake_server(mocker):
+    def _factory(response: bytes) -> FakeSocket:
+        sock = FakeSocket(response)
+        mocker.patch(
+            'device_manager.adb_client.socket.create_connection',
+            return_value=sock,
+        )
+        return sock
+
+    return _factory
+
+
+def test_encode_request():
+    assert AdbClient.encode_request('host:version') == b'000chost:version'
+
+
+def test_version(fake_server):
+    sock = fake_server(b'OKAY00040029')
+
+    assert AdbClient().version() == 0x29  # noqa: PLR2004
+    assert sock.sent == b'000chost:version'
+
+
+def test_ping_without_server(mocker):
+    mocker.patch(
+        'device_manager.adb_client.socket.create_connection',
+        side_effect=ConnectionRefusedError,
+    )
+
+    assert AdbClient().ping() is False
+
+
+def test_shell_returns_output(fake_server):
+    sock = fake_server(b'OKAYOKAYhello\n')
+    result = AdbClient().shell('127.0.0.1:5555', 'echo hello')
+
+    assert result == b'hello\n'
+    assert sock.sent == (
+        AdbClient.encode_request('host:transport:127.0.0.1:5555')
+        + AdbClient.encode_request('shell:echo hello')
+    )
+
+
+def test_shell_waits_for_slow_command(fake_server):
+    sock = fake_server(b'OKAYOKAY')
+    recv = sock.recv
+
+    def slow_recv(size: int) -> bytes:
+        if len(sock.response) == 0 and sock.timeout is not None:
+            raise TimeoutError('timed out')
+        return recv(size)
+
+    sock.recv = slow_recv
+
+    assert AdbClient().shell('127.0.0.1:5555', 'sleep 30') == b''
+    assert sock.timeout is None
+
+
+def test_connect_raises_when_server_stalls(fake_server):
+    sock = fake_server(b'')
+
+    def stalled_recv(size: int) -> bytes:
+        raise TimeoutError('timed out')
+
+    sock.recv = stalled_recv
+
+    with pytest.raises(AdbServerError, match='timed out'):
+        AdbClient(timeout=0.3).connect('192.168.0.10:5555')
+
+
+def test_shell_raises_when_connection_resets(fake_server):
+    sock = fake_server(b'OKAYOKAYpartial')
+    recv = sock.recv
+
+    def reset_recv(size: int) -> bytes:
+        if len(sock.response) == 0:
+            raise ConnectionResetError('connection reset')
+        return recv(size)
+
+    sock.recv = reset_recv
+
+    with pytest.raises(AdbServerError, match='connection reset'):
+        AdbClient().shell('127.0.0.1:5555', 'ls')
+
+
+def test_shell_raises_on_fail(fake_server):
+    fake_server(b'FAIL000edevice offline')
+    with pytest.raises(AdbServerError, match='device offline'):
+        AdbClient().shell('127.0.0.1:5555', 'ls')
+
+
+def test_exec_out_streams_output(fake_server, mocker):
+    sock = fake_server(b'OKAYOKAY')
+    sock.makefile = mocker.MagicMock()
+    client = AdbClient()
+    with client.exec_out('127.0.0.1:5555', 'cat file') as stream:
+        assert stream is sock.makefile.return_value.__enter__.return_value
+
+    sock.makefile.assert_called_once_with('rb')
+    assert sock.sent.endswith(AdbClient.encode_request('exec:cat file'))
+
+
+def test_pair_returns_message(fake_server):
+    message = b'Successfully paired to 192.168.0.10:37000'
+    sock = fake_server(b'OKAY' + b'%04x' % len(message) + message)
+
+    assert AdbClient().pair('192.168.0.10:37000', '123456') == message.decode()
+    assert sock.sent == AdbClient.encode_request(
+        'host:pair:123456:192.168.0.10:37000',
+    )
+
+
+def test_devices_parses_states(fake_server):
+    payload = b'192.168.0.10:5555\tdevice\nemulator-5554\toffline\n'
+    sock = fake_server(b'OKAY' + b'%04x' % len(payload) + payload)
+
+    assert AdbClient().devices() == {
+        '192.168.0.10:5555': 'device',
+        'emulator-5554': 'offline',
+    }
+    assert sock.sent == AdbClient.encode_request('host:devices')
+
+
+def test_connect_returns_message(fake_server):
+    message = b'connected to 192.168.0.10:5555'
+    sock = fake_server(b'OKAY' + b'%04x' % len(message) + message)
+
+    assert AdbClient().connect('192.168.0.10:5555') == message.decode()
+    assert sock.sent == AdbClient.encode_request(
+        'host:connect:192.168.0.10:5555',
+    )
+
+
+def test_disconnect_returns_message(fake_server):
+    message = b'disconnected 192.168.0.10:5555'
+    sock = fake_server(b'OKAY' + b'%04x' % len(message) + message)
+
+    assert AdbClient().disconnect('192.168.0.10:5555') == message.decode()
+    assert sock.sent == AdbClient.encode_request(
+        'host:disconnect:192.168.0.10:5555',
+    )
+
+
+def test_tcpip_returns_device_answer(fake_server):
+    sock = fake_server(b'OKAYOKAYrestarting in TCP mode port: 5555\n')
+
+    assert AdbClient().tcpip('192.168.0.10:37000', 5555) == (
+        'restarting in TCP mode port: 5555\n'
+    )
+    assert sock.sent.endswith(AdbClient.encode_request('tcpip:5555'))
+
+
+def test_kill_without_server(mocker):
+    mocker.patch(
+        'device_manager.adb_client.socket.create_connection',
+        side_effect=ConnectionRefusedError,
+    )
+
+    with pytest.raises(AdbServerUnreachableError):
+        AdbClient().kill()
@@ -1,32 +1,81 @@
-from device_manager.adb_executor import build_command_list
+from subprocess import CompletedProcess
 
+from device_manager.adb_executor import (
+    execute_adb_command,
+    execute_adb_command_batch,
+)
 
-def test_manager_build_command_list():
-    adb_cmd = r'shell am start -n dummyCmd\.dummyActv'
-    result = build_command_list(
-        base_command=['adb'],
-        comm_uri_list=['127.0.0.1:5555', '127.0.0.2:5555'],
-        custom_command=adb_cmd,
+
+def test_execute_adb_command_batch(mocker):
+    run = mocker.patch('device_manager.adb_executor.subprocess.run')
+    execute_adb_command_batch(
+        commands=['input keyevent 66', 'sleep 0.3'],
+        comm_uris=['127.0.0.1:5555'],
     )
 
-    expected = [
+    assert run.call_args.args[0] == [
         'adb',
         '-s',
         '127.0.0.1:5555',
         'shell',
-        'am',
-        'start',
-        '-n',
-        r'dummyCmd\.dummyActv',
-        '&&',
+        'input keyevent 66; sleep 0.3',
+    ]
+
+
+def test_execute_adb_command_string_without_host_shell(mocker):
+    run = mocker.patch('device_manager.adb_executor.subprocess.run')
+    execute_adb_command(
+        command='shell am start -n dummyCmd/.dummyActv',
+        comm_uris=['127.0.0.1:5555'],
+    )
+
+    assert run.call_args.args[0] == [
         'adb',
         '-s',
-        '127.0.0.2:5555',
+        '127.0.0.1:5555',
         'shell',
         'am',
         'start',
         '-n',
-        r'dummyCmd\.dummyActv',
+        'dummyCmd/.dummyActv',
+    ]
+    assert 'shell' not in run.call_args.kwargs
+
+
+def test_execute_adb_command_list_without_host_shell(mocker):
+    run = mocker.patch('device_manager.adb_executor.subprocess.run')
+    execute_adb_command(
+        command=['pull', '/sdcard/my file.png', 'local dir'],
+        comm_uris=['127.0.0.1:5555'],
+    )
+
+    assert run.call_args.args[0] == [
+        'adb',
+        '-s',
+        '127.0.0.1:5555',
+        'pull',
+        '/sdcard/my file.png',
+        'local dir',
     ]
+    assert 'shell' not in run.call_args.kwargs
+
+
+def test_execute_adb_command_runs_one_process_per_device(mocker):
+    run = mocker.patch(
+        'device_manager.adb_executor.subprocess.run',
+        side_effect=lambda args, **kwargs: CompletedProcess(
+            args,
+            0,
+            f'{args[2]}\n',
+            '',
+        ),
+    )
+    result = execute_adb_command(
+        command=['get-state'],
+        comm_uris=['127.0.0.1:5555', '127.0.0.2:5555'],
+        capture_output=True,
+    )
 
-    assert result == expected
+    assert run.call_count == 2  # noqa: PLR2004
+    assert result.returncode == 0
+    assert result.stdout == '127.0.0.1:5555\n127.0.0.2:5555\n'
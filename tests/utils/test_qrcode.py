@@ -0,0 +1,47 @@
+import re
+import sys
+from unittest.mock import patch
+
+import cv2 as cv
+
+from device_manager.utils.qrcode import QRCode
+
+PAIRING_STRING = 'WIFI:T:ADB;S:robot-celular;P:Ab3dE6gH;;'
+
+
+def test_cv_image_is_rendered_from_the_matrix():
+    qrcode = QRCode(qrcode_data=PAIRING_STRING)
+    image = qrcode._QRCode__get_img_cv(size=300)
+
+    assert image.shape == (300, 300, 3)
+    assert cv.QRCodeDetector().detectAndDecode(image)[0] == PAIRING_STRING
+
+
+def test_cli_show_draws_once(mocker):
+    stdout = mocker.patch('device_manager.utils.qrcode.sys.stdout')
+    stdout.isatty.return_value = True
+    qrcode = QRCode(qrcode_data=PAIRING_STRING)
+    ascii_ = mocker.spy(qrcode.qrcode_object, 'ascii')
+    qrcode.qrcode_cli_show()
+    qrcode.qrcode_cli_show()
+
+    ascii_.assert_called_once_with(tty=True)
+    assert stdout.write.call_count == 2  # noqa: PLR2004
+
+
+def test_cv_image_does_not_import_pil():
+    qrcode = QRCode(qrcode_data=PAIRING_STRING, fill_color='#000')
+    with patch.dict(sys.modules, {'PIL': None, 'PIL.ImageColor': None}):
+        image = qrcode._QRCode__get_img_cv(size=300)
+
+    assert cv.QRCodeDetector().detectAndDecode(image)[0] == PAIRING_STRING
+
+
+def test_render_svg_draws_every_dark_module():
+    qrcode = QRCode(qrcode_data=PAIRING_STRING)
+    svg = qrcode.render_svg()
+    path = re.search(r'<path d="([^"]*)"', svg).group(1)
+    dark = sum(int(width) for width in re.findall(r'M\d+,\d+h(\d+)', path))
+
+    assert svg.startswith('<svg')
+    assert dark == sum(map(sum, qrcode.qrcode_object.get_matrix()))
@@ -0,0 +1,84 @@
+import io
+
+import pytest
+import qrcode
+from qrcode.util import MODE_8BIT_BYTE, QRData
+
+from device_manager.utils import qrcode_fast
+
+PAIRING_STRING = 'WIFI:T:ADB;S:robot-celular;P:Ab3dE6gH;;'
+
+
+def reference_modules(data, error_correction, mask_pattern=None):
+    reference = qrcode.QRCode(
+        error_correction=error_correction,
+        mask_pattern=mask_pattern,
+        border=0,
+    )
+    reference.add_data(QRData(data.encode(), mode=MODE_8BIT_BYTE))
+    reference.make()
+    return [[bool(module) for module in row] for row in reference.modules]
+
+
+def fast_modules(data, error_correction, mask_pattern=None):
+    code = qrcode_fast.QRCode(
+        error_correction=error_correction,
+        mask_pattern=mask_pattern,
+        border=0,
+    )
+    code.add_data(data)
+    code.make()
+    return [[bool(module) for module in row] for row in code.modules]
+
+
+@pytest.mark.parametrize('mask_pattern', range(8))
+def test_matches_qrcode_library_for_each_mask(mask_pattern):
+    error_correction = qrcode_fast.ERROR_CORRECT_L
+    assert fast_modules(
+        PAIRING_STRING,
+        error_correction,
+        mask_pattern,
+    ) == reference_modules(PAIRING_STRING, error_correction, mask_pattern)
+
+
+@pytest.mark.parametrize(
+    ('error_correction', 'length'),
+    [
+        (qrcode_fast.ERROR_CORRECT_L, 200),
+        (qrcode_fast.ERROR_CORRECT_M, 120),
+        (qrcode_fast.ERROR_CORRECT_Q, 400),
+        (qrcode_fast.ERROR_CORRECT_H, 60),
+    ],
+)
+def test_matches_qrcode_library_across_versions(error_correction, length):
+    data = (PAIRING_STRING * 20)[:length]
+    assert fast_modules(data, error_correction) == reference_modules(
+        data,
+        error_correction,
+    )
+
+
+def test_fixed_version_overflow():
+    code = qrcode_fast.QRCode(version=1)
+    code.add_data(PAIRING_STRING)
+    with pytest.raises(qrcode_fast.DataOverflowError):
+        code.make(fit=False)
+
+
+def test_print_ascii_uses_two_rows_per_line():
+    code = qrcode_fast.QRCode(border=2)
+    code.add_data(PAIRING_STRING)
+    out = io.StringIO()
+    code.print_ascii(out=out)
+
+    lines = out.getvalue().splitlines()
+    assert len(lines) == (code.modules_count + 4 + 1) // 2
+    assert all(len(line) == code.modules_count + 4 for line in lines)
+
+
+def test_make_image_size():
+    code = qrcode_fast.QRCode(box_size=3, border=2)
+    code.add_data(PAIRING_STRING)
+    image = code.make_image()
+
+    assert image.size == ((code.modules_count + 4) * 3,) * 2
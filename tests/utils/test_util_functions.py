@@ -1,6 +1,10 @@
+import pytest
+
 from device_manager.utils.util_functions import (
     create_password,
     grep,
+    interface_addresses,
+    parse_adb_devices,
 )
 
 
@@ -68,3 +72,45 @@ def test_grep_with_partial_match():
 
     result = grep(text, pattern)
     assert result == ['  mScreenOn=true']
+
+
+def test_parse_adb_devices():
+    output = (
+        '* daemon started successfully\n'
+        'List of devices attached\n'
+        '127.0.0.1:5555\tdevice\n'
+        '127.0.0.2:5555\toffline\n'
+        'emulator-5554\tunauthorized\n'
+        '\n'
+    )
+
+    result = parse_adb_devices(output)
+    assert result == {
+        '127.0.0.1:5555': 'device',
+        '127.0.0.2:5555': 'offline',
+        'emulator-5554': 'unauthorized',
+    }
+
+
+def test_create_password_discards_biased_bytes(mocker):
+    mocker.patch(
+        'device_manager.utils.util_functions.secrets.token_bytes',
+        side_effect=[bytes([255, 0, 61, 62]), bytes([1, 2, 3, 4])],
+    )
+    assert create_password(2) == 'a9'
+
+
+def test_interface_addresses(mocker):
+    adapter = mocker.MagicMock(
+        nice_name='wlan0',
+        ips=[
+            mocker.MagicMock(ip='192.168.0.5'),
+            mocker.MagicMock(ip=('fe80::1', 0, 3)),
+        ],
+    )
+    adapter.name = 'wlan0'
+    mocker.patch('ifaddr.get_adapters', return_value=[adapter])
+
+    assert interface_addresses('wlan0') == ['192.168.0.5']
+    with pytest.raises(ValueError, match='eth1'):
+        interface_addresses('eth1')